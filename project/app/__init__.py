@@ -6,8 +6,12 @@ Flask application factory for NarrativeIQ.
 Responsibilities:
     - Initialize Flask app with configuration settings
     - Load environment variables from .env file
-    - Initialize database (SQLAlchemy)
-    - Register blueprints (routes)
+    - Initialize database (SQLAlchemy) with concurrency-safe engine
+      settings (see database_service.py)
+    - Apply sentiment label thresholds and configure the sentiment,
+      provider response and dashboard caches (and optionally preload VADER)
+    - Register blueprints (routes) and CLI commands
+    - Enable pipeline metrics when METRICS_ENABLED is set
     - Return a fully configured Flask application instance
 
 Notes:
@@ -21,27 +25,54 @@ Typical Usage:
     app = create_app()
 """
 
+import os
+
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from dotenv import load_dotenv
 
-# Initialize SQLAlchemy (database connection handler)
-db = SQLAlchemy()
+from app.services.database_service import DatabaseService, RoutingSession
+
+# Initialize SQLAlchemy (database connection handler); the routing session
+# lets read-only routes use an optional read engine
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def _instance_file(app, key, default_name):
+    """
+    Resolve a file path setting.
+
+    Unset (None) defaults to a file in the instance folder; an empty
+    string disables the feature and yields None.
+    """
+
+    path = app.config[key]
+    if path is None:
+        os.makedirs(app.instance_path, exist_ok=True)
+        path = os.path.join(app.instance_path, default_name)
+
+    return path or None
 
 
-def create_app():
+def create_app(overrides=None):
     """
     Application Factory
 
     Returns a fully configured Flask app instance.
 
+    Args:
+        overrides (dict, optional): Config values applied on top of
+            app.config.Config (e.g. a scratch database for benchmarks).
+
     Workflow:
         1. Load environment variables from .env
         2. Instantiate Flask app
-        3. Load configuration settings
+        3. Load configuration settings and apply overrides
         4. Initialize SQLAlchemy with the app
-        5. Register application blueprints (routes)
-        6. Return the app instance
+        5. Configure caches and optional VADER preload
+        6. Register application blueprints (routes) and CLI commands
+        7. Enable metrics collection (optional)
+        8. Return the app instance
 
     Returns:
         Flask: Configured Flask application
@@ -53,12 +84,55 @@ def create_app():
     # Instantiate Flask app
     app = Flask(__name__)
     app.config.from_object("app.config.Config")
+    if overrides:
+        app.config.update(overrides)
 
-    # Initialize database with app
+    # Initialize database with app: engine and pool options, optional read
+    # engine, and per-connection SQLite settings (WAL, busy timeout)
+    DatabaseService.configure(app)
     db.init_app(app)
+    with app.app_context():
+        DatabaseService.init_engines(app, db.engines)
+
+    # Attach the persistent caches (instance folder by default)
+    from app.services.news_service import NewsService
+    from app.services.sentiment_service import SentimentService
+    SentimentService.configure_engine(app.config['SENTIMENT_ENGINE'])
+    SentimentService.configure_thresholds(
+        app.config['SENTIMENT_POSITIVE_THRESHOLD'],
+        app.config['SENTIMENT_NEGATIVE_THRESHOLD']
+    )
+    SentimentService.configure_cache(
+        maxsize=app.config['SENTIMENT_CACHE_SIZE'],
+        path=_instance_file(app, 'SENTIMENT_CACHE_PATH', "sentiment_cache.db"),
+        max_rows=app.config['SENTIMENT_CACHE_MAX_ROWS'],
+        max_age=app.config['SENTIMENT_CACHE_MAX_AGE_DAYS'] * 86400
+    )
+    NewsService.configure_cache(
+        path=_instance_file(app, 'RESPONSE_CACHE_PATH', "response_cache.db"),
+        ttl=app.config['RESPONSE_CACHE_TTL'],
+        stale_ttl=app.config['RESPONSE_CACHE_STALE_TTL'],
+        max_bytes=app.config['RESPONSE_CACHE_MAX_BYTES']
+    )
+
+    # Per-process dashboard cache, invalidated through the data version
+    from app.services.dashboard_service import DashboardService
+    DashboardService.configure(app)
+
+    # Optionally load the lexicon now so forked workers share it
+    if app.config['SENTIMENT_PRELOAD']:
+        SentimentService.warm_up()
 
     # Register main application routes
     from app.routes.main_routes import main
     app.register_blueprint(main)
 
+    # Register maintenance CLI commands
+    from app.cli import register_commands
+    register_commands(app)
+
+    # Pipeline timings and counters for /metrics (no-ops when disabled)
+    from app.services.metrics_service import MetricsService
+    MetricsService.init_app(app)
+
     return app
\ No newline at end of file
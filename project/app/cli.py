@@ -0,0 +1,293 @@
+"""
+cli.py
+
+Flask CLI commands for NarrativeIQ maintenance tasks.
+
+Commands are registered on the application in create_app and run with
+an application context, e.g.:
+
+    flask rebuild-source-metrics --dry-run
+    flask rebuild-rollups
+    flask export-articles --format parquet --output articles.parquet
+    flask import-articles archive.ndjson.gz --topic ai
+    flask backfill-sentiment --mode relabel
+    flask upgrade-db
+    flask archive-articles --older-than 365
+    flask rebuild-search-index
+"""
+
+import time
+from datetime import timedelta
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+@click.command("rebuild-source-metrics")
+@click.option("--dry-run", is_flag=True, help="Only report drift; do not rewrite the table.")
+@with_appcontext
+def rebuild_source_metrics_command(dry_run):
+    """Rebuild the source_metrics table from stored articles and report drift."""
+
+    from app.services.aggregate_service import AggregateService
+
+    drift = AggregateService.rebuild_source_metrics(dry_run=dry_run)
+
+    for entry in drift:
+        click.echo(
+            f"drift topic={entry['topic']!r} source={entry['source']!r} "
+            f"stored={entry['stored']} expected={entry['expected']}"
+        )
+
+    action = "found" if dry_run else "repaired"
+    click.echo(f"{len(drift)} drifted (topic, source) rows {action}.")
+
+
+@click.command("rebuild-rollups")
+@click.option("--chunk-size", default=100_000, show_default=True, help="Article rows read per chunk.")
+@with_appcontext
+def rebuild_rollups_command(chunk_size):
+    """Recompute hourly and daily sentiment rollups from stored articles."""
+
+    from app.services.aggregate_service import AggregateService
+
+    written = AggregateService.rebuild_rollups(chunk_size=chunk_size)
+
+    click.echo(f"{written} rollup rows written.")
+
+
+@click.command("export-articles")
+@click.option("--format", "fmt", type=click.Choice(["csv", "parquet", "arrow"]), default="csv",
+              show_default=True, help="csv is gzip-compressed; parquet and arrow need pyarrow.")
+@click.option("--output", required=True, type=click.Path(dir_okay=False), help="File to write.")
+@click.option("--topic", help="Only export this topic.")
+@click.option("--start", type=click.DateTime(["%Y-%m-%d"]), help="Published on or after (YYYY-MM-DD).")
+@click.option("--end", type=click.DateTime(["%Y-%m-%d"]), help="Published on or before (YYYY-MM-DD).")
+@click.option("--chunk-size", type=int, help="Rows per chunk (default EXPORT_CHUNK_SIZE).")
+@with_appcontext
+def export_articles_command(fmt, output, topic, start, end, chunk_size):
+    """Export stored articles to a CSV, Parquet or Arrow file."""
+
+    from app.services.export_service import ExportService, ExportUnavailable
+
+    started = time.perf_counter()
+    try:
+        with open(output, "wb") as handle:
+            written = ExportService.export(
+                fmt, handle, topic=topic, start=start,
+                end=end + timedelta(days=1) if end else None,
+                chunk_size=chunk_size or current_app.config['EXPORT_CHUNK_SIZE']
+            )
+    except ExportUnavailable as exc:
+        raise click.ClickException(str(exc))
+    elapsed = time.perf_counter() - started
+
+    click.echo(
+        f"{written['rows']} articles, {written['bytes']} bytes written to {output} "
+        f"in {elapsed:.1f}s ({written['rows'] / elapsed if elapsed else 0:.0f} rows/s)."
+    )
+
+
+@click.command("import-articles")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--topic", help="Topic for records without a \"topic\" field.")
+@click.option("--provider", help="Provider label recorded in metrics (e.g. newsapi).")
+@click.option("--chunk-size", type=int, help="Records per transaction (default IMPORT_CHUNK_SIZE).")
+@click.option("--workers", type=int, help="Sentiment scoring processes (default SENTIMENT_WORKERS).")
+@click.option("--checkpoint", type=click.Path(dir_okay=False), help="Checkpoint file (default PATH.checkpoint).")
+@click.option("--restart", is_flag=True, help="Ignore an existing checkpoint and start from the top.")
+@with_appcontext
+def import_articles_command(path, topic, provider, chunk_size, workers, checkpoint, restart):
+    """Import an NDJSON (or .ndjson.gz) dump of NewsAPI/GNews articles."""
+
+    from app.services.import_service import ImportService
+
+    def progress(totals, rows_per_s):
+        click.echo(
+            f"{totals['lines']} lines, {totals['stored']} stored, "
+            f"{totals['skipped']} skipped ({rows_per_s:.0f} rows/s)"
+        )
+
+    try:
+        totals = ImportService.import_file(
+            path, topic=topic, provider=provider, chunk_size=chunk_size, workers=workers,
+            checkpoint=checkpoint, restart=restart, on_progress=progress
+        )
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+
+    if totals['resumed_from']:
+        click.echo(f"Resumed at byte {totals['resumed_from']}.")
+    click.echo(
+        f"{totals['stored']} of {totals['articles']} articles stored "
+        f"({totals['skipped']} skipped, rest duplicates), {totals['rows_per_s']:.0f} rows/s."
+    )
+
+
+@click.command("backfill-sentiment")
+@click.option("--mode", type=click.Choice(["relabel", "rescore"]), required=True,
+              help="relabel: apply new thresholds in SQL; rescore: rerun the scorer.")
+@click.option("--chunk-size", type=int, help="Articles per transaction (default BACKFILL_CHUNK_SIZE).")
+@click.option("--workers", type=int, help="Scoring processes for rescore (default SENTIMENT_WORKERS).")
+@with_appcontext
+def backfill_sentiment_command(mode, chunk_size, workers):
+    """Bring stored sentiment labels or scores up to the current configuration."""
+
+    from app.services.backfill_service import BackfillService
+
+    pending = BackfillService.pending(mode)
+    click.echo(f"{pending} articles to {mode}.")
+    if not pending:
+        return
+
+    started = time.perf_counter()
+
+    def progress(totals):
+        elapsed = time.perf_counter() - started
+        click.echo(
+            f"{totals['updated']}/{pending} updated "
+            f"({totals['updated'] / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+
+    if mode == "relabel":
+        totals = BackfillService.relabel(chunk_size=chunk_size, on_progress=progress)
+    else:
+        totals = BackfillService.rescore(chunk_size=chunk_size, workers=workers, on_progress=progress)
+    elapsed = time.perf_counter() - started
+
+    changed = f", {totals['changed']} changed" if 'changed' in totals else ""
+    click.echo(
+        f"{totals['updated']} articles updated{changed} in {totals['chunks']} "
+        f"transactions, {elapsed:.1f}s."
+    )
+
+
+@click.command("upgrade-db")
+@click.option("--chunk-size", type=int, help="Articles per backfill transaction (default BACKFILL_CHUNK_SIZE).")
+@with_appcontext
+def upgrade_db_command(chunk_size):
+    """Create, add and backfill whatever the current schema adds to an existing database."""
+
+    from app.services.schema_service import SchemaService
+
+    started = time.perf_counter()
+
+    def progress(step, totals):
+        elapsed = time.perf_counter() - started
+        checked = totals['updated'] + totals.get('duplicates', 0)
+        click.echo(f"{step}: {checked} articles checked ({checked / elapsed if elapsed else 0:.0f} rows/s)")
+
+    report = SchemaService.upgrade(chunk_size=chunk_size, on_progress=progress)
+
+    for key, label in (
+        ('tables_created', "Tables created"),
+        ('columns_added', "Columns added"),
+        ('indexes_created', "Article indexes created"),
+        ('rebuilt', "Rebuilt")
+    ):
+        if report[key]:
+            click.echo(f"{label}: {', '.join(report[key])}.")
+
+    if report['legacy_versions']:
+        click.echo(
+            f"{report['legacy_versions']} articles have no recorded scorer; "
+            f"run `flask backfill-sentiment --mode rescore` to rescore them."
+        )
+
+    hashes, stories = report['title_hashes'], report['stories']
+    click.echo(
+        f"{hashes['updated']} titles hashed, {hashes['duplicates']} repeated headlines "
+        f"left unhashed, {stories['updated']} articles indexed for near-duplicates "
+        f"({stories['grouped']} joined an earlier story), {time.perf_counter() - started:.1f}s."
+    )
+    if report['archived_articles']['updated']:
+        click.echo(f"{report['archived_articles']['updated']} archived articles filled from the archive files.")
+
+
+@click.command("archive-articles")
+@click.option("--older-than", "days", type=int,
+              help="Archive months published more than DAYS ago (default RETENTION_DAYS).")
+@click.option("--format", "fmt", type=click.Choice(["ndjson", "parquet"]),
+              help="Archive file format (default ARCHIVE_FORMAT); parquet needs pyarrow.")
+@click.option("--chunk-size", type=int, help="Articles per transaction (default ARCHIVE_CHUNK_SIZE).")
+@click.option("--no-vacuum", is_flag=True, help="Skip VACUUM after archiving.")
+@with_appcontext
+def archive_articles_command(days, fmt, chunk_size, no_vacuum):
+    """Move old articles into compressed monthly archive files."""
+
+    from app.services.archive_service import ArchiveService
+    from app.services.export_service import ExportUnavailable
+
+    config = current_app.config
+    days = config['RETENTION_DAYS'] if days is None else days
+    if days <= 0:
+        raise click.ClickException("retention is disabled (RETENTION_DAYS=0); pass --older-than")
+
+    cutoff = ArchiveService.cutoff(days)
+    pending = ArchiveService.pending(cutoff)
+    click.echo(f"{pending} articles published before {cutoff:%Y-%m-%d} to archive.")
+
+    started = time.perf_counter()
+
+    def progress(totals):
+        elapsed = time.perf_counter() - started
+        click.echo(
+            f"{totals['archived']}/{pending} archived "
+            f"({totals['archived'] / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+
+    try:
+        totals = ArchiveService.archive(
+            cutoff,
+            fmt=fmt or config['ARCHIVE_FORMAT'],
+            chunk_size=chunk_size or config['ARCHIVE_CHUNK_SIZE'],
+            on_progress=progress
+        )
+    except (ValueError, ExportUnavailable) as exc:
+        raise click.ClickException(str(exc))
+
+    click.echo(
+        f"{totals['archived']} articles archived to {totals['files']} files in "
+        f"{ArchiveService.directory()}, {totals['rollups_compacted']} hourly rollups compacted, "
+        f"{time.perf_counter() - started:.1f}s."
+    )
+
+    if totals['archived'] and not no_vacuum:
+        started = time.perf_counter()
+        if ArchiveService.vacuum():
+            click.echo(f"Vacuumed in {time.perf_counter() - started:.1f}s.")
+
+
+@click.command("rebuild-search-index")
+@with_appcontext
+def rebuild_search_index_command():
+    """Create the full-text search index if missing and reindex every article."""
+
+    from app.services.search_service import SearchService
+
+    started = time.perf_counter()
+    try:
+        indexed = SearchService.rebuild()
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc))
+
+    click.echo(f"{indexed} articles indexed in {time.perf_counter() - started:.1f}s.")
+
+
+def register_commands(app):
+    """
+    Attach NarrativeIQ CLI commands to the Flask app.
+
+    Args:
+        app (Flask): Application instance.
+    """
+
+    app.cli.add_command(rebuild_source_metrics_command)
+    app.cli.add_command(rebuild_rollups_command)
+    app.cli.add_command(export_articles_command)
+    app.cli.add_command(import_articles_command)
+    app.cli.add_command(backfill_sentiment_command)
+    app.cli.add_command(upgrade_db_command)
+    app.cli.add_command(archive_articles_command)
+    app.cli.add_command(rebuild_search_index_command)
@@ -5,6 +5,138 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///news.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # SQLite connection settings: journal mode (WAL lets reads run during
+    # writes), busy timeout in milliseconds before "database is locked",
+    # and fsync level (empty string = SQLite default)
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "30000"))
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+
+    # Connection pool for server databases (e.g. PostgreSQL): size, extra
+    # connections under load, wait for a free connection and recycle age
+    # (seconds); connections are pre-pinged before use
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+    # Optional read-only database (e.g. a replica) for /dashboard and /articles
+    READ_DATABASE_URL = os.getenv("READ_DATABASE_URL")
+
     NEWS_API_KEY = os.getenv("NEWS_API_KEY")
     GNEWS_API_KEY = os.getenv("GNEWS_API_KEY")
-    
\ No newline at end of file
+
+    # Upstream provider endpoints (overridable for local stand-in servers)
+    NEWSAPI_URL = os.getenv("NEWSAPI_URL", "https://newsapi.org/v2/everything")
+    GNEWS_URL = os.getenv("GNEWS_URL", "https://gnews.io/api/v4/search")
+
+    # Per-provider request timeouts in seconds (applied to connect and read)
+    NEWSAPI_TIMEOUT = float(os.getenv("NEWSAPI_TIMEOUT", "5"))
+    GNEWS_TIMEOUT = float(os.getenv("GNEWS_TIMEOUT", "5"))
+
+    # Retry policy for transient upstream failures (connection errors, 429, 5xx)
+    FETCH_RETRIES = int(os.getenv("FETCH_RETRIES", "2"))
+    FETCH_BACKOFF = float(os.getenv("FETCH_BACKOFF", "0.3"))
+
+    # Longest sleep before a retry in seconds, whether from backoff or a
+    # provider's Retry-After header; keeps retries inside FETCH_DEADLINE
+    FETCH_RETRY_MAX_WAIT = float(os.getenv("FETCH_RETRY_MAX_WAIT", "3"))
+
+    # Upper bound on a whole concurrent fetch; slower providers are dropped
+    FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", "15"))
+
+    # Keep-alive connections kept per provider host
+    FETCH_POOL_SIZE = int(os.getenv("FETCH_POOL_SIZE", "10"))
+
+    # Provider response cache: freshness TTL, stale-while-revalidate window
+    # (seconds), on-disk size bound and SQLite file
+    # (unset = <instance>/response_cache.db, empty string = disabled)
+    RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+    RESPONSE_CACHE_STALE_TTL = float(os.getenv("RESPONSE_CACHE_STALE_TTL", "600"))
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+    RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH")
+
+    # Provider rate limits: sustained requests per second and burst size
+    NEWSAPI_RATE = float(os.getenv("NEWSAPI_RATE", "1"))
+    NEWSAPI_BURST = float(os.getenv("NEWSAPI_BURST", "5"))
+    GNEWS_RATE = float(os.getenv("GNEWS_RATE", "1"))
+    GNEWS_BURST = float(os.getenv("GNEWS_BURST", "5"))
+
+    # Deep fetch: pages per provider, articles per page, articles per
+    # commit, and pages buffered between fetching and saving
+    DEEP_FETCH_MAX_PAGES = int(os.getenv("DEEP_FETCH_MAX_PAGES", "10"))
+    DEEP_FETCH_PAGE_SIZE = int(os.getenv("DEEP_FETCH_PAGE_SIZE", "100"))
+    DEEP_FETCH_CHUNK_SIZE = int(os.getenv("DEEP_FETCH_CHUNK_SIZE", "200"))
+    DEEP_FETCH_QUEUE_SIZE = int(os.getenv("DEEP_FETCH_QUEUE_SIZE", "4"))
+
+    # Sentiment scoring processes per ingest batch (1 = score in-process)
+    SENTIMENT_WORKERS = int(os.getenv("SENTIMENT_WORKERS", "1"))
+
+    # Sentiment memoization: in-process LRU entries and SQLite backing file
+    # (unset = <instance>/sentiment_cache.db, empty string = memory only)
+    SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+    SENTIMENT_CACHE_PATH = os.getenv("SENTIMENT_CACHE_PATH")
+
+    # Bounds on the SQLite sentiment cache, shared by every configuration
+    # using the file: rows kept and days a row is kept
+    SENTIMENT_CACHE_MAX_ROWS = int(os.getenv("SENTIMENT_CACHE_MAX_ROWS", "1000000"))
+    SENTIMENT_CACHE_MAX_AGE_DAYS = float(os.getenv("SENTIMENT_CACHE_MAX_AGE_DAYS", "30"))
+
+    # VADER implementation: "fast" (compiled engine) or "nltk" (reference);
+    # both give identical scores
+    SENTIMENT_ENGINE = os.getenv("SENTIMENT_ENGINE", "fast")
+
+    # Compound score thresholds for Positive / Negative labels; after a
+    # change, run `flask backfill-sentiment --mode relabel`
+    SENTIMENT_POSITIVE_THRESHOLD = float(os.getenv("SENTIMENT_POSITIVE_THRESHOLD", "0.1"))
+    SENTIMENT_NEGATIVE_THRESHOLD = float(os.getenv("SENTIMENT_NEGATIVE_THRESHOLD", "-0.1"))
+
+    # Articles updated per transaction by `flask backfill-sentiment`
+    BACKFILL_CHUNK_SIZE = int(os.getenv("BACKFILL_CHUNK_SIZE", "2000"))
+
+    # Load the VADER lexicon during create_app instead of on first use
+    SENTIMENT_PRELOAD = os.getenv("SENTIMENT_PRELOAD", "").lower() in ("1", "true", "yes")
+
+    # Articles explorer page size and rows per query when streaming /api/articles
+    ARTICLES_PAGE_SIZE = int(os.getenv("ARTICLES_PAGE_SIZE", "50"))
+    ARTICLES_STREAM_CHUNK = int(os.getenv("ARTICLES_STREAM_CHUNK", "1000"))
+
+    # Full-text search: matches ranked together, newest first; later pages
+    # continue with older matches (0 ranks every match, slow for common words)
+    SEARCH_RANK_WINDOW = int(os.getenv("SEARCH_RANK_WINDOW", "1000"))
+
+    # Background ingestion: run jobs on worker threads (False = inline),
+    # worker thread count, and how many finished jobs stay queryable
+    INGEST_ASYNC = os.getenv("INGEST_ASYNC", "true").lower() in ("1", "true", "yes")
+    INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+    JOB_HISTORY_SIZE = int(os.getenv("JOB_HISTORY_SIZE", "500"))
+
+    # Records saved per transaction by `flask import-articles`
+    IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+
+    # Retention: `flask archive-articles` moves articles published more
+    # than RETENTION_DAYS ago (whole months; 0 = keep everything) into
+    # compressed monthly files under ARCHIVE_DIR (unset = <instance>/archive);
+    # format "ndjson" (gzipped) or "parquet" (needs pyarrow), and articles
+    # per transaction
+    RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "365"))
+    ARCHIVE_DIR = os.getenv("ARCHIVE_DIR")
+    ARCHIVE_FORMAT = os.getenv("ARCHIVE_FORMAT", "ndjson")
+    ARCHIVE_CHUNK_SIZE = int(os.getenv("ARCHIVE_CHUNK_SIZE", "50000"))
+
+    # Computed dashboard views cached per process (0 disables)
+    DASHBOARD_CACHE_SIZE = int(os.getenv("DASHBOARD_CACHE_SIZE", "256"))
+
+    # Live dashboard updates (/api/dashboard/stream): seconds between data
+    # version checks (ingests in this process push immediately), seconds
+    # between keep-alive comments, and open streams allowed per process
+    # (0 disables; each stream holds a server thread)
+    LIVE_POLL_INTERVAL = float(os.getenv("LIVE_POLL_INTERVAL", "2"))
+    LIVE_HEARTBEAT = float(os.getenv("LIVE_HEARTBEAT", "15"))
+    LIVE_MAX_STREAMS = int(os.getenv("LIVE_MAX_STREAMS", "100"))
+
+    # Rows read and encoded per chunk by bulk exports
+    EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "10000"))
+
+    # Pipeline instrumentation and the Prometheus /metrics endpoint
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "").lower() in ("1", "true", "yes")
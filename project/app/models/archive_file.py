@@ -0,0 +1,47 @@
+"""
+archive_file.py
+
+Defines the ArchiveFile model: the manifest of compressed monthly
+archive files holding articles moved out of the Article table.
+
+A file is registered in the same transaction that deletes its articles,
+so every article is counted exactly once: either in the live table or
+in a registered archive file. Files left behind by an interrupted run
+are not registered and are never read.
+"""
+
+from app import db
+from datetime import datetime
+
+
+class ArchiveFile(db.Model):
+    """
+    ArchiveFile Model
+
+    Fields:
+        path (str): File path relative to ARCHIVE_DIR
+            (e.g. "2025-01/articles-1200.ndjson.gz").
+        month (datetime): First day of the publication month of the
+            archived articles (published_at, falling back to created_at).
+        format (str): "ndjson" (gzip-compressed) or "parquet".
+        row_count (int): Number of articles in the file.
+        first_id (int): Smallest archived article id in the file.
+        last_id (int): Largest archived article id in the file.
+        created_at (datetime): When the file was registered.
+
+    Notes:
+        A month usually has several files, one per archive chunk that
+        contained articles from it.
+    """
+
+    __tablename__ = "archive_files"
+
+    path = db.Column(db.String(255), primary_key=True)
+    month = db.Column(db.DateTime, nullable=False, index=True)
+    format = db.Column(db.String(10), nullable=False)
+
+    row_count = db.Column(db.Integer, nullable=False)
+    first_id = db.Column(db.Integer, nullable=False)
+    last_id = db.Column(db.Integer, nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,47 @@
+"""
+archived_article.py
+
+Defines the ArchivedArticle model: what deduplication and the
+unfiltered bias metrics still need to know about an article after
+ArchiveService moved it out of the Article table.
+
+A row is written in the same transaction that deletes the article, so
+an archived headline keeps blocking re-inserts (title_hash), can still
+be matched as a near-duplicate (minhash, via ArchivedLshBucket), and
+still counts in all-time syndication views, score histograms and
+article counts (topic, source, sentiment_score, story_id) without
+reading the archive files.
+"""
+
+from app import db
+
+
+class ArchivedArticle(db.Model):
+    """
+    ArchivedArticle Model
+
+    Fields:
+        id (int): Id the article had in the Article table.
+        title_hash (str): SHA-256 of the normalized title.
+        story_id (int): Story cluster of the article (None when the
+            article started its own).
+        minhash (bytes): MinHash signature of title + description.
+        topic (str): Topic keyword used during data collection.
+        source (str): News source or publisher name.
+        sentiment_score (float): Stored VADER compound score.
+
+    Notes:
+        The full article lives in the archive files; this table only
+        keeps keys and the columns aggregated over all time, so it
+        stays small.
+    """
+
+    __tablename__ = "archived_articles"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    title_hash = db.Column(db.String(64), unique=True, index=True)
+    story_id = db.Column(db.Integer)
+    minhash = db.Column(db.LargeBinary)
+    topic = db.Column(db.String(100))
+    source = db.Column(db.String(100))
+    sentiment_score = db.Column(db.Float)
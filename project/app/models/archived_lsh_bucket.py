@@ -0,0 +1,38 @@
+"""
+archived_lsh_bucket.py
+
+Defines the ArchivedLshBucket model: the LSH index entries of archived
+articles.
+
+LshBucket rows cascade with their Article, so archiving moves them
+here; DedupService looks up candidates in both tables and loads the
+signatures of archived candidates from ArchivedArticle.
+"""
+
+from app import db
+
+
+class ArchivedLshBucket(db.Model):
+    """
+    ArchivedLshBucket Model
+
+    Fields:
+        band (int): Band index within the signature.
+        bucket (int): 32-bit hash of the band's signature rows.
+        article_id (int): Archived article whose signature falls in
+            this bucket.
+
+    Notes:
+        Same layout as LshBucket; the composite primary key is the
+        lookup index.
+    """
+
+    __tablename__ = "archived_lsh_buckets"
+
+    band = db.Column(db.SmallInteger, primary_key=True)
+    bucket = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(
+        db.Integer,
+        db.ForeignKey("archived_articles.id", ondelete="CASCADE"),
+        primary_key=True
+    )
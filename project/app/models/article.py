@@ -15,6 +15,9 @@ This model acts as the central storage structure connecting:
 - Frontend visualization (dashboard and article explorer)
 """
 
+import hashlib
+import re
+
 from app import db
 from datetime import datetime
 
@@ -28,6 +31,7 @@ class Article(db.Model):
     Fields:
         id (int): Primary key identifier for the article.
         title (str): Headline of the article (required).
+        title_hash (str): SHA-256 of the normalized title, used for deduplication.
         description (str): Short summary or excerpt of the article.
         source (str): News source or publisher name.
         topic (str): Topic keyword used during data collection.
@@ -35,6 +39,11 @@ class Article(db.Model):
         sentiment_label (str): Sentiment classification (Positive, Neutral, Negative).
         published_at (datetime): Original publication timestamp from the source.
         created_at (datetime): Timestamp when the record was stored locally.
+        story_id (int): Id of the first article in this article's near-duplicate
+            (syndication) cluster; equals id for the original copy.
+        minhash (bytes): MinHash signature of title + description.
+        scorer_version (str): Scorer that produced sentiment_score.
+        label_version (str): Thresholds that produced sentiment_label.
 
     Role in System:
         This model functions as the structured dataset layer for:
@@ -43,11 +52,28 @@ class Article(db.Model):
         - Dashboard analytics visualization
     """
 
+    # Composite indexes backing keyset pagination on (created_at, id),
+    # alone and combined with each explorer filter. AUTOINCREMENT keeps
+    # SQLite from reusing the ids of archived articles, which stay
+    # referenced by archive files, ArchivedArticle and story_id; it only
+    # applies when the table is created, so `flask upgrade-db` rebuilds
+    # older tables (SchemaService).
+    __table_args__ = (
+        db.Index("ix_article_created_id", "created_at", "id"),
+        db.Index("ix_article_topic_created_id", "topic", "created_at", "id"),
+        db.Index("ix_article_source_created_id", "source", "created_at", "id"),
+        db.Index("ix_article_label_created_id", "sentiment_label", "created_at", "id"),
+        {'sqlite_autoincrement': True},
+    )
+
     id = db.Column(db.Integer, primary_key=True)
 
     # Article headline fetched from external APIs
     title = db.Column(db.Text, nullable=False)
 
+    # Hash of the normalized headline; unique index makes duplicate checks O(log n)
+    title_hash = db.Column(db.String(64), unique=True, index=True)
+
     # Short summary or description provided by the news source
     description = db.Column(db.Text)
 
@@ -67,4 +93,34 @@ class Article(db.Model):
     published_at = db.Column(db.DateTime)
 
     # Timestamp representing when the record was inserted into the database
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Near-duplicate story cluster (see DedupService)
+    story_id = db.Column(db.Integer, index=True)
+
+    # MinHash signature (64 x uint32) used for near-duplicate detection
+    minhash = db.Column(db.LargeBinary)
+
+    # Scorer and label thresholds behind the stored sentiment ("legacy" for
+    # rows stored before they were recorded); rows that differ from the
+    # current configuration are picked up by `flask backfill-sentiment`
+    scorer_version = db.Column(db.String(100))
+    label_version = db.Column(db.String(50))
+
+    @staticmethod
+    def hash_title(title):
+        """
+        Compute the deduplication key for a headline.
+
+        Titles are lowercased and whitespace is collapsed before hashing so
+        that trivially different copies of the same headline collide.
+
+        Args:
+            title (str): Article headline.
+
+        Returns:
+            str: Hex-encoded SHA-256 digest of the normalized title.
+        """
+
+        normalized = re.sub(r"\s+", " ", title).strip().lower()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
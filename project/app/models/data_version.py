@@ -0,0 +1,70 @@
+"""
+data_version.py
+
+Defines the DataVersion model: a single-row counter bumped in every
+transaction that changes what the dashboard shows.
+
+Each server process keeps its own cache of computed dashboard pages keyed
+by this version. Reading one row by primary key is enough for a process
+to notice writes made by any other process, without a shared cache or
+message bus.
+"""
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app import db
+
+
+class DataVersion(db.Model):
+    """
+    DataVersion Model
+
+    Fields:
+        id (int): Always 1 (single-row table).
+        version (int): Incremented on every committed ingest or rebuild.
+    """
+
+    __tablename__ = "data_version"
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    @staticmethod
+    def current():
+        """
+        Read the current data version.
+
+        Returns:
+            int: Version number (0 before the first write).
+        """
+
+        return db.session.scalar(select(DataVersion.version).where(DataVersion.id == 1)) or 0
+
+    @staticmethod
+    def bump():
+        """
+        Increment the data version in the current transaction.
+
+        The caller commits; readers see the new version together with the
+        data it describes.
+        """
+
+        dialect = db.session.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+            stmt = dialect_insert(DataVersion).values(id=1, version=1)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DataVersion.id],
+                set_={'version': DataVersion.version + 1}
+            )
+            db.session.execute(stmt)
+            return
+
+        updated = db.session.execute(
+            update(DataVersion).where(DataVersion.id == 1).values(version=DataVersion.version + 1)
+        )
+        if updated.rowcount == 0:
+            db.session.add(DataVersion(id=1, version=1))
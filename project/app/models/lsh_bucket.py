@@ -0,0 +1,38 @@
+"""
+lsh_bucket.py
+
+Defines the LshBucket model: the persisted locality-sensitive hashing
+(LSH) index used to find near-duplicate articles.
+
+Each article's MinHash signature is split into bands; every band hashes
+to one bucket. Articles sharing any (band, bucket) pair are candidate
+near-duplicates, so a lookup touches only the handful of rows in the
+matching buckets instead of the whole Article table.
+"""
+
+from app import db
+
+
+class LshBucket(db.Model):
+    """
+    LshBucket Model
+
+    Fields:
+        band (int): Band index within the signature.
+        bucket (int): 32-bit hash of the band's signature rows.
+        article_id (int): Article whose signature falls in this bucket.
+
+    Notes:
+        The composite primary key (band, bucket, article_id) doubles as
+        the lookup index for candidate queries.
+    """
+
+    __tablename__ = "article_lsh_buckets"
+
+    band = db.Column(db.SmallInteger, primary_key=True)
+    bucket = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(
+        db.Integer,
+        db.ForeignKey("article.id", ondelete="CASCADE"),
+        primary_key=True
+    )
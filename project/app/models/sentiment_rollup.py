@@ -0,0 +1,50 @@
+"""
+sentiment_rollup.py
+
+Defines the SentimentRollup model: precomputed sentiment time series per
+(topic, source) at hourly and daily granularity.
+
+Rollups are updated in the same transaction as each ingest and can be
+rebuilt in bulk for backfills, so trend queries read a few rows per time
+bucket instead of scanning the Article table.
+"""
+
+from app import db
+
+
+class SentimentRollup(db.Model):
+    """
+    SentimentRollup Model
+
+    Running sentiment aggregates for one (topic, source) in one time bucket.
+
+    Fields:
+        granularity (str): "hour" or "day".
+        topic (str): Topic keyword ("" when the article had none).
+        source (str): Source name ("" when the provider gave none).
+        bucket_start (datetime): Start of the bucket (UTC, truncated).
+        article_count (int): Number of scored articles in the bucket.
+        score_sum (float): Sum of sentiment scores.
+        score_sq_sum (float): Sum of squared sentiment scores.
+
+    Notes:
+        Articles are bucketed by published_at, falling back to created_at.
+        The primary key order supports range scans over bucket_start for
+        a given granularity, topic and source.
+    """
+
+    __tablename__ = "sentiment_rollups"
+
+    granularity = db.Column(db.String(5), primary_key=True)
+    topic = db.Column(db.String(100), primary_key=True)
+    source = db.Column(db.String(100), primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+
+    article_count = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    score_sq_sum = db.Column(db.Float, nullable=False, default=0.0)
+
+    # Window scans across all topics/sources for one granularity
+    __table_args__ = (
+        db.Index("ix_sentiment_rollups_granularity_bucket", "granularity", "bucket_start"),
+    )
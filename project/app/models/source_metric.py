@@ -0,0 +1,45 @@
+"""
+source_metric.py
+
+Defines the SourceMetric model: a materialized, incrementally maintained
+summary of sentiment scores per (topic, source).
+
+Rows are updated in the same transaction as each ingest, so the dashboard
+and bias metrics can read per-source aggregates without scanning the
+Article table. Running sums (count, sum, sum of squares) are exact and
+support means and variances as well as merging across topics.
+"""
+
+from app import db
+from datetime import datetime
+
+
+class SourceMetric(db.Model):
+    """
+    SourceMetric Model
+
+    Running sentiment aggregates for one source within one topic.
+
+    Fields:
+        topic (str): Topic keyword ("" when the article had none).
+        source (str): Source name ("" when the provider gave none).
+        article_count (int): Number of scored articles.
+        score_sum (float): Sum of sentiment scores.
+        score_sq_sum (float): Sum of squared sentiment scores.
+        updated_at (datetime): Last time the row changed.
+
+    Notes:
+        Missing topics/sources are stored as empty strings because they
+        form the primary key; readers map them back to None.
+    """
+
+    __tablename__ = "source_metrics"
+
+    topic = db.Column(db.String(100), primary_key=True)
+    source = db.Column(db.String(100), primary_key=True)
+
+    article_count = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    score_sq_sum = db.Column(db.Float, nullable=False, default=0.0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -13,16 +13,63 @@ Routes in this module manage the high-level workflow of the system:
     Topic Input → Data Collection → NLP Processing → Bias Analytics → Visualization
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for
-from app.services.news_service import NewsService
-from app.models.article import Article
+import json
+from datetime import datetime, timedelta
+
+from flask import (
+    Blueprint, Response, abort, current_app, redirect, render_template,
+    jsonify, request, stream_with_context, url_for
+)
+from app.services.job_service import JobService
+from app.services.metrics_service import RENDER_SECONDS, MetricsService
+from app.services.article_service import ArticleService
 from app.services.bias_service import BiasService
+from app.services.dashboard_service import DashboardService
+from app.services.database_service import read_only
+from app.services.export_service import FORMATS, ExportService, ExportUnavailable
+from app.services.search_service import SearchService
+from app.services.timeseries_service import TimeseriesService
 
 
 # Blueprint for main application routes
 main = Blueprint("main", __name__)
 
 
+def _render(template, **context):
+    """Render a template, timing it for /metrics."""
+
+    with MetricsService.timer(RENDER_SECONDS, template=template):
+        return render_template(template, **context)
+
+
+def _parse_date(value):
+    """Parse a YYYY-MM-DD query parameter (raises ValueError if invalid)."""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _dashboard_filters():
+    """
+    Read the dashboard filters from the query string.
+
+    Returns:
+        tuple: (topic, start, end, end_exclusive, syndication).
+    """
+
+    topic = request.args.get("topic") or None
+    start = request.args.get("start", type=_parse_date)
+    end = request.args.get("end", type=_parse_date)
+
+    # Date filters are inclusive of the whole end day
+    end_exclusive = end + timedelta(days=1) if end else None
+
+    # Near-duplicate handling: "collapse", "weight" or all copies
+    syndication = request.args.get("syndication")
+    if syndication not in ("collapse", "weight"):
+        syndication = None
+
+    return topic, start, end, end_exclusive, syndication
+
+
 @main.route("/", methods=["GET", "POST"])
 def home():
     """
@@ -30,13 +77,14 @@ def home():
 
     Handles:
         - Display of the topic input interface
-        - Triggering the data ingestion pipeline when a topic is submitted
+        - Enqueuing the data ingestion pipeline when a topic is submitted
 
     Workflow:
-        1. User submits a topic.
-        2. Articles are fetched from multiple news APIs.
-        3. Articles are normalized, enriched with sentiment, and stored.
-        4. User is redirected to the dashboard for analytics visualization.
+        1. User submits a topic (optionally requesting a deep fetch).
+        2. An ingestion job is queued (or joined, if the topic is in flight).
+        3. In the background, articles are fetched from multiple news APIs
+           in parallel, enriched with sentiment, and stored.
+        4. User is redirected to the dashboard, which tracks the job.
 
     Returns:
         home.html template for GET requests.
@@ -47,89 +95,462 @@ def home():
         topic = request.form.get("topic")
 
         if topic:
-            # Fetch articles from multiple external sources
-            articles_newsapi = NewsService.fetch_from_newsapi(topic)
-            articles_gnews = NewsService.fetch_from_gnews(topic)
+            job = JobService.submit(topic, deep=bool(request.form.get("deep")))
 
-            # Combine datasets and persist processed articles
-            combined_articles = articles_newsapi + articles_gnews
-            NewsService.save_articles(topic, combined_articles)
+            # Redirect immediately; the dashboard polls the job status
+            return redirect(url_for("main.dashboard", job=job.id))
 
-        # Redirect to analytics dashboard after data processing
         return redirect(url_for("main.dashboard"))
 
-    return render_template("home.html")
+    return _render("home.html")
+
+
+@main.route("/jobs/<job_id>")
+def job_status(job_id):
+    """
+    Ingestion Job Status Route
+
+    Reports progress of a background ingestion job.
+
+    Returns:
+        JSON with status, current stage, article counts and stage timings;
+        404 if the job is unknown or has expired from history.
+    """
+
+    job = JobService.get(job_id)
+
+    if job is None:
+        return jsonify({'error': "unknown job"}), 404
+
+    return jsonify(job.to_dict())
 
 
 @main.route("/dashboard")
+@read_only
 def dashboard():
     """
     Dashboard Route (Analytics View)
 
     Responsible for:
-        - Retrieving stored articles
-        - Computing source-level sentiment metrics
+        - Aggregating stored articles per source in the database
         - Computing bias and polarization indicators
         - Passing visualization-ready data to the frontend
 
+    Query Parameters:
+        topic (str, optional): Restrict metrics to one topic.
+        start / end (YYYY-MM-DD, optional): Inclusive publication date range.
+        syndication (str, optional): "collapse" or "weight" to discount
+            near-duplicate copies of the same story.
+
     This route represents the analytical core of the NarrativeIQ UI layer.
+    Its cost scales with the number of sources, not the number of articles:
+    without filters beyond topic it reads the precomputed SourceMetric table.
+
+    Computed views are cached per process until the data version changes,
+    and responses carry an ETag so revalidation can return 304 without
+    touching the metrics at all.
 
     Returns:
         dashboard.html template with:
-            - Article dataset
+            - Article count
             - Bias metrics
             - Chart-ready sentiment distributions
+        or 304 Not Modified when If-None-Match matches.
     """
 
-    # Retrieve dataset ordered by latest ingestion time
-    stored_articles = Article.query.order_by(
-        Article.created_at.desc()
-    ).all()
+    topic, start, end, end_exclusive, syndication = _dashboard_filters()
 
-    # Compute analytical metrics from dataset
-    source_metrics = BiasService.compute_source_metrics(stored_articles)
-    bias_index = BiasService.compute_bias_index(source_metrics)
-    polarization = BiasService.compute_polarization(source_metrics)
+    job_id = request.args.get("job")
 
-    return render_template(
-        "dashboard.html",
-        articles=stored_articles,
-        source_metrics=source_metrics,
-        bias_index=bias_index,
-        polarization=polarization,
+    # One primary-key read tells whether any process has written since
+    version = DashboardService.current_version()
+    key = DashboardService.cache_key(topic, start, end, syndication)
+    etag = DashboardService.etag(version, key)
 
-        # Data formatted for frontend chart rendering
-        chart_labels=[s['source'] for s in source_metrics],
-        chart_values=[s['avg_sentiment'] for s in source_metrics]
-    )
+    # Pages tracking an ingest job are personal; everything else is shared
+    if job_id is None and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        entry = DashboardService.entry(version, key, topic, start, end_exclusive, syndication)
+
+        context = dict(
+            entry['payload'],
+            job_id=job_id,
+            version=version,
+            filters=dict(zip(("topic", "start", "end", "syndication"), key))
+        )
+
+        if job_id is not None:
+            return _render("dashboard.html", **context)
+
+        if entry['html'] is None:
+            entry['html'] = _render("dashboard.html", **context)
+        response = Response(entry['html'], mimetype="text/html")
+
+    # Browsers and proxies must revalidate, which is cheap via the ETag
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = "no-cache"
+
+    return response
+
+
+@main.route("/api/dashboard/stream")
+def dashboard_stream():
+    """
+    Live Dashboard Updates (Server-Sent Events)
+
+    Streams changes to one dashboard view as ingests commit, so an open
+    dashboard updates its chart and metrics in place instead of being
+    reloaded. Every stream of the same view shares one computation per
+    data version (see dashboard_broadcaster.py).
+
+    Query Parameters:
+        topic / start / end / syndication: Same filters as /dashboard.
+        version (int, optional): Data version the page was rendered at;
+            the first event is a delta from it when possible. Reconnecting
+            clients send Last-Event-ID instead.
+
+    Events:
+        delta: {"total_articles", "bias_index", "polarization",
+            "sources": [changed source metrics], "removed": [sources]}
+        snapshot: Same fields with every source, when the client's
+            version is too old for a delta.
+        Each event's id is its data version. A comment is sent every
+        LIVE_HEARTBEAT seconds to keep idle connections open.
+
+    Each stream occupies a worker thread for its lifetime, so serve the
+    app with threaded workers (e.g. gunicorn --threads or gevent).
+
+    Returns:
+        text/event-stream response, or 503 when LIVE_MAX_STREAMS streams
+        are already open in this process.
+    """
+
+    topic, start, end, end_exclusive, syndication = _dashboard_filters()
+    key = DashboardService.cache_key(topic, start, end, syndication)
+    version = request.headers.get("Last-Event-ID", type=int) or request.args.get("version", type=int)
+
+    stream = DashboardService.subscribe(key, topic, start, end_exclusive, syndication, version)
+    if stream is None:
+        abort(503)
+
+    heartbeat = current_app.config['LIVE_HEARTBEAT']
+
+    def generate():
+        try:
+            # Flush headers now so the client sees the stream open
+            yield ": connected\n\n"
+
+            while True:
+                event = stream.get(heartbeat)
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                version, kind, data = event
+                yield f"id: {version}\nevent: {kind}\ndata: {json.dumps(data)}\n\n"
+        finally:
+            DashboardService.unsubscribe(stream)
+
+    response = Response(generate(), mimetype="text/event-stream")
+    response.headers['Cache-Control'] = "no-cache"
+
+    # Deliver events as they are written (nginx buffers proxied responses)
+    response.headers['X-Accel-Buffering'] = "no"
+
+    return response
 
 
 @main.route("/articles")
+@read_only
 def articles():
     """
     Articles Explorer Route
 
-    Displays the stored dataset of processed articles.
+    Displays the stored dataset of processed articles, one page at a time.
 
     This page allows users to:
         - Inspect collected news data
         - View sentiment classifications per article
         - Understand how analytics are derived from raw inputs
 
+    Query Parameters:
+        q (str, optional): Full-text search; results are ranked by
+            relevance with matches highlighted (see search_service.py).
+        topic / source / label (str, optional): Filters.
+        cursor (str, optional): Cursor from the previous page.
+
     Returns:
-        articles.html template containing all stored articles.
+        articles.html template containing one page of articles.
     """
 
-    stored_articles = Article.query.order_by(
-        Article.created_at.desc()
-    ).all()
-
-    return render_template(
+    query = request.args.get("q", "").strip()
+    filters = {
+        'topic': request.args.get("topic") or None,
+        'source': request.args.get("source") or None,
+        'label': request.args.get("label") or None
+    }
+
+    try:
+        if query:
+            rows, next_cursor = SearchService.search(
+                query,
+                cursor=request.args.get("cursor"),
+                limit=current_app.config['ARTICLES_PAGE_SIZE'],
+                window=current_app.config['SEARCH_RANK_WINDOW'],
+                **filters
+            )
+        else:
+            rows, next_cursor = ArticleService.page(
+                cursor=request.args.get("cursor"),
+                limit=current_app.config['ARTICLES_PAGE_SIZE'],
+                **filters
+            )
+    except ValueError:
+        abort(400, description="Invalid cursor")
+
+    return _render(
         "articles.html",
-        articles=stored_articles
+        articles=rows,
+        filters=dict({key: value or "" for key, value in filters.items()}, q=query),
+        next_cursor=next_cursor
+    )
+
+
+@main.route("/api/articles")
+@read_only
+def api_articles():
+    """
+    Articles Streaming API
+
+    Streams every matching article as newline-delimited JSON (NDJSON).
+    Rows are read in keyset chunks and written as they are produced, so
+    memory use stays constant regardless of export size.
+
+    Query Parameters:
+        topic / source / label (str, optional): Filters.
+
+    Returns:
+        application/x-ndjson streaming response.
+    """
+
+    rows = ArticleService.iter_rows(
+        topic=request.args.get("topic") or None,
+        source=request.args.get("source") or None,
+        label=request.args.get("label") or None,
+        chunk_size=current_app.config['ARTICLES_STREAM_CHUNK']
+    )
+
+    def generate():
+        for row in rows:
+            yield json.dumps(ArticleService.to_dict(row)) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+@main.route("/api/search")
+@read_only
+def api_search():
+    """
+    Article Search API
+
+    Full-text search over stored article titles and descriptions, best
+    match first, with matches highlighted in the title and a description
+    snippet. Relevance is ranked among the SEARCH_RANK_WINDOW newest
+    matches; later pages continue with older ones.
+
+    Query Parameters:
+        q (str): Search terms; all must match. "Quoted phrases" match
+            in order and a trailing * matches prefixes (elect*).
+        topic / source / label (str, optional): Filters.
+        limit (int, optional): Results per page (default
+            ARTICLES_PAGE_SIZE, max 100).
+        cursor (str, optional): next_cursor from the previous page.
+
+    Returns:
+        JSON with query, engine ("fts5", or "like" without the index),
+        results (article fields plus title_html, snippet and rank) and
+        next_cursor, or 400 for a missing query or invalid cursor.
+    """
+
+    query = request.args.get("q", "").strip()
+    if not SearchService.parse(query):
+        abort(400, description="q must contain at least one word")
+
+    limit = min(max(request.args.get("limit", current_app.config['ARTICLES_PAGE_SIZE'], type=int), 1), 100)
+
+    try:
+        results, next_cursor = SearchService.search(
+            query,
+            topic=request.args.get("topic") or None,
+            source=request.args.get("source") or None,
+            label=request.args.get("label") or None,
+            cursor=request.args.get("cursor"),
+            limit=limit,
+            window=current_app.config['SEARCH_RANK_WINDOW']
+        )
+    except ValueError:
+        abort(400, description="Invalid cursor")
+
+    return jsonify(
+        query=query,
+        engine="fts5" if SearchService.available() else "like",
+        results=results,
+        next_cursor=next_cursor
+    )
+
+
+@main.route("/api/export")
+def api_export():
+    """
+    Bulk Export API
+
+    Streams every matching article as a downloadable file. Rows are read
+    and encoded in chunks, so memory use is constant regardless of how
+    many articles are exported.
+
+    Query Parameters:
+        format (str, optional): "csv" (gzipped, default), "parquet" or
+            "arrow" (Arrow IPC stream).
+        topic (str, optional): Restrict to one topic.
+        start / end (YYYY-MM-DD, optional): Inclusive publication date range.
+
+    Returns:
+        Streaming attachment, or 400 for an unknown or unavailable format.
+    """
+
+    fmt = request.args.get("format", "csv")
+    if fmt not in FORMATS:
+        abort(400, description=f"format must be one of: {', '.join(FORMATS)}")
+
+    topic = request.args.get("topic") or None
+    start = request.args.get("start", type=_parse_date)
+    end = request.args.get("end", type=_parse_date)
+
+    chunks = ExportService.iter_chunks(
+        topic, start, end + timedelta(days=1) if end else None,
+        chunk_size=current_app.config['EXPORT_CHUNK_SIZE']
+    )
+    body = ExportService.encode(fmt, chunks)
+
+    # Fail before streaming starts if the format's dependency is missing
+    try:
+        first = next(body, b"")
+    except ExportUnavailable as exc:
+        abort(400, description=str(exc))
+
+    def generate():
+        yield first
+        yield from body
+
+    filename = f"articles-{topic or 'all'}.{FORMATS[fmt]['extension']}"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=FORMATS[fmt]['mimetype'],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
     )
 
 
+@main.route("/api/timeseries")
+@read_only
+def api_timeseries():
+    """
+    Sentiment Time Series API
+
+    Returns average sentiment per time bucket, read from the precomputed
+    SentimentRollup table so the cost depends on the number of buckets
+    in the window, not the number of articles.
+
+    Query Parameters:
+        granularity (str, optional): "hour" or "day" (default "day").
+        topic / source (str, optional): Filters.
+        start / end (YYYY-MM-DD, optional): Inclusive date range.
+        by_source (bool, optional): One series per source when set.
+
+    Returns:
+        JSON with granularity and points, or 400 for an unknown granularity.
+    """
+
+    granularity = request.args.get("granularity", "day")
+    if granularity not in TimeseriesService.GRANULARITIES:
+        abort(400, description="granularity must be 'hour' or 'day'")
+
+    end = request.args.get("end", type=_parse_date)
+
+    points = TimeseriesService.series(
+        granularity=granularity,
+        topic=request.args.get("topic") or None,
+        source=request.args.get("source") or None,
+        start=request.args.get("start", type=_parse_date),
+        end=end + timedelta(days=1) if end else None,
+        by_source=request.args.get("by_source") in ("1", "true", "yes")
+    )
+
+    return jsonify(granularity=granularity, points=points)
+
+
+@main.route("/api/bias")
+@read_only
+def api_bias():
+    """
+    Bias Analytics API
+
+    Returns per-source metrics, bias index and polarization for the
+    filters, with bootstrap confidence intervals for both indices.
+    Sources with few articles widen the intervals, which the point
+    estimates on the dashboard cannot show.
+
+    Query Parameters:
+        topic (str, optional): Restrict to one topic.
+        start / end (YYYY-MM-DD, optional): Inclusive publication date range.
+        iterations (int, optional): Bootstrap replicates (default 1000, max 10000).
+        seed (int, optional): Seed for reproducible intervals.
+
+    Returns:
+        JSON with source_metrics, bias_index, polarization,
+        bias_index_ci and polarization_ci.
+    """
+
+    topic = request.args.get("topic") or None
+    start = request.args.get("start", type=_parse_date)
+    end = request.args.get("end", type=_parse_date)
+    end_exclusive = end + timedelta(days=1) if end else None
+
+    iterations = min(max(request.args.get("iterations", 1000, type=int), 1), 10_000)
+
+    source_metrics = BiasService.query_source_metrics(topic, start, end_exclusive)
+    intervals = BiasService.confidence_intervals(
+        topic, start, end_exclusive,
+        iterations=iterations, seed=request.args.get("seed", type=int)
+    )
+
+    return jsonify(
+        source_metrics=source_metrics,
+        bias_index=BiasService.compute_bias_index(source_metrics),
+        polarization=BiasService.compute_polarization(source_metrics),
+        **intervals
+    )
+
+
+@main.route("/metrics")
+def metrics():
+    """
+    Prometheus Metrics Endpoint
+
+    Exposes pipeline stage timings, per-provider article counters, HTTP
+    latency and cache statistics in the Prometheus text format.
+
+    Returns:
+        text/plain exposition (version 0.0.4), or 404 when METRICS_ENABLED
+        is off.
+    """
+
+    if not MetricsService.enabled():
+        abort(404)
+
+    return Response(MetricsService.render(), mimetype="text/plain; version=0.0.4")
+
+
 @main.route("/about")
 def about():
     """
@@ -144,4 +565,4 @@ def about():
     Returns:
         about.html template.
     """
-    return render_template("about.html")
\ No newline at end of file
+    return _render("about.html")
\ No newline at end of file
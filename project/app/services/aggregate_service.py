@@ -0,0 +1,488 @@
+"""
+aggregate_service.py
+
+Maintains materialized aggregates derived from the Article table.
+
+Responsibilities:
+    - Apply per-(topic, source) running sums to SourceMetric as part of
+      each ingest transaction
+    - Apply hourly and daily per-(topic, source) running sums to
+      SentimentRollup in the same transaction
+    - Swap the contributions of rescored articles (sentiment backfills)
+    - Rebuild SourceMetric from Article and report drift between the
+      stored and recomputed values
+    - Rebuild SentimentRollup for backfills with vectorized pandas
+      group-bys over chunked reads
+    - Include archived articles (see archive_service.py) in both
+      rebuilds, so aggregates keep covering the archived period
+
+Position in Pipeline:
+    NewsService.save_articles → AggregateService → SourceMetric / SentimentRollup → BiasService / TimeseriesService → Dashboard
+
+Notes:
+    - Aggregates are exact running sums (count, sum, sum of squares), so
+      incremental updates never accumulate approximation error
+    - Upserts use INSERT ... ON CONFLICT DO UPDATE on SQLite/PostgreSQL,
+      which keeps concurrent ingests from losing increments
+"""
+
+import math
+from collections import defaultdict
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app import db
+from app.models.article import Article
+from app.models.data_version import DataVersion
+from app.models.sentiment_rollup import SentimentRollup
+from app.models.source_metric import SourceMetric
+from app.services.archive_service import ArchiveService
+
+
+# Rollup granularities and the matching pandas floor frequencies
+ROLLUP_GRANULARITIES = {'hour': "h", 'day': "D"}
+
+# Article rows read per chunk when rebuilding rollups
+REBUILD_CHUNK_SIZE = 100_000
+
+
+class AggregateService:
+    """
+    AggregateService
+
+    Provides static utilities for keeping materialized aggregate tables
+    consistent with the Article table.
+    """
+
+    @staticmethod
+    def source_increments(rows):
+        """
+        Sum sentiment scores per (topic, source).
+
+        Args:
+            rows (Iterable[tuple]): (topic, source, sentiment_score) triples.
+
+        Returns:
+            dict: (topic, source) -> [count, score_sum, score_sq_sum], with
+            missing topics/sources keyed as "".
+        """
+
+        increments = defaultdict(lambda: [0, 0.0, 0.0])
+
+        for topic, source, score in rows:
+            if score is None:
+                continue
+            entry = increments[(topic or "", source or "")]
+            entry[0] += 1
+            entry[1] += score
+            entry[2] += score * score
+
+        return increments
+
+    @staticmethod
+    def bucket_start(moment, granularity):
+        """
+        Truncate a timestamp to the start of its rollup bucket.
+
+        Args:
+            moment (datetime): Timestamp (timezone information is dropped).
+            granularity (str): "hour" or "day".
+
+        Returns:
+            datetime: Naive bucket start.
+        """
+
+        moment = moment.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        if granularity == "day":
+            moment = moment.replace(hour=0)
+
+        return moment
+
+    @staticmethod
+    def rollup_increments(rows):
+        """
+        Sum sentiment scores per (granularity, bucket, topic, source).
+
+        Args:
+            rows (Iterable): Objects with topic, source, sentiment_score,
+                published_at and created_at attributes.
+
+        Returns:
+            dict: (granularity, topic, source, bucket_start) ->
+            [count, score_sum, score_sq_sum].
+        """
+
+        increments = defaultdict(lambda: [0, 0.0, 0.0])
+
+        for row in rows:
+            moment = row.published_at or row.created_at
+            if row.sentiment_score is None or moment is None:
+                continue
+
+            for granularity in ROLLUP_GRANULARITIES:
+                entry = increments[(
+                    granularity, row.topic or "", row.source or "",
+                    AggregateService.bucket_start(moment, granularity)
+                )]
+                entry[0] += 1
+                entry[1] += row.sentiment_score
+                entry[2] += row.sentiment_score * row.sentiment_score
+
+        return increments
+
+    @staticmethod
+    def _upsert_sums(model, key_names, increments):
+        """
+        Add running sums to an aggregate table in the current transaction.
+
+        Args:
+            model: SourceMetric or SentimentRollup.
+            key_names (tuple[str]): Primary key column names, in the order
+                used by the increments' keys.
+            increments (dict): key tuple -> [count, score_sum, score_sq_sum].
+                Negative values are allowed (e.g. when rows are removed).
+
+        Notes:
+            The caller owns the transaction; nothing is committed here.
+        """
+
+        if not increments:
+            return
+
+        values = [
+            {
+                **dict(zip(key_names, key)),
+                'article_count': count,
+                'score_sum': total,
+                'score_sq_sum': total_sq
+            }
+            for key, (count, total, total_sq) in increments.items()
+        ]
+
+        dialect = db.session.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+            stmt = dialect_insert(model).values(values)
+
+            updates = {
+                'article_count': model.article_count + stmt.excluded.article_count,
+                'score_sum': model.score_sum + stmt.excluded.score_sum,
+                'score_sq_sum': model.score_sq_sum + stmt.excluded.score_sq_sum
+            }
+            if hasattr(model, "updated_at"):
+                updates['updated_at'] = func.current_timestamp()
+
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[getattr(model, name) for name in key_names],
+                set_=updates
+            )
+            db.session.execute(stmt)
+            return
+
+        # Portable fallback: read-modify-write under the ingest transaction
+        for value in values:
+            row = db.session.get(model, tuple(value[name] for name in key_names))
+            if row is None:
+                db.session.add(model(**value))
+            else:
+                row.article_count += value['article_count']
+                row.score_sum += value['score_sum']
+                row.score_sq_sum += value['score_sq_sum']
+
+    @staticmethod
+    def apply_source_increments(increments):
+        """
+        Add increments to SourceMetric rows in the current transaction.
+
+        Args:
+            increments (dict): Output of source_increments().
+        """
+
+        AggregateService._upsert_sums(SourceMetric, ("topic", "source"), increments)
+
+    @staticmethod
+    def apply_rollup_increments(increments):
+        """
+        Add increments to SentimentRollup rows in the current transaction.
+
+        Args:
+            increments (dict): Output of rollup_increments().
+        """
+
+        AggregateService._upsert_sums(
+            SentimentRollup, ("granularity", "topic", "source", "bucket_start"), increments
+        )
+
+    @staticmethod
+    def record_ingest(rows):
+        """
+        Update materialized aggregates for newly inserted articles.
+
+        Args:
+            rows (Iterable): Inserted articles, as objects with topic,
+                source, sentiment_score, published_at and created_at.
+        """
+
+        rows = list(rows)
+
+        AggregateService.apply_source_increments(AggregateService.source_increments(
+            (row.topic, row.source, row.sentiment_score) for row in rows
+        ))
+        AggregateService.apply_rollup_increments(AggregateService.rollup_increments(rows))
+
+    @staticmethod
+    def record_rescore(old_rows, new_rows):
+        """
+        Replace the aggregate contributions of rescored articles.
+
+        Args:
+            old_rows (list): Articles with their previous sentiment_score
+                (objects with topic, source, sentiment_score, published_at
+                and created_at).
+            new_rows (list): The same articles with their new score.
+
+        Notes:
+            Applied as one signed increment per aggregate row, in the
+            caller's transaction, so readers never see the old scores
+            removed without the new ones added.
+        """
+
+        def triples(rows):
+            return ((row.topic, row.source, row.sentiment_score) for row in rows)
+
+        AggregateService.apply_source_increments(AggregateService._difference(
+            AggregateService.source_increments(triples(new_rows)),
+            AggregateService.source_increments(triples(old_rows))
+        ))
+        AggregateService.apply_rollup_increments(AggregateService._difference(
+            AggregateService.rollup_increments(new_rows),
+            AggregateService.rollup_increments(old_rows)
+        ))
+
+    @staticmethod
+    def _difference(added, removed):
+        """Subtract one increments dict from another, dropping zero entries."""
+
+        for key, (count, total, total_sq) in removed.items():
+            entry = added[key]
+            entry[0] -= count
+            entry[1] -= total
+            entry[2] -= total_sq
+
+        return {key: entry for key, entry in added.items() if any(entry)}
+
+    @staticmethod
+    def compute_source_aggregates():
+        """
+        Recompute per-(topic, source) aggregates from the Article table
+        and the archive files.
+
+        Returns:
+            dict: (topic, source) -> (count, score_sum, score_sq_sum).
+        """
+
+        score = Article.sentiment_score
+
+        stmt = (
+            select(
+                Article.topic,
+                Article.source,
+                func.count(score),
+                func.sum(score),
+                func.sum(score * score)
+            )
+            .where(score.isnot(None))
+            .group_by(Article.topic, Article.source)
+        )
+
+        aggregates = defaultdict(lambda: [0, 0.0, 0.0])
+        for topic, source, count, total, total_sq in db.session.execute(stmt):
+            # NULL and "" collapse onto the same key
+            entry = aggregates[(topic or "", source or "")]
+            entry[0] += count
+            entry[1] += total
+            entry[2] += total_sq
+
+        for key, (count, total, total_sq) in ArchiveService.source_aggregates().items():
+            entry = aggregates[key]
+            entry[0] += count
+            entry[1] += total
+            entry[2] += total_sq
+
+        return {key: tuple(value) for key, value in aggregates.items()}
+
+    @staticmethod
+    def rebuild_source_metrics(dry_run=False):
+        """
+        Rebuild SourceMetric from Article and report drift.
+
+        Args:
+            dry_run (bool): Only report drift, leaving the table untouched.
+
+        Returns:
+            list[dict]: One entry per (topic, source) whose stored values
+            differ from the recomputed ones, with both versions.
+        """
+
+        expected = AggregateService.compute_source_aggregates()
+        stored = {
+            (m.topic, m.source): (m.article_count, m.score_sum, m.score_sq_sum)
+            for m in db.session.scalars(select(SourceMetric))
+        }
+
+        drift = []
+        for key in sorted(expected.keys() | stored.keys()):
+            want = expected.get(key, (0, 0.0, 0.0))
+            have = stored.get(key, (0, 0.0, 0.0))
+            if want[0] != have[0] or not all(
+                math.isclose(w, h, rel_tol=1e-9, abs_tol=1e-9)
+                for w, h in zip(want[1:], have[1:])
+            ):
+                drift.append({
+                    'topic': key[0],
+                    'source': key[1],
+                    'stored': have,
+                    'expected': want
+                })
+
+        if not dry_run:
+            db.session.execute(delete(SourceMetric))
+            if expected:
+                db.session.execute(insert(SourceMetric), [
+                    {
+                        'topic': topic,
+                        'source': source,
+                        'article_count': count,
+                        'score_sum': total,
+                        'score_sq_sum': total_sq
+                    }
+                    for (topic, source), (count, total, total_sq) in expected.items()
+                ])
+            DataVersion.bump()
+            db.session.commit()
+
+        return drift
+
+    @staticmethod
+    def _rollup_partials(chunk, granularities):
+        """
+        Group one chunk of articles into rollup partial sums.
+
+        Args:
+            chunk (pandas.DataFrame): topic, source, sentiment_score,
+                published_at and created_at columns.
+            granularities (Iterable[str]): Granularities to compute.
+
+        Returns:
+            list[pandas.DataFrame]: One grouped frame per granularity.
+        """
+
+        import pandas as pd
+
+        moment = pd.to_datetime(chunk["published_at"]).fillna(
+            pd.to_datetime(chunk["created_at"])
+        )
+        # Naive UTC, matching how timestamps are stored
+        if moment.dt.tz is not None:
+            moment = moment.dt.tz_convert(None)
+
+        frame = pd.DataFrame({
+            'topic': chunk["topic"].fillna(""),
+            'source': chunk["source"].fillna(""),
+            'article_count': 1,
+            'score_sum': chunk["sentiment_score"].astype("float64"),
+            'score_sq_sum': chunk["sentiment_score"].astype("float64") ** 2
+        })[moment.notna()]
+        moment = moment[moment.notna()]
+
+        return [
+            frame.assign(granularity=granularity, bucket_start=moment.dt.floor(ROLLUP_GRANULARITIES[granularity]))
+            .groupby(["granularity", "topic", "source", "bucket_start"], as_index=False)
+            .sum()
+            for granularity in granularities
+        ]
+
+    @staticmethod
+    def compute_rollups(chunk_size=REBUILD_CHUNK_SIZE):
+        """
+        Recompute hourly and daily rollups from the Article table and the
+        archive files.
+
+        Articles are read in chunks; each chunk is bucketed and grouped
+        with vectorized pandas operations and partial sums are merged, so
+        memory is bounded by the chunk size plus the number of buckets.
+
+        Args:
+            chunk_size (int): Article rows per chunk.
+
+        Returns:
+            pandas.DataFrame: Columns granularity, topic, source,
+            bucket_start, article_count, score_sum, score_sq_sum.
+
+        Notes:
+            Archived articles only contribute daily rollups; hourly ones
+            are compacted away when a month is archived.
+        """
+
+        import pandas as pd
+
+        stmt = select(
+            Article.topic, Article.source, Article.sentiment_score,
+            Article.published_at, Article.created_at
+        ).where(Article.sentiment_score.isnot(None))
+
+        keys = ["granularity", "topic", "source", "bucket_start"]
+        partials = []
+
+        for chunk in pd.read_sql(stmt, db.session.connection(), chunksize=chunk_size):
+            partials.extend(AggregateService._rollup_partials(chunk, ROLLUP_GRANULARITIES))
+
+        for chunk in ArchiveService.read_frames(
+            ArchiveService.files(), ("topic", "source", "sentiment_score", "published_at", "created_at")
+        ):
+            chunk = chunk[chunk["sentiment_score"].notna()]
+            partials.extend(AggregateService._rollup_partials(chunk, ("day",)))
+
+        if not partials:
+            return pd.DataFrame(columns=keys + ["article_count", "score_sum", "score_sq_sum"])
+
+        return pd.concat(partials).groupby(keys, as_index=False).sum()
+
+    @staticmethod
+    def rebuild_rollups(chunk_size=REBUILD_CHUNK_SIZE):
+        """
+        Replace the SentimentRollup table with values recomputed from Article.
+
+        Args:
+            chunk_size (int): Article rows per chunk.
+
+        Returns:
+            int: Number of rollup rows written.
+        """
+
+        rollups = AggregateService.compute_rollups(chunk_size)
+
+        db.session.execute(delete(SentimentRollup))
+
+        records = [
+            {
+                'granularity': row.granularity,
+                'topic': row.topic,
+                'source': row.source,
+                'bucket_start': row.bucket_start.to_pydatetime(),
+                'article_count': int(row.article_count),
+                'score_sum': float(row.score_sum),
+                'score_sq_sum': float(row.score_sq_sum)
+            }
+            for row in rollups.itertuples(index=False)
+        ]
+        for start in range(0, len(records), chunk_size):
+            db.session.execute(insert(SentimentRollup), records[start:start + chunk_size])
+
+        DataVersion.bump()
+        db.session.commit()
+
+        return len(records)
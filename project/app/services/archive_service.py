@@ -0,0 +1,659 @@
+"""
+archive_service.py
+
+Retention for the Article table: old articles move to compressed monthly
+archive files that stay queryable without being loaded back.
+
+Responsibilities:
+    - Move articles published before a cutoff (whole months) into archive
+      files, one transaction per chunk: write the files, keep the
+      articles' dedup keys, delete the articles, register the files
+    - Compact hourly rollups of archived months; daily rollups per
+      (topic, source) are kept, so trends and stored source metrics
+      still cover the archived period
+    - Vacuum the live database afterwards
+    - Read archive files on demand for historical date ranges
+      (BiasService) and aggregate rebuilds (AggregateService)
+
+Layout:
+    ARCHIVE_DIR/YYYY-MM/articles-<first id>.ndjson.gz   (gzipped NDJSON)
+    ARCHIVE_DIR/YYYY-MM/articles-<first id>.parquet     (requires pyarrow)
+
+    Articles are filed by publication month (published_at, falling back
+    to created_at). Each chunk writes one file per month it contains.
+
+Position in Pipeline:
+    Article → ArchiveService → archive files (+ ArchiveFile manifest) → BiasService / AggregateService
+
+Notes:
+    - Files are written to a temporary name, fsynced and renamed before
+      the transaction that registers them; only registered files are
+      read, so an interrupted run never double counts. A rerun writes
+      the same file names and overwrites such leftovers
+    - SourceMetric keeps counting archived articles: archiving does not
+      change the unfiltered dashboard
+    - Archived articles are no longer listed by /articles or rescored by
+      backfills. Their title hash, story and MinHash signature stay in
+      ArchivedArticle / ArchivedLshBucket: a provider returning one is
+      not stored again, and new copies join its story
+    - Files are only read for date ranges that reach into archived
+      months (and rebuilds). All-time metrics come from SourceMetric and
+      ArchivedArticle (topic, source, score, story), so requests without
+      a date range do not get slower as more months are archived
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, func, insert, select, text, update
+
+from app import db
+from app.models.archive_file import ArchiveFile
+from app.models.archived_article import ArchivedArticle
+from app.models.article import Article
+from app.models.data_version import DataVersion
+from app.models.sentiment_rollup import SentimentRollup
+from app.services.dedup_service import DedupService
+from app.services.export_service import _pyarrow
+
+
+# Archived columns, in file order (minhash is derivable from the text)
+ARCHIVE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.description,
+    Article.source,
+    Article.topic,
+    Article.sentiment_score,
+    Article.sentiment_label,
+    Article.published_at,
+    Article.created_at,
+    Article.story_id,
+    Article.scorer_version,
+    Article.label_version
+)
+
+FORMATS = {'ndjson': "ndjson.gz", 'parquet': "parquet"}
+
+# Rows per DataFrame when reading NDJSON archives
+READ_CHUNK_SIZE = 100_000
+
+# Per-group sums returned by source_sums()
+SUM_COLUMNS = ["article_count", "score_sum", "score_sq_sum"]
+
+# Timestamp used to file an article: publication time, else storage time
+ARTICLE_MOMENT = func.coalesce(Article.published_at, Article.created_at)
+
+
+class ArchiveService:
+    """
+    ArchiveService
+
+    Static helpers to archive old articles and query the archive files.
+    """
+
+    @staticmethod
+    def directory():
+        """Archive root (ARCHIVE_DIR, default <instance>/archive)."""
+
+        return current_app.config['ARCHIVE_DIR'] or os.path.join(
+            current_app.instance_path, "archive"
+        )
+
+    @staticmethod
+    def month_start(moment):
+        return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+
+    @staticmethod
+    def cutoff(days, now=None):
+        """
+        Start of the oldest month that is kept in the live table.
+
+        Args:
+            days (int): Minimum article age to archive, in days.
+            now (datetime, optional): Reference time (default utcnow).
+
+        Returns:
+            datetime: First day of the month containing now - days; every
+            article published before it is archived.
+        """
+
+        return ArchiveService.month_start((now or datetime.utcnow()) - timedelta(days=days))
+
+    @staticmethod
+    def pending(cutoff):
+        """Count live articles that archive(cutoff) would move."""
+
+        return db.session.scalar(
+            select(func.count()).select_from(Article).where(ARTICLE_MOMENT < cutoff)
+        )
+
+    @staticmethod
+    def _record(row):
+        """JSON-compatible dict for an archived row (datetimes in ISO 8601)."""
+
+        record = {}
+        for column, value in zip(ARCHIVE_COLUMNS, row):
+            record[column.key] = value.isoformat() if isinstance(value, datetime) else value
+
+        return record
+
+    @staticmethod
+    def _arrow_table(pa, rows):
+        schema = pa.schema([
+            ("id", pa.int64()),
+            ("title", pa.string()),
+            ("description", pa.string()),
+            ("source", pa.string()),
+            ("topic", pa.string()),
+            ("sentiment_score", pa.float64()),
+            ("sentiment_label", pa.string()),
+            ("published_at", pa.timestamp("us")),
+            ("created_at", pa.timestamp("us")),
+            ("story_id", pa.int64()),
+            ("scorer_version", pa.string()),
+            ("label_version", pa.string())
+        ])
+        columns = list(zip(*rows))
+
+        return pa.table(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema
+        )
+
+    @staticmethod
+    def write_file(path, fmt, rows):
+        """
+        Write archived rows to a file, atomically and durably.
+
+        Args:
+            path (str): Destination path.
+            fmt (str): "ndjson" or "parquet".
+            rows (list[tuple]): Values in ARCHIVE_COLUMNS order.
+
+        Raises:
+            ExportUnavailable: Parquet requested without pyarrow.
+        """
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+
+        with open(tmp, "wb") as handle:
+            if fmt == "parquet":
+                pa = _pyarrow()
+                pa.parquet.write_table(ArchiveService._arrow_table(pa, rows), handle, compression="zstd")
+            else:
+                with gzip.GzipFile(fileobj=handle, mode="wb") as compressed:
+                    for row in rows:
+                        compressed.write((json.dumps(ArchiveService._record(row)) + "\n").encode("utf-8"))
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        os.replace(tmp, path)
+
+    @staticmethod
+    def archive(cutoff, fmt="ndjson", chunk_size=50_000, on_progress=None):
+        """
+        Move every article published before the cutoff into archive files.
+
+        Args:
+            cutoff (datetime): Articles whose published_at (or created_at)
+                is earlier are archived; see cutoff().
+            fmt (str): "ndjson" or "parquet".
+            chunk_size (int): Articles per transaction.
+            on_progress (callable, optional): Called with the running
+                totals after each committed chunk.
+
+        Returns:
+            dict: archived (articles), files, chunks and rollups_compacted
+            (hourly rollup rows dropped).
+
+        Raises:
+            ValueError: Unknown format.
+            ExportUnavailable: Parquet requested without pyarrow.
+            RuntimeError: The delete did not match the archived rows
+                (the chunk is rolled back).
+
+        Notes:
+            Chunks are read in id order with a keyset on id, so the
+            whole run is one pass over the primary key.
+        """
+
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown archive format: {fmt!r}")
+        if fmt == "parquet":
+            _pyarrow()
+
+        directory = ArchiveService.directory()
+        totals = {'archived': 0, 'files': 0, 'chunks': 0}
+        last_id = 0
+
+        while True:
+            stmt = (
+                select(*ARCHIVE_COLUMNS, Article.title_hash, Article.minhash)
+                .where(Article.id > last_id, ARTICLE_MOMENT < cutoff)
+                .order_by(Article.id)
+                .limit(chunk_size)
+            )
+            rows = db.session.execute(stmt).all()
+            if not rows:
+                break
+
+            first_id, last_id = rows[0].id, rows[-1].id
+
+            months = {}
+            for row in rows:
+                moment = row.published_at or row.created_at
+                months.setdefault(ArchiveService.month_start(moment), []).append(row[:-2])
+
+            entries = []
+            for month, month_rows in sorted(months.items()):
+                path = os.path.join(f"{month:%Y-%m}", f"articles-{month_rows[0][0]}.{FORMATS[fmt]}")
+                ArchiveService.write_file(os.path.join(directory, path), fmt, month_rows)
+                entries.append({
+                    'path': path,
+                    'month': month,
+                    'format': fmt,
+                    'row_count': len(month_rows),
+                    'first_id': month_rows[0][0],
+                    'last_id': month_rows[-1][0]
+                })
+
+            # Archived headlines keep blocking re-inserts, stay
+            # near-duplicate candidates and count in all-time metrics
+            db.session.execute(insert(ArchivedArticle), [
+                {
+                    'id': row.id,
+                    'title_hash': row.title_hash,
+                    'story_id': row.story_id,
+                    'minhash': row.minhash,
+                    'topic': row.topic,
+                    'source': row.source,
+                    'sentiment_score': row.sentiment_score
+                }
+                for row in rows
+            ])
+            DedupService.archive_articles(rows)
+
+            # Same predicate as the select: ids in the chunk's range that
+            # are newer than the cutoff stay live
+            deleted = db.session.execute(
+                delete(Article).where(
+                    Article.id.between(first_id, last_id), ARTICLE_MOMENT < cutoff
+                ).execution_options(synchronize_session=False)
+            ).rowcount
+            if deleted != len(rows):
+                db.session.rollback()
+                raise RuntimeError(
+                    f"archived {len(rows)} articles but {deleted} matched the delete "
+                    f"(ids {first_id}-{last_id}); nothing was committed"
+                )
+
+            db.session.execute(insert(ArchiveFile), entries)
+            DataVersion.bump()
+            db.session.commit()
+
+            totals['archived'] += len(rows)
+            totals['files'] += len(entries)
+            totals['chunks'] += 1
+            if on_progress:
+                on_progress(dict(totals))
+
+        totals['rollups_compacted'] = ArchiveService.compact_rollups(cutoff)
+
+        return totals
+
+    @staticmethod
+    def compact_rollups(cutoff):
+        """
+        Drop hourly rollups before the cutoff, keeping the daily ones.
+
+        Args:
+            cutoff (datetime): Archive cutoff (see cutoff()).
+
+        Returns:
+            int: Rollup rows deleted.
+        """
+
+        deleted = db.session.execute(
+            delete(SentimentRollup).where(
+                SentimentRollup.granularity == "hour", SentimentRollup.bucket_start < cutoff
+            )
+        ).rowcount
+        DataVersion.bump()
+        db.session.commit()
+
+        return deleted
+
+    @staticmethod
+    def vacuum():
+        """
+        Reclaim space freed by archiving and refresh planner statistics.
+
+        SQLite: VACUUM, then truncate the write-ahead log. PostgreSQL:
+        VACUUM ANALYZE on the article and LSH tables. Both run outside a
+        transaction on a dedicated connection to the primary database.
+
+        Returns:
+            bool: Whether the database supports vacuuming here.
+        """
+
+        engine = db.engine
+        if engine.dialect.name == "sqlite":
+            statements = ["VACUUM", "PRAGMA wal_checkpoint(TRUNCATE)"]
+        elif engine.dialect.name == "postgresql":
+            statements = ["VACUUM ANALYZE article", "VACUUM ANALYZE article_lsh_buckets"]
+        else:
+            return False
+
+        # Release the session's connection so VACUUM is not blocked by it
+        db.session.commit()
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for statement in statements:
+                connection.execute(text(statement))
+
+        return True
+
+    @staticmethod
+    def backfill_archived_articles(on_progress=None):
+        """
+        Copy topic, source and score into ArchivedArticle rows archived
+        before it stored them.
+
+        Reads every archive file once, and only when such rows exist: a
+        row with none of the three set is taken as not yet filled.
+
+        Args:
+            on_progress (callable, optional): Called with the running
+                totals after each committed frame.
+
+        Returns:
+            dict: updated (rows filled) and chunks (transactions).
+        """
+
+        missing = set(db.session.scalars(
+            select(ArchivedArticle.id).where(
+                ArchivedArticle.topic.is_(None),
+                ArchivedArticle.source.is_(None),
+                ArchivedArticle.sentiment_score.is_(None)
+            )
+        ))
+        totals = {'updated': 0, 'chunks': 0}
+        if not missing:
+            return totals
+
+        for frame in ArchiveService.read_frames(
+            ArchiveService.files(), ("id", "topic", "source", "sentiment_score")
+        ):
+            frame = frame[frame["id"].isin(missing)]
+            if frame.empty:
+                continue
+
+            # NaN (missing in the file) -> NULL
+            frame = frame.astype(object).where(frame.notna(), None)
+            db.session.execute(update(ArchivedArticle), frame.to_dict("records"))
+            db.session.commit()
+
+            totals['updated'] += len(frame)
+            totals['chunks'] += 1
+            if on_progress:
+                on_progress(dict(totals))
+
+        return totals
+
+    @staticmethod
+    def files(start=None, end=None):
+        """
+        Registered archive files whose month overlaps a date range.
+
+        Args:
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+
+        Returns:
+            list[ArchiveFile]: Ordered by month and path.
+        """
+
+        stmt = select(ArchiveFile).order_by(ArchiveFile.month, ArchiveFile.path)
+        if start is not None:
+            stmt = stmt.where(ArchiveFile.month >= ArchiveService.month_start(start))
+        if end is not None:
+            stmt = stmt.where(ArchiveFile.month < end)
+
+        return list(db.session.scalars(stmt))
+
+    @staticmethod
+    def read_frames(files, columns):
+        """
+        Read archive files as DataFrames.
+
+        Args:
+            files (list[ArchiveFile]): Output of files().
+            columns (tuple[str]): Columns to return.
+
+        Yields:
+            pandas.DataFrame: One frame per Parquet file, or per
+            READ_CHUNK_SIZE lines of an NDJSON file. Timestamps are
+            datetime64 in both cases.
+
+        Raises:
+            ExportUnavailable: A Parquet file is registered but pyarrow
+                is not installed.
+        """
+
+        import pandas as pd
+
+        directory = ArchiveService.directory()
+        columns = list(columns)
+
+        for entry in files:
+            path = os.path.join(directory, entry.path)
+
+            if entry.format == "parquet":
+                frames = [_pyarrow().parquet.read_table(path, columns=columns).to_pandas()]
+            else:
+                frames = pd.read_json(
+                    path, lines=True, compression="gzip", chunksize=READ_CHUNK_SIZE,
+                    dtype=False, convert_dates=False
+                )
+
+            for frame in frames:
+                frame = frame[columns]
+                for name in ("published_at", "created_at"):
+                    if name in columns:
+                        frame[name] = pd.to_datetime(frame[name], format="ISO8601")
+                yield frame
+
+    @staticmethod
+    def _matching(frame, topic=None, start=None, end=None):
+        """Rows of an archive frame matching BiasService's article filters."""
+
+        import pandas as pd
+
+        mask = pd.Series(True, index=frame.index)
+        if topic:
+            mask &= frame["topic"] == topic
+        if start is not None:
+            mask &= frame["published_at"] >= start
+        if end is not None:
+            mask &= frame["published_at"] < end
+
+        return frame[mask]
+
+    @staticmethod
+    def count_articles(topic=None, start=None, end=None, files=None):
+        """
+        Count archived articles matching the filters.
+
+        Args:
+            topic, start, end: As BiasService.count_articles().
+            files (list[ArchiveFile], optional): Files to read (default:
+                those overlapping the range).
+
+        Returns:
+            int: Number of matching archived articles.
+        """
+
+        if files is None:
+            files = ArchiveService.files(start, end)
+
+        return sum(
+            len(ArchiveService._matching(frame, topic, start, end))
+            for frame in ArchiveService.read_frames(files, ("topic", "published_at"))
+        )
+
+    @staticmethod
+    def stories(topic=None, start=None, end=None, files=None):
+        """
+        Story keys (story_id, falling back to id) of matching archived articles.
+
+        Args:
+            topic, start, end: As BiasService.count_articles().
+            files (list[ArchiveFile], optional): Files to read (default:
+                those overlapping the range).
+
+        Returns:
+            set[int]: Distinct story keys, to be merged with live ones.
+        """
+
+        if files is None:
+            files = ArchiveService.files(start, end)
+
+        keys = set()
+        for frame in ArchiveService.read_frames(files, ("id", "topic", "published_at", "story_id")):
+            frame = ArchiveService._matching(frame, topic, start, end)
+            keys.update(frame["story_id"].fillna(frame["id"]).astype("int64").tolist())
+
+        return keys
+
+    @staticmethod
+    def source_sums(topic=None, start=None, end=None, syndication=None, files=None):
+        """
+        Sum archived sentiment scores per source for a date range.
+
+        Args:
+            topic, start, end, syndication: As BiasService.query_source_metrics().
+            files (list[ArchiveFile], optional): Files to read (default:
+                those overlapping the range).
+
+        Returns:
+            pandas.DataFrame: Columns source ("" for none), article_count,
+            score_sum and score_sq_sum, plus story (story_id, falling back
+            to id) when syndication is "weight" so copies can be counted
+            together with live articles. When syndication is "collapse"
+            there is one row per story, its lowest matching id (column id),
+            so the first copy can be chosen together with live articles.
+        """
+
+        import pandas as pd
+
+        if files is None:
+            files = ArchiveService.files(start, end)
+
+        keys = {
+            'weight': ["source", "story"],
+            'collapse': ["source", "story", "id"]
+        }.get(syndication, ["source"])
+        partials = []
+
+        for frame in ArchiveService.read_frames(
+            files, ("id", "topic", "source", "sentiment_score", "published_at", "story_id")
+        ):
+            frame = ArchiveService._matching(frame, topic, start, end)
+            frame = frame[frame["sentiment_score"].notna()]
+
+            score = frame["sentiment_score"].astype("float64")
+            partial = pd.DataFrame({
+                'source': frame["source"].fillna(""),
+                'story': frame["story_id"].fillna(frame["id"]).astype("int64"),
+                'id': frame["id"].astype("int64"),
+                'article_count': 1,
+                'score_sum': score,
+                'score_sq_sum': score * score
+            })
+            if syndication == "collapse":
+                partials.append(ArchiveService.first_copies(partial)[keys + SUM_COLUMNS])
+            else:
+                partials.append(partial.groupby(keys, as_index=False)[SUM_COLUMNS].sum())
+
+        if not partials:
+            return pd.DataFrame(columns=keys + SUM_COLUMNS)
+
+        if syndication == "collapse":
+            return ArchiveService.first_copies(pd.concat(partials))
+
+        return pd.concat(partials).groupby(keys, as_index=False).sum()
+
+    @staticmethod
+    def first_copies(frame):
+        """Keep the row with the lowest id of each story in a source_sums() frame."""
+
+        return frame.sort_values("id").drop_duplicates("story")
+
+    @staticmethod
+    def score_counts(topic=None, start=None, end=None, files=None):
+        """
+        Count archived articles per (source, score) for bootstrapping.
+
+        Returns:
+            pandas.DataFrame: Columns source ("" for none), score and count.
+        """
+
+        import pandas as pd
+
+        if files is None:
+            files = ArchiveService.files(start, end)
+
+        partials = []
+        for frame in ArchiveService.read_frames(files, ("topic", "source", "sentiment_score", "published_at")):
+            frame = ArchiveService._matching(frame, topic, start, end)
+            frame = frame[frame["sentiment_score"].notna()]
+            partials.append(
+                pd.DataFrame({
+                    'source': frame["source"].fillna(""),
+                    'score': frame["sentiment_score"].astype("float64"),
+                    'count': 1
+                }).groupby(["source", "score"], as_index=False).sum()
+            )
+
+        if not partials:
+            return pd.DataFrame(columns=["source", "score", "count"])
+
+        return pd.concat(partials).groupby(["source", "score"], as_index=False).sum()
+
+    @staticmethod
+    def source_aggregates():
+        """
+        Per-(topic, source) running sums over every archived article.
+
+        Returns:
+            dict: (topic, source) -> (count, score_sum, score_sq_sum), keyed
+            like AggregateService.compute_source_aggregates().
+        """
+
+        import pandas as pd
+
+        partials = []
+        for frame in ArchiveService.read_frames(ArchiveService.files(), ("topic", "source", "sentiment_score")):
+            frame = frame[frame["sentiment_score"].notna()]
+            score = frame["sentiment_score"].astype("float64")
+            partials.append(pd.DataFrame({
+                'topic': frame["topic"].fillna(""),
+                'source': frame["source"].fillna(""),
+                'article_count': 1,
+                'score_sum': score,
+                'score_sq_sum': score * score
+            }).groupby(["topic", "source"], as_index=False).sum())
+
+        if not partials:
+            return {}
+
+        totals = pd.concat(partials).groupby(["topic", "source"], as_index=False).sum()
+
+        return {
+            (row.topic, row.source): (int(row.article_count), float(row.score_sum), float(row.score_sq_sum))
+            for row in totals.itertuples(index=False)
+        }
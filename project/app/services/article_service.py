@@ -0,0 +1,185 @@
+"""
+article_service.py
+
+Read-side access to stored articles for the explorer and JSON API.
+
+Responsibilities:
+    - Apply optional topic / source / sentiment label filters
+    - Keyset (cursor) pagination ordered by (created_at, id), newest first
+    - Constant-memory iteration over large result sets for streaming
+
+Notes:
+    - Keyset pagination seeks directly to the cursor position through the
+      (created_at, id) indexes, so page N costs the same as page 1
+    - Queries select plain columns instead of ORM entities to avoid
+      identity-map overhead on large reads
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from sqlalchemy import select, tuple_
+
+from app import db
+from app.models.article import Article
+
+
+# Columns returned for each article row
+ARTICLE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.description,
+    Article.source,
+    Article.topic,
+    Article.sentiment_score,
+    Article.sentiment_label,
+    Article.published_at,
+    Article.created_at
+)
+
+
+class ArticleService:
+    """
+    ArticleService
+
+    Provides static utilities for filtered, paginated reads of Article data.
+    """
+
+    @staticmethod
+    def encode_cursor(row):
+        """
+        Encode the position after a row as an opaque, URL-safe cursor.
+
+        Args:
+            row: Article row with created_at and id.
+
+        Returns:
+            str: Cursor token for the next page.
+        """
+
+        raw = f"{row.created_at.isoformat()}|{row.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(token):
+        """
+        Decode a cursor produced by encode_cursor().
+
+        Args:
+            token (str): Cursor token.
+
+        Returns:
+            tuple: (created_at, id)
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+
+        try:
+            raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+            created_at, article_id = raw.rsplit("|", 1)
+            return datetime.fromisoformat(created_at), int(article_id)
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise ValueError(f"invalid cursor: {token!r}") from exc
+
+    @staticmethod
+    def filtered_query(topic=None, source=None, label=None):
+        """
+        Build a column SELECT over Article with optional filters.
+
+        Args:
+            topic (str, optional): Exact topic match.
+            source (str, optional): Exact source match.
+            label (str, optional): Sentiment label (Positive/Neutral/Negative).
+
+        Returns:
+            sqlalchemy.sql.Select: Unordered statement.
+        """
+
+        stmt = select(*ARTICLE_COLUMNS)
+
+        if topic:
+            stmt = stmt.where(Article.topic == topic)
+        if source:
+            stmt = stmt.where(Article.source == source)
+        if label:
+            stmt = stmt.where(Article.sentiment_label == label)
+
+        return stmt
+
+    @staticmethod
+    def page(topic=None, source=None, label=None, cursor=None, limit=50):
+        """
+        Fetch one page of articles, newest first.
+
+        Args:
+            topic / source / label (str, optional): Filters.
+            cursor (str, optional): Token from a previous page's next_cursor.
+            limit (int): Maximum rows per page.
+
+        Returns:
+            tuple: (rows, next_cursor) where next_cursor is None on the
+            last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+
+        stmt = ArticleService.filtered_query(topic, source, label)
+
+        if cursor:
+            created_at, article_id = ArticleService.decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(Article.created_at, Article.id) < (created_at, article_id)
+            )
+
+        # Fetch one extra row to learn whether another page exists
+        stmt = stmt.order_by(Article.created_at.desc(), Article.id.desc()).limit(limit + 1)
+        rows = db.session.execute(stmt).all()
+
+        next_cursor = ArticleService.encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+
+        return rows[:limit], next_cursor
+
+    @staticmethod
+    def iter_rows(topic=None, source=None, label=None, chunk_size=1000):
+        """
+        Iterate over every matching article in keyset-sized chunks.
+
+        Only one chunk is held in memory at a time, making this suitable
+        for streaming exports of arbitrarily large tables.
+
+        Args:
+            topic / source / label (str, optional): Filters.
+            chunk_size (int): Rows fetched per query.
+
+        Yields:
+            Row: Article rows, newest first.
+        """
+
+        cursor = None
+        while True:
+            rows, cursor = ArticleService.page(topic, source, label, cursor, chunk_size)
+            yield from rows
+            if cursor is None:
+                return
+
+    @staticmethod
+    def to_dict(row):
+        """
+        Serialize an article row to a JSON-compatible dict.
+
+        Args:
+            row: Article row.
+
+        Returns:
+            dict: Column values with datetimes in ISO 8601 format.
+        """
+
+        data = dict(row._mapping)
+        for field in ('published_at', 'created_at'):
+            if data[field] is not None:
+                data[field] = data[field].isoformat()
+
+        return data
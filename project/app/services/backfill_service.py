@@ -0,0 +1,326 @@
+"""
+backfill_service.py
+
+Brings stored sentiment in line with the current scoring configuration,
+and stored articles in line with newer deduplication columns.
+
+Every Article records the scorer (scorer_version) and label thresholds
+(label_version) behind its stored sentiment. Backfills select rows whose
+versions differ from the current SentimentService configuration, so an
+interrupted run resumes where it stopped simply by being run again.
+Rows upgraded from a database that predates these columns carry
+LEGACY_VERSION (see SchemaService.upgrade) and are always stale.
+
+Modes:
+    - relabel: thresholds changed, scores did not. Labels are recomputed
+      in SQL with a CASE over sentiment_score, one UPDATE per id range;
+      no rows are read into Python
+    - rescore: the scorer changed. Rows are read in keyset order by id
+      (plain rows, not ORM objects), rescored in batches, written back
+      with a bulk UPDATE by primary key, and their SourceMetric /
+      SentimentRollup contributions are swapped in the same transaction
+
+Each chunk is its own short transaction that also bumps the data version,
+so the dashboard keeps serving consistent (if partly old) data during a
+backfill and picks up each chunk as it commits.
+
+Stories:
+    Rows stored before near-duplicate detection have no minhash or
+    story_id and no LshBucket entries, so they are never grouped with
+    their syndicated copies. stories() runs them through
+    DedupService.index_articles in id order, the same call ingest makes,
+    so the earliest copy of each story becomes its story_id and later
+    ingests match against them.
+
+Title hashes:
+    Rows stored before Article.title_hash existed have none, so ingest
+    does not recognize them and stores their headlines again.
+    title_hashes() hashes those rows in id order; SchemaService.upgrade
+    runs it after adding the column and before creating the unique
+    index. Rows whose headline was already stored keep a NULL hash (the
+    earlier copy carries it), so the index can be created without
+    deleting data.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+from flask import current_app
+from sqlalchemy import func, or_, select, update
+
+from app import db
+from app.models.article import Article
+from app.models.data_version import DataVersion
+from app.services.aggregate_service import AggregateService
+from app.services.dedup_service import DedupService
+from app.services.news_service import NewsService
+from app.services.sentiment_service import SentimentService
+
+
+class BackfillService:
+    """
+    BackfillService
+
+    Static helpers to relabel or rescore stored articles in chunks.
+    """
+
+    @staticmethod
+    def _stale(column, current):
+        return or_(column.is_(None), column != current)
+
+    @staticmethod
+    def pending(mode):
+        """
+        Count articles a backfill would still update.
+
+        Args:
+            mode (str): "relabel" or "rescore".
+
+        Returns:
+            int: Articles whose label_version (relabel) or scorer_version
+            (rescore) differs from the current configuration.
+        """
+
+        if mode == "relabel":
+            stale = BackfillService._stale(Article.label_version, SentimentService.label_version())
+        else:
+            stale = BackfillService._stale(Article.scorer_version, SentimentService.scorer_version())
+
+        return db.session.scalar(select(func.count()).select_from(Article).where(stale))
+
+    @staticmethod
+    def relabel(chunk_size=None, on_progress=None):
+        """
+        Recompute sentiment_label from sentiment_score with the current thresholds.
+
+        Args:
+            chunk_size (int, optional): Id range per UPDATE (default BACKFILL_CHUNK_SIZE).
+            on_progress (callable, optional): Called with the running
+                totals after every committed chunk.
+
+        Returns:
+            dict: updated (rows changed) and chunks (transactions).
+        """
+
+        chunk_size = chunk_size or current_app.config['BACKFILL_CHUNK_SIZE']
+        label_version = SentimentService.label_version()
+        stale = BackfillService._stale(Article.label_version, label_version)
+
+        totals = {'updated': 0, 'chunks': 0}
+
+        # Only walk the id span that still holds stale rows
+        low, high = db.session.execute(
+            select(func.min(Article.id), func.max(Article.id)).where(stale)
+        ).one()
+        if low is None:
+            return totals
+
+        stmt = (
+            update(Article)
+            .values(
+                sentiment_label=SentimentService.label_case(Article.sentiment_score),
+                label_version=label_version
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        lower = low - 1
+        while lower < high:
+            upper = lower + chunk_size
+            result = db.session.execute(
+                stmt.where(Article.id > lower, Article.id <= upper, stale)
+            )
+            if result.rowcount:
+                DataVersion.bump()
+            db.session.commit()
+
+            totals['updated'] += result.rowcount
+            totals['chunks'] += 1
+            lower = upper
+            if on_progress is not None:
+                on_progress(totals)
+
+        return totals
+
+    @staticmethod
+    def rescore(chunk_size=None, workers=None, on_progress=None):
+        """
+        Rerun the scorer over articles scored by a different scorer version.
+
+        Args:
+            chunk_size (int, optional): Articles per batch (default BACKFILL_CHUNK_SIZE).
+            workers (int, optional): Scoring processes (default
+                SENTIMENT_WORKERS; 1 scores in-process).
+            on_progress (callable, optional): Called with the running
+                totals after every committed chunk.
+
+        Returns:
+            dict: updated (rows rescored), changed (rows whose score or
+            label changed) and chunks (transactions).
+        """
+
+        config = current_app.config
+        chunk_size = chunk_size or config['BACKFILL_CHUNK_SIZE']
+        workers = workers or config['SENTIMENT_WORKERS']
+
+        scorer_version = SentimentService.scorer_version()
+        label_version = SentimentService.label_version()
+        stale = BackfillService._stale(Article.scorer_version, scorer_version)
+
+        query = select(
+            Article.id, Article.title, Article.description, Article.topic, Article.source,
+            Article.sentiment_score, Article.sentiment_label,
+            Article.published_at, Article.created_at
+        ).order_by(Article.id).limit(chunk_size)
+
+        totals = {'updated': 0, 'changed': 0, 'chunks': 0}
+
+        pool = None
+        if workers > 1:
+            # Load the lexicon once so forked workers share it
+            SentimentService.warm_up()
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            last_id = 0
+            while True:
+                rows = db.session.execute(query.where(Article.id > last_id, stale)).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+
+                scores = SentimentService.analyze_batch(
+                    [NewsService.sentiment_text(row.title, row.description) for row in rows],
+                    workers=workers, pool=pool
+                )
+
+                params = []
+                rescored = []
+                for row, (score, label) in zip(rows, scores):
+                    params.append({
+                        'id': row.id,
+                        'sentiment_score': score,
+                        'sentiment_label': label,
+                        'scorer_version': scorer_version,
+                        'label_version': label_version
+                    })
+                    rescored.append(SimpleNamespace(**dict(row._asdict(), sentiment_score=score)))
+                    if (score, label) != (row.sentiment_score, row.sentiment_label):
+                        totals['changed'] += 1
+
+                # Bulk UPDATE by primary key, plus the aggregate swap, in one transaction
+                db.session.execute(update(Article), params)
+                AggregateService.record_rescore(rows, rescored)
+                DataVersion.bump()
+                db.session.commit()
+
+                totals['updated'] += len(rows)
+                totals['chunks'] += 1
+                if on_progress is not None:
+                    on_progress(totals)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return totals
+
+    @staticmethod
+    def title_hashes(chunk_size=None, on_progress=None):
+        """
+        Hash the titles of articles stored without a title_hash.
+
+        Run by SchemaService.upgrade on databases that predate title_hash:
+        until then ingest re-inserts every headline stored before it as a
+        new article. The column must exist.
+
+        Args:
+            chunk_size (int, optional): Articles per transaction (default BACKFILL_CHUNK_SIZE).
+            on_progress (callable, optional): Called with the running
+                totals after every committed chunk.
+
+        Returns:
+            dict: updated (rows hashed), duplicates (rows left without a
+            hash because an earlier article has the same headline) and
+            chunks (transactions).
+        """
+
+        chunk_size = chunk_size or current_app.config['BACKFILL_CHUNK_SIZE']
+
+        totals = {'updated': 0, 'duplicates': 0, 'chunks': 0}
+
+        query = select(Article.id, Article.title).where(
+            Article.title_hash.is_(None)
+        ).order_by(Article.id).limit(chunk_size)
+
+        last_id = 0
+        while True:
+            rows = db.session.execute(query.where(Article.id > last_id)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            # First copy of each headline in id order, unless already stored
+            first = {}
+            for row in rows:
+                first.setdefault(Article.hash_title(row.title), row.id)
+            existing = NewsService._existing_title_hashes(first.keys())
+
+            params = [
+                {'id': article_id, 'title_hash': title_hash}
+                for title_hash, article_id in first.items() if title_hash not in existing
+            ]
+            if params:
+                db.session.execute(update(Article), params)
+            db.session.commit()
+
+            totals['updated'] += len(params)
+            totals['duplicates'] += len(rows) - len(params)
+            totals['chunks'] += 1
+            if on_progress is not None:
+                on_progress(totals)
+
+        return totals
+
+    @staticmethod
+    def stories(chunk_size=None, on_progress=None):
+        """
+        Sign and cluster articles stored without a MinHash signature.
+
+        Args:
+            chunk_size (int, optional): Articles per transaction (default BACKFILL_CHUNK_SIZE).
+            on_progress (callable, optional): Called with the running
+                totals after every committed chunk.
+
+        Returns:
+            dict: updated (rows indexed), grouped (rows that joined an
+            earlier article's story) and chunks (transactions).
+        """
+
+        chunk_size = chunk_size or current_app.config['BACKFILL_CHUNK_SIZE']
+
+        totals = {'updated': 0, 'grouped': 0, 'chunks': 0}
+
+        query = select(Article.id, Article.title, Article.description).where(
+            Article.minhash.is_(None)
+        ).order_by(Article.id).limit(chunk_size)
+
+        last_id = 0
+        while True:
+            rows = db.session.execute(query.where(Article.id > last_id)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            stories = DedupService.index_articles([
+                (row.id, f"{row.title} {row.description or ''}") for row in rows
+            ])
+            DataVersion.bump()
+            db.session.commit()
+
+            totals['updated'] += len(rows)
+            totals['grouped'] += sum(1 for article_id, story_id in stories.items() if story_id != article_id)
+            totals['chunks'] += 1
+            if on_progress is not None:
+                on_progress(totals)
+
+        return totals
@@ -0,0 +1,310 @@
+"""
+bias_engine.py
+
+NumPy implementation of the BiasService analytics over columnar data.
+
+Instead of grouping Article objects in Python lists, the engine works on
+two parallel arrays: integer source codes and sentiment scores (plus the
+source name for each code). Grouped counts and sums are computed with
+np.bincount, so cost is a few linear passes in C regardless of how many
+sources there are.
+
+The engine also estimates uncertainty. Bias index and polarization are
+functions of per-source means, and a source with a handful of articles
+has a very noisy mean. A stratified bootstrap (resampling articles
+within each source) yields percentile confidence intervals for both.
+
+Bootstrap resampling works on per-source score histograms rather than
+raw rows. SentimentService rounds scores to two decimals, so every score
+falls on a 201-point grid over [-1, 1]; resampling n articles from a
+source is then a single multinomial draw over that grid. Each replicate
+costs O(sources x grid) instead of O(articles), and histograms can be
+produced in SQL without loading rows.
+
+Position in Pipeline:
+    Database Storage → BiasEngine / BiasService → Dashboard / API
+"""
+
+import statistics
+
+import numpy as np
+import pandas as pd
+
+
+# Score grid used for histograms: -1.00, -0.99, ..., 1.00
+GRID_STEP = 0.01
+GRID = np.round(np.arange(-1.0, 1.0 + GRID_STEP / 2, GRID_STEP), 2)
+
+# Bootstrap defaults
+BOOTSTRAP_ITERATIONS = 1000
+BOOTSTRAP_CONFIDENCE = 0.95
+
+# Replicates drawn per vectorized batch (bounds peak memory)
+BOOTSTRAP_BATCH = 100
+
+
+class BiasEngine:
+    """
+    BiasEngine
+
+    Static, vectorized counterparts of the BiasService metrics.
+
+    Results are output-compatible with the list-based BiasService code:
+    source metrics are dicts with source, avg_sentiment and article_count,
+    ordered by each source's first scored article, with means computed
+    and rounded as that code did (sequential float sums, Python round()).
+    The point estimates of bias index and polarization use the same
+    formulas too; only the bootstrap replicates are vectorized.
+    """
+
+    @staticmethod
+    def encode_sources(sources):
+        """
+        Map source names to dense integer codes.
+
+        Args:
+            sources (array-like): Source name per article (None allowed).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (codes, names) where
+            names[codes[i]] == sources[i]; names are in first-appearance order.
+        """
+
+        codes, names = pd.factorize(np.asarray(sources, dtype=object), use_na_sentinel=False)
+
+        # factorize reports missing values as NaN; keep them as None
+        names = np.asarray(names, dtype=object)
+        names[pd.isna(names)] = None
+
+        return codes.astype(np.intp), names
+
+    @staticmethod
+    def grouped_sums(codes, scores, n_sources):
+        """
+        Count, sum and sum of squares of scores per source code.
+
+        Args:
+            codes (np.ndarray): Source code per article.
+            scores (np.ndarray): Sentiment score per article; NaN is ignored.
+            n_sources (int): Number of distinct codes.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: counts, sums, sums of squares.
+        """
+
+        scores = np.asarray(scores, dtype=np.float64)
+        valid = ~np.isnan(scores)
+        if not valid.all():
+            codes, scores = codes[valid], scores[valid]
+
+        counts = np.bincount(codes, minlength=n_sources)
+        sums = np.bincount(codes, weights=scores, minlength=n_sources)
+        sums_sq = np.bincount(codes, weights=scores * scores, minlength=n_sources)
+
+        return counts, sums, sums_sq
+
+    @staticmethod
+    def source_metrics(codes, scores, names):
+        """
+        Vectorized equivalent of BiasService.compute_source_metrics().
+
+        Args:
+            codes (np.ndarray): Source code per article (see encode_sources()).
+            scores (array-like): Sentiment score per article (None/NaN
+                for unscored articles, which are ignored).
+            names (array-like): Source name for each code.
+
+        Returns:
+            list[dict]: source, avg_sentiment and article_count per source
+            with at least one scored article, in order of each source's
+            first scored article.
+
+        Notes:
+            np.bincount adds each source's weights one by one in array
+            order, the same float additions as sum() over the source's
+            scores. Means are then divided and rounded per source in
+            Python, since np.round rounds differently from round() at the
+            third decimal.
+        """
+
+        codes = np.asarray(codes, dtype=np.intp)
+        scores = np.asarray(scores, dtype=np.float64)
+        valid = ~np.isnan(scores)
+        if not valid.all():
+            codes, scores = codes[valid], scores[valid]
+
+        counts = np.bincount(codes, minlength=len(names))
+        sums = np.bincount(codes, weights=scores, minlength=len(names))
+
+        return [
+            {
+                'source': names[code],
+                'avg_sentiment': round(float(sums[code]) / int(counts[code]), 3),
+                'article_count': int(counts[code])
+            }
+            for code in pd.unique(codes).tolist()
+        ]
+
+    @staticmethod
+    def bias_index(means):
+        """
+        Spread between the most positive and most negative source means.
+
+        Args:
+            means (np.ndarray): Per-source means; replicates along leading axes.
+
+        Returns:
+            np.ndarray | float: max - min along the last axis.
+        """
+
+        means = np.asarray(means, dtype=np.float64)
+        if means.shape[-1] == 0:
+            return np.zeros(means.shape[:-1]) if means.ndim > 1 else 0.0
+
+        return means.max(axis=-1) - means.min(axis=-1)
+
+    @staticmethod
+    def polarization(means):
+        """
+        Sample standard deviation of source means.
+
+        Args:
+            means (np.ndarray): Per-source means; replicates along leading axes.
+
+        Returns:
+            np.ndarray | float: Standard deviation along the last axis
+            (0 with fewer than two sources).
+        """
+
+        means = np.asarray(means, dtype=np.float64)
+        if means.shape[-1] < 2:
+            return np.zeros(means.shape[:-1]) if means.ndim > 1 else 0.0
+
+        return means.std(axis=-1, ddof=1)
+
+    @staticmethod
+    def histograms(codes, scores, n_sources):
+        """
+        Build per-source score histograms on the 0.01 grid.
+
+        Args:
+            codes (np.ndarray): Source code per article.
+            scores (np.ndarray): Sentiment score per article; NaN is ignored.
+            n_sources (int): Number of distinct codes.
+
+        Returns:
+            np.ndarray: (n_sources, len(GRID)) article counts.
+
+        Notes:
+            Scores are snapped to the nearest grid point, which is exact for
+            scores produced by SentimentService (rounded to two decimals).
+        """
+
+        scores = np.asarray(scores, dtype=np.float64)
+        valid = ~np.isnan(scores)
+        bins = np.clip(np.rint((scores[valid] + 1.0) / GRID_STEP), 0, len(GRID) - 1).astype(np.intp)
+
+        flat = np.bincount(codes[valid] * len(GRID) + bins, minlength=n_sources * len(GRID))
+
+        return flat.reshape(n_sources, len(GRID))
+
+    @staticmethod
+    def bootstrap(histograms, iterations=BOOTSTRAP_ITERATIONS, confidence=BOOTSTRAP_CONFIDENCE,
+                  seed=None, batch=BOOTSTRAP_BATCH):
+        """
+        Stratified bootstrap confidence intervals for bias index and polarization.
+
+        Each replicate resamples every source's articles with replacement
+        (keeping its article count), recomputes the source means and then
+        the two indices. Replicates are drawn in batches of multinomial
+        draws over the score grid, so no per-article work is repeated.
+
+        Args:
+            histograms (np.ndarray): (sources, len(GRID)) counts, e.g. from
+                histograms() or BiasService.query_score_histograms().
+            iterations (int): Number of bootstrap replicates.
+            confidence (float): Two-sided confidence level.
+            seed (int, optional): Seed for reproducible intervals.
+            batch (int): Replicates per vectorized draw.
+
+        Returns:
+            dict: bias_index_ci and polarization_ci as [low, high] lists
+            (rounded to 3 decimals), plus iterations and confidence.
+        """
+
+        histograms = np.asarray(histograms, dtype=np.int64)
+        histograms = histograms[histograms.sum(axis=1) > 0]
+        counts = histograms.sum(axis=1)
+
+        if len(counts) == 0:
+            return {
+                'bias_index_ci': [0.0, 0.0],
+                'polarization_ci': [0.0, 0.0],
+                'iterations': iterations,
+                'confidence': confidence
+            }
+
+        rng = np.random.default_rng(seed)
+        pvals = histograms / counts[:, None]
+
+        bias = np.empty(iterations)
+        polarization = np.empty(iterations)
+
+        for start in range(0, iterations, batch):
+            size = min(batch, iterations - start)
+
+            # (size, sources, grid) resampled counts -> (size, sources) means
+            draws = rng.multinomial(counts, pvals, size=(size, len(counts)))
+            means = np.round(draws @ GRID / counts, 3)
+
+            bias[start:start + size] = BiasEngine.bias_index(means)
+            polarization[start:start + size] = BiasEngine.polarization(means)
+
+        tail = (1.0 - confidence) / 2 * 100
+        percentiles = (tail, 100 - tail)
+
+        return {
+            'bias_index_ci': [round(float(v), 3) for v in np.percentile(bias, percentiles)],
+            'polarization_ci': [round(float(v), 3) for v in np.percentile(polarization, percentiles)],
+            'iterations': iterations,
+            'confidence': confidence
+        }
+
+    @staticmethod
+    def analyze(codes, scores, names, iterations=BOOTSTRAP_ITERATIONS,
+                confidence=BOOTSTRAP_CONFIDENCE, seed=None):
+        """
+        Compute source metrics, both indices and their confidence intervals.
+
+        Args:
+            codes (np.ndarray): Source code per article (see encode_sources()).
+            scores (array-like): Sentiment score per article.
+            names (array-like): Source name for each code.
+            iterations (int): Bootstrap replicates (0 skips the bootstrap).
+            confidence (float): Two-sided confidence level.
+            seed (int, optional): Seed for reproducible intervals.
+
+        Returns:
+            dict: source_metrics, bias_index, polarization and, when
+            iterations > 0, bias_index_ci and polarization_ci.
+        """
+
+        codes = np.asarray(codes, dtype=np.intp)
+        scores = np.asarray(scores, dtype=np.float64)
+
+        source_metrics = BiasEngine.source_metrics(codes, scores, names)
+        means = [s['avg_sentiment'] for s in source_metrics]
+
+        result = {
+            'source_metrics': source_metrics,
+            'bias_index': round(max(means) - min(means), 3) if means else 0.0,
+            'polarization': round(statistics.stdev(means), 3) if len(means) > 1 else 0.0
+        }
+
+        if iterations:
+            result.update(BiasEngine.bootstrap(
+                BiasEngine.histograms(codes, scores, len(names)),
+                iterations=iterations, confidence=confidence, seed=seed
+            ))
+
+        return result
@@ -17,11 +17,35 @@ Position in Pipeline:
 
 The metrics produced here do not represent absolute political bias,
 but rather relative sentiment variation across sources for a given topic.
+
+Source metrics can be computed from in-memory Article lists, directly in
+the database (query_source_metrics), where grouping happens in SQL and
+Python only handles one row per source, or read from the SourceMetric
+table maintained at ingest time (stored_source_metrics). The SQL path
+can also collapse or down-weight syndicated copies of the same story.
+Archiving does not change any metric: without a date range, archived
+articles are read from ArchivedArticle (or already counted in
+SourceMetric), and date ranges that reach into archived months read the
+matching archive files (see archive_service.py) and merge them with the
+live rows. Archive files are never read for unfiltered views.
+
+In-memory computations are delegated to the NumPy BiasEngine, which
+also provides bootstrap confidence intervals for the bias index and
+polarization (confidence_intervals).
 """
 
-from collections import defaultdict
+import math
 import statistics
 
+from sqlalchemy import distinct, func, literal, select, union_all
+
+from app import db
+from app.models.archived_article import ArchivedArticle
+from app.models.article import Article
+from app.models.source_metric import SourceMetric
+from app.services.archive_service import ArchiveService
+from app.services.metrics_service import STAGE_SECONDS, MetricsService
+
 
 class BiasService:
     """
@@ -35,6 +59,7 @@ class BiasService:
     """
 
     @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_source_metrics")
     def compute_source_metrics(articles):
         """
         Compute average sentiment statistics per news source.
@@ -55,30 +80,479 @@ class BiasService:
 
         Notes:
             Articles without sentiment scores are ignored to ensure
-            statistical validity.
+            statistical validity. Grouping is vectorized by BiasEngine;
+            sources appear in order of their first article.
+        """
+
+        import numpy as np
+
+        from app.services.bias_engine import BiasEngine
+
+        scored = [article for article in articles if article.sentiment_score is not None]
+        codes, names = BiasEngine.encode_sources([article.source for article in scored])
+        scores = np.array([article.sentiment_score for article in scored], dtype=np.float64)
+
+        return BiasEngine.source_metrics(codes, scores, names)
+
+    @staticmethod
+    def _article_filters(topic=None, start=None, end=None):
+        """
+        Build WHERE conditions for optional topic and date filters.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+
+        Returns:
+            list: SQLAlchemy boolean expressions.
         """
 
-        # Group sentiment scores by source
-        source_score = defaultdict(list)
+        conditions = []
+        if topic:
+            conditions.append(Article.topic == topic)
+        if start is not None:
+            conditions.append(Article.published_at >= start)
+        if end is not None:
+            conditions.append(Article.published_at < end)
+
+        return conditions
+
+    @staticmethod
+    def _article_rows(topic=None, start=None, end=None):
+        """
+        Live articles matching the filters as a subquery.
+
+        Returns:
+            Subquery: Columns id, story (story_id, falling back to id),
+            source and score.
+        """
+
+        return select(
+            Article.id.label("id"),
+            func.coalesce(Article.story_id, Article.id).label("story"),
+            Article.source.label("source"),
+            Article.sentiment_score.label("score")
+        ).where(*BiasService._article_filters(topic, start, end)).subquery()
+
+    @staticmethod
+    def _all_time_rows(topic=None):
+        """
+        Live and archived articles as one subquery, for views without a
+        date range; archived ones come from ArchivedArticle, not the files.
+
+        Returns:
+            Subquery: Same columns as _article_rows().
+        """
+
+        selects = []
+        for model in (Article, ArchivedArticle):
+            stmt = select(
+                model.id.label("id"),
+                func.coalesce(model.story_id, model.id).label("story"),
+                model.source.label("source"),
+                model.sentiment_score.label("score")
+            )
+            if topic:
+                stmt = stmt.where(model.topic == topic)
+            selects.append(stmt)
+
+        return union_all(*selects).subquery()
+
+    @staticmethod
+    def metrics_from_sums(source, count, total, total_sq, weight=None):
+        """
+        Build a source metrics entry from running aggregates.
+
+        Args:
+            source (str): Source name.
+            count (int): Number of scored articles.
+            total (float): Sum of sentiment scores (weighted, if weight given).
+            total_sq (float): Sum of squared sentiment scores (likewise).
+            weight (float, optional): Sum of article weights; None means
+                every article has weight 1.
+
+        Returns:
+            dict: Same shape as compute_source_metrics() entries, plus
+            sentiment_stdev (sample standard deviation within the source).
+        """
+
+        if weight is None:
+            avg = total / count
+            variance = (total_sq - total * total / count) / (count - 1) if count > 1 else 0.0
+        else:
+            avg = total / weight
+            variance = (total_sq / weight - avg * avg) * count / (count - 1) if count > 1 else 0.0
+
+        return {
+            'source': source,
+            'avg_sentiment': round(avg, 3),
+            'article_count': count,
+            'sentiment_stdev': round(math.sqrt(max(variance, 0.0)), 3)
+        }
+
+    @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_query_source_metrics")
+    def query_source_metrics(topic=None, start=None, end=None, syndication=None):
+        """
+        Compute source metrics with a single GROUP BY query.
+
+        Equivalent to compute_source_metrics() over the matching articles,
+        but no Article rows are loaded: the database returns COUNT, SUM and
+        sum of squares per source.
+
+        Without a date range, plain metrics are read from SourceMetric
+        (stored_source_metrics) and syndication-aware ones are grouped
+        over live and archived articles (ArchivedArticle); archive files
+        are only read for ranges that reach into archived months.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+            syndication (str, optional): How near-duplicate story clusters
+                are treated:
+                    - None: every copy counts fully
+                    - "collapse": only the first copy (lowest id) of each
+                      story among the matching articles counts
+                    - "weight": each copy counts 1 / (copies of the story)
+
+        Returns:
+            list[dict]: Source-level metrics ordered by source name.
+        """
+
+        if start is None and end is None:
+            if syndication is None:
+                # SourceMetric running sums include archived articles
+                return BiasService.stored_source_metrics(topic)
+            return BiasService._grouped_source_metrics(BiasService._all_time_rows(topic), syndication)
+
+        files = ArchiveService.files(start, end)
+        if files:
+            conditions = [
+                Article.sentiment_score.isnot(None), *BiasService._article_filters(topic, start, end)
+            ]
+            return BiasService._merged_source_metrics(
+                conditions, topic, start, end, syndication, files
+            )
+
+        return BiasService._grouped_source_metrics(
+            BiasService._article_rows(topic, start, end), syndication
+        )
+
+    @staticmethod
+    def _grouped_source_metrics(rows, syndication=None):
+        """
+        query_source_metrics() in SQL over a subquery of articles.
+
+        Args:
+            rows (Subquery): Output of _article_rows() or _all_time_rows().
+            syndication (str, optional): As query_source_metrics().
 
-        for article in articles:
-            if article.sentiment_score is not None:
-                source_score[article.source].append(article.sentiment_score)
+        Returns:
+            list[dict]: Source-level metrics ordered by source name.
+        """
+
+        score = rows.c.score
+        conditions = [score.isnot(None)]
+
+        if syndication == "collapse":
+            firsts = select(func.min(rows.c.id)).where(*conditions).group_by(rows.c.story)
+            conditions.append(rows.c.id.in_(firsts))
+
+        if syndication == "weight":
+            copies = (
+                select(rows.c.story.label("story"), func.count().label("copies"))
+                .where(*conditions)
+                .group_by(rows.c.story)
+                .subquery()
+            )
+            weight = 1.0 / copies.c.copies
+
+            stmt = (
+                select(
+                    rows.c.source,
+                    func.count(score),
+                    func.sum(score * weight),
+                    func.sum(score * score * weight),
+                    func.sum(weight)
+                )
+                .join(copies, copies.c.story == rows.c.story)
+                .where(*conditions)
+                .group_by(rows.c.source)
+                .order_by(rows.c.source)
+            )
+
+            return [
+                BiasService.metrics_from_sums(source, count, total, total_sq, weight_sum)
+                for source, count, total, total_sq, weight_sum in db.session.execute(stmt)
+            ]
+
+        stmt = (
+            select(
+                rows.c.source,
+                func.count(score),
+                func.sum(score),
+                func.sum(score * score)
+            )
+            .where(*conditions)
+            .group_by(rows.c.source)
+            .order_by(rows.c.source)
+        )
+
+        return [
+            BiasService.metrics_from_sums(source, count, total, total_sq)
+            for source, count, total, total_sq in db.session.execute(stmt)
+        ]
+
+    @staticmethod
+    def _merged_source_metrics(conditions, topic, start, end, syndication, files):
+        """
+        query_source_metrics() over live and archived articles.
+
+        Live articles are grouped in SQL and archived ones by
+        ArchiveService, per source and, when weighting or collapsing, per
+        story (a story's copies may be split between the two), then
+        merged. Collapsing keeps the lowest id of each story across both.
+
+        Args:
+            conditions (list): WHERE conditions for live articles.
+            topic, start, end, syndication: Filters, as query_source_metrics().
+            files (list[ArchiveFile]): Archive files overlapping the range.
+
+        Returns:
+            list[dict]: Source-level metrics ordered by source name.
+        """
+
+        import pandas as pd
+
+        score = Article.sentiment_score
+        story = func.coalesce(Article.story_id, Article.id)
+        sums = ["article_count", "score_sum", "score_sq_sum"]
+
+        if syndication == "collapse":
+            firsts = select(func.min(Article.id)).where(*conditions).group_by(story)
+            stmt = select(
+                Article.source, story, Article.id, literal(1), score, score * score
+            ).where(Article.id.in_(firsts))
+            names = ["source", "story", "id"]
+        else:
+            keys, names = [Article.source], ["source"]
+            if syndication == "weight":
+                keys.append(story)
+                names.append("story")
+
+            stmt = (
+                select(*keys, func.count(score), func.sum(score), func.sum(score * score))
+                .where(*conditions)
+                .group_by(*keys)
+            )
+
+        live = pd.DataFrame([tuple(row) for row in db.session.execute(stmt)], columns=names + sums)
+        live["source"] = live["source"].fillna("")
+
+        frame = pd.concat(
+            [live, ArchiveService.source_sums(topic, start, end, syndication, files)],
+            ignore_index=True
+        )
+        frame[sums] = frame[sums].astype("float64")
+
+        if syndication == "collapse":
+            frame = ArchiveService.first_copies(frame).drop(columns=["story", "id"])
+
+        if syndication == "weight":
+            copies = frame.groupby("story")["article_count"].transform("sum")
+            frame = frame.assign(
+                score_sum=frame["score_sum"] / copies,
+                score_sq_sum=frame["score_sq_sum"] / copies,
+                weight=frame["article_count"] / copies
+            ).drop(columns="story")
+
+        return [
+            BiasService.metrics_from_sums(
+                source or None, int(row.article_count), float(row.score_sum), float(row.score_sq_sum),
+                float(row.weight) if syndication == "weight" else None
+            )
+            for source, row in frame.groupby("source").sum().iterrows()
+        ]
+
+    @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_stored_source_metrics")
+    def stored_source_metrics(topic=None):
+        """
+        Read precomputed source metrics from the SourceMetric table.
+
+        Cost is proportional to the number of (topic, source) pairs and
+        independent of how many articles are stored. Without a topic, the
+        running sums of every topic are merged per source.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+
+        Returns:
+            list[dict]: Same shape as query_source_metrics().
+        """
+
+        stmt = (
+            select(
+                SourceMetric.source,
+                func.sum(SourceMetric.article_count),
+                func.sum(SourceMetric.score_sum),
+                func.sum(SourceMetric.score_sq_sum)
+            )
+            .where(SourceMetric.article_count > 0)
+            .group_by(SourceMetric.source)
+            .order_by(SourceMetric.source)
+        )
+        if topic:
+            stmt = stmt.where(SourceMetric.topic == topic)
+
+        return [
+            BiasService.metrics_from_sums(source or None, count, total, total_sq)
+            for source, count, total, total_sq in db.session.execute(stmt)
+        ]
+
+    @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_count_articles")
+    def count_articles(topic=None, start=None, end=None, syndication=None):
+        """
+        Count stored articles matching the optional filters.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+            syndication (str, optional): As query_source_metrics(). When
+                collapsing or weighting, each story counts once (its
+                copies' weights sum to one), matching the metrics.
+
+        Returns:
+            int: Number of matching articles, or of stories.
+        """
+
+        if start is None and end is None:
+            if syndication in ("collapse", "weight"):
+                rows = BiasService._all_time_rows(topic)
+                return db.session.scalar(select(func.count(distinct(rows.c.story))))
+
+            count = 0
+            for model in (Article, ArchivedArticle):
+                stmt = select(func.count()).select_from(model)
+                if topic:
+                    stmt = stmt.where(model.topic == topic)
+                count += db.session.scalar(stmt)
+            return count
+
+        conditions = BiasService._article_filters(topic, start, end)
+        files = ArchiveService.files(start, end)
+
+        if syndication in ("collapse", "weight"):
+            story = func.coalesce(Article.story_id, Article.id)
+            if not files:
+                return db.session.scalar(select(func.count(distinct(story))).where(*conditions))
+
+            stories = set(db.session.scalars(select(story).where(*conditions).distinct()))
+            return len(stories | ArchiveService.stories(topic, start, end, files))
+
+        count = db.session.scalar(select(func.count()).select_from(Article).where(*conditions))
+        if files:
+            count += ArchiveService.count_articles(topic, start, end, files)
+
+        return count
+
+    @staticmethod
+    def query_score_histograms(topic=None, start=None, end=None):
+        """
+        Build per-source sentiment histograms with a GROUP BY query.
+
+        Scores are stored rounded to two decimals, so grouping by
+        (source, score) returns at most 201 rows per source and is enough
+        to bootstrap without loading Article rows. Archived articles come
+        from ArchivedArticle without a date range and from the archive
+        files for ranges that reach into archived months.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+
+        Returns:
+            tuple[list, np.ndarray]: Source names and a (sources, grid)
+            array of article counts, ordered by source name.
+        """
+
+        import numpy as np
+        import pandas as pd
+
+        from app.services.bias_engine import GRID, GRID_STEP
+
+        if start is None and end is None:
+            articles, files = BiasService._all_time_rows(topic), []
+        else:
+            articles = BiasService._article_rows(topic, start, end)
+            files = ArchiveService.files(start, end)
+
+        stmt = (
+            select(articles.c.source, articles.c.score, func.count())
+            .where(articles.c.score.isnot(None))
+            .group_by(articles.c.source, articles.c.score)
+            .order_by(articles.c.source)
+        )
+
+        rows = db.session.execute(stmt).all()
+
+        if files:
+            live = pd.DataFrame([tuple(row) for row in rows], columns=["source", "score", "count"])
+            merged = (
+                pd.concat([live.fillna({'source': ""}), ArchiveService.score_counts(topic, start, end, files)])
+                .groupby(["source", "score"], as_index=False)
+                .sum()
+            )
+            rows = [
+                (source or None, score, int(count))
+                for source, score, count in merged.itertuples(index=False)
+            ]
+
+        names, codes, bins, counts = [], [], [], []
+        for source, value, count in rows:
+            if not names or names[-1] != source:
+                names.append(source)
+            codes.append(len(names) - 1)
+            bins.append(value)
+            counts.append(count)
+
+        bins = np.clip(np.rint((np.asarray(bins, dtype=np.float64) + 1.0) / GRID_STEP), 0, len(GRID) - 1)
+        histograms = np.zeros((len(names), len(GRID)), dtype=np.int64)
+        np.add.at(histograms, (np.asarray(codes, dtype=np.intp), bins.astype(np.intp)), counts)
+
+        return names, histograms
+
+    @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_confidence_intervals")
+    def confidence_intervals(topic=None, start=None, end=None, iterations=1000, seed=None):
+        """
+        Bootstrap confidence intervals for bias index and polarization.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+            iterations (int): Bootstrap replicates.
+            seed (int, optional): Seed for reproducible intervals.
+
+        Returns:
+            dict: bias_index_ci and polarization_ci as [low, high] 95%
+            intervals, plus iterations and confidence.
+        """
 
-        # Compute aggregate metrics per source
-        source_metrics = []
-        for source, scores in source_score.items():
-            avg = sum(scores) / len(scores)
+        from app.services.bias_engine import BiasEngine
 
-            source_metrics.append({
-                'source': source,
-                'avg_sentiment': round(avg, 3),
-                'article_count': len(scores)
-            })
+        _, histograms = BiasService.query_score_histograms(topic, start, end)
 
-        return source_metrics
+        return BiasEngine.bootstrap(histograms, iterations=iterations, seed=seed)
 
     @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_index")
     def compute_bias_index(source_metrics):
         """
         Compute Bias Index across sources.
@@ -108,6 +582,7 @@ class BiasService:
         return round(max(values) - min(values), 3)
 
     @staticmethod
+    @MetricsService.timed(STAGE_SECONDS, stage="bias_polarization")
     def compute_polarization(source_metrics):
         """
         Compute Narrative Polarization Score.
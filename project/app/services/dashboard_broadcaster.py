@@ -0,0 +1,257 @@
+"""
+dashboard_broadcaster.py
+
+Per-process fan-out of live dashboard updates to Server-Sent Event
+streams.
+
+One background thread watches the data version (see
+models/data_version.py) while any stream is open. It is woken right
+after an ingest commits in this process and otherwise polls, so writes
+made by other processes are picked up within the poll interval. When
+the version changes, each subscribed view (normalized dashboard
+filters) is computed once and the resulting event is queued for every
+stream of that view: N open dashboards cost one computation, not N.
+
+Events:
+    - delta: totals, bias index, polarization and only the source
+      metrics that changed (plus sources that disappeared) since the
+      previous version
+    - snapshot: the full metrics, sent to a stream whose page is not at
+      the previous version (e.g. it connected late or missed events)
+"""
+
+import queue
+import threading
+
+from flask import g
+
+from app import db
+
+
+class Stream:
+    """
+    Stream
+
+    Events queued for one open connection.
+
+    Attributes:
+        key (tuple): Normalized filters of the view.
+        version (int | None): Data version the client has seen.
+    """
+
+    def __init__(self, key, version):
+        self.key = key
+        self.version = version
+        self._events = queue.Queue()
+
+    def put(self, version, kind, data):
+        self._events.put((version, kind, data))
+
+    def get(self, timeout):
+        """
+        Wait for the next event.
+
+        Returns:
+            tuple | None: (version, kind, data), or None after timeout.
+        """
+
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class DashboardBroadcaster:
+    """
+    DashboardBroadcaster
+
+    Thread-safe registry of open streams and the thread that feeds them.
+
+    Args:
+        interval (float): Seconds between data version checks.
+        max_streams (int): Open streams allowed; 0 disables live updates.
+    """
+
+    def __init__(self, interval=2.0, max_streams=100):
+        self.interval = interval
+        self.max_streams = max_streams
+        self.published = 0
+
+        self._app = None
+        self._version = None
+        self._compute = None
+
+        # key -> {'filters', 'streams', 'version', 'payload', 'delta', 'snapshot'}
+        self._views = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def configure(self, app, version, compute, interval, max_streams):
+        """
+        Bind the broadcaster to an application.
+
+        Args:
+            app (Flask): Application whose context the thread runs in.
+            version (callable): () -> current data version.
+            compute (callable): (version, key, filters) -> dashboard payload.
+            interval (float): Seconds between data version checks.
+            max_streams (int): Open streams allowed; 0 disables live updates.
+        """
+
+        with self._lock:
+            self._app = app
+            self._version = version
+            self._compute = compute
+            self.interval = interval
+            self.max_streams = max_streams
+
+    def subscribe(self, key, filters, version):
+        """
+        Open a stream for a dashboard view.
+
+        Args:
+            key (tuple): Normalized filters (DashboardService.cache_key()).
+            filters (tuple): (topic, start, end_exclusive, syndication).
+            version (int | None): Data version the client's page shows.
+
+        Returns:
+            Stream | None: The new stream, or None when the stream limit
+            is reached.
+        """
+
+        stream = Stream(key, version)
+
+        with self._lock:
+            if self.streams() >= self.max_streams:
+                return None
+
+            view = self._views.setdefault(key, {
+                'filters': filters, 'streams': set(), 'version': None,
+                'payload': None, 'delta': None, 'snapshot': None
+            })
+            view['streams'].add(stream)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dashboard-broadcaster", daemon=True)
+                self._thread.start()
+
+        self._wake.set()
+        return stream
+
+    def unsubscribe(self, stream):
+        with self._lock:
+            view = self._views.get(stream.key)
+            if view is None:
+                return
+            view['streams'].discard(stream)
+            if not view['streams']:
+                del self._views[stream.key]
+
+    def notify(self):
+        """Check the data version now instead of at the next poll."""
+
+        if self._thread is not None:
+            self._wake.set()
+
+    def streams(self):
+        return sum(len(view['streams']) for view in self._views.values())
+
+    @staticmethod
+    def delta(previous, payload):
+        """
+        Describe how a dashboard payload changed.
+
+        Args:
+            previous (dict): Payload at the previous version.
+            payload (dict): Payload at the new version.
+
+        Returns:
+            dict: total_articles, bias_index, polarization, sources
+            (metrics entries that are new or changed) and removed (source
+            names no longer present).
+        """
+
+        before = {entry['source']: entry for entry in previous['source_metrics']}
+        after = {entry['source']: entry for entry in payload['source_metrics']}
+
+        return {
+            'total_articles': payload['total_articles'],
+            'bias_index': payload['bias_index'],
+            'polarization': payload['polarization'],
+            'sources': [entry for source, entry in after.items() if before.get(source) != entry],
+            'removed': [source for source in before if source not in after]
+        }
+
+    @staticmethod
+    def snapshot(payload):
+        return {
+            'total_articles': payload['total_articles'],
+            'bias_index': payload['bias_index'],
+            'polarization': payload['polarization'],
+            'sources': payload['source_metrics']
+        }
+
+    def _refresh(self, version):
+        """Compute every subscribed view at a version and queue its events."""
+
+        with self._lock:
+            views = [(key, view) for key, view in self._views.items() if view['version'] != version]
+
+        for key, view in views:
+            payload = self._compute(version, key, view['filters'])
+
+            with self._lock:
+                previous_version, previous = view['version'], view['payload']
+                view.update(
+                    version=version,
+                    payload=payload,
+                    delta=(previous_version, self.delta(previous, payload)) if previous else None,
+                    snapshot=self.snapshot(payload)
+                )
+
+        with self._lock:
+            for view in self._views.values():
+                if view['version'] is None:
+                    continue
+
+                for stream in view['streams']:
+                    if stream.version == view['version']:
+                        continue
+                    if view['delta'] and stream.version == view['delta'][0]:
+                        stream.put(view['version'], "delta", view['delta'][1])
+                    else:
+                        stream.put(view['version'], "snapshot", view['snapshot'])
+                    stream.version = view['version']
+                    self.published += 1
+
+    def _run(self):
+        with self._app.app_context():
+            # Dashboard reads only, so the read engine may serve them
+            # (see database_service.read_only)
+            g.db_read_only = True
+
+            while True:
+                self._wake.wait(self.interval)
+                self._wake.clear()
+
+                with self._lock:
+                    if not self._views:
+                        self._thread = None
+                        return
+
+                try:
+                    self._refresh(self._version())
+                except Exception:
+                    self._app.logger.exception("Dashboard broadcast failed")
+                finally:
+                    # Do not hold a connection (or a read snapshot) between polls
+                    db.session.remove()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'streams': self.streams(),
+                'views': len(self._views),
+                'published': self.published
+            }
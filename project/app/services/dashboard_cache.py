@@ -0,0 +1,104 @@
+"""
+dashboard_cache.py
+
+Per-process cache of computed dashboard payloads and rendered pages.
+
+Entries are keyed by normalized filters and tagged with the data version
+they were computed at (see models/data_version.py). When a request sees a
+newer version, every entry is dropped at once; nothing is invalidated
+piecemeal, so a stale page can never be served after an ingest commits.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class DashboardCache:
+    """
+    DashboardCache
+
+    Thread-safe LRU of dashboard entries for a single data version.
+
+    Args:
+        maxsize (int): Maximum entries; 0 disables caching.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._entries.clear()
+            self.version = None
+
+    def _observe(self, version):
+        # Caller holds the lock
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+
+    def get(self, version, key):
+        """
+        Look up an entry computed at the given data version.
+
+        Args:
+            version (int): Current data version.
+            key (tuple): Normalized request filters.
+
+        Returns:
+            dict | None: Cached entry, or None on a miss.
+        """
+
+        with self._lock:
+            self._observe(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, version, key, entry):
+        """
+        Store an entry computed at the given data version.
+
+        Entries for an older version than the newest one seen are dropped.
+        """
+
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            if self.version is not None and version < self.version:
+                return
+            self._observe(version)
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'invalidations': self.invalidations,
+                'version': self.version
+            }
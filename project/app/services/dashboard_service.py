@@ -0,0 +1,235 @@
+"""
+dashboard_service.py
+
+Computes and caches the /dashboard payload.
+
+The dashboard is read far more often than data is written, so computed
+metrics and the rendered page are cached per process and reused until the
+data version changes (see models/data_version.py). Each request costs one
+primary-key read of the version; a matching If-None-Match costs nothing
+more, and a warm cache skips every aggregate query and the template
+render.
+
+Open dashboards receive live updates over Server-Sent Events: one
+broadcaster per process computes each watched view once per data
+version (through the same cache) and pushes deltas to every stream
+(see dashboard_broadcaster.py).
+
+Position in Pipeline:
+    BiasService → DashboardService (cache) → Dashboard route
+"""
+
+import hashlib
+import os
+
+from app.models.data_version import DataVersion
+from app.services.bias_service import BiasService
+from app.services.dashboard_broadcaster import DashboardBroadcaster
+from app.services.dashboard_cache import DashboardCache
+
+
+# Computed dashboard entries for this process
+cache = DashboardCache()
+
+# Live update streams for this process
+broadcaster = DashboardBroadcaster()
+
+# Identifies the deployed templates, so a redeploy changes every ETag
+_template_stamp = ""
+
+
+class DashboardService:
+    """
+    DashboardService
+
+    Static helpers for computing, caching and validating dashboard views.
+    """
+
+    @staticmethod
+    def configure(app):
+        """
+        Size the cache, set up live updates and fingerprint the dashboard
+        templates.
+
+        Args:
+            app (Flask): Application instance (DASHBOARD_CACHE_SIZE,
+                LIVE_POLL_INTERVAL, LIVE_MAX_STREAMS).
+        """
+
+        global _template_stamp
+
+        cache.configure(app.config['DASHBOARD_CACHE_SIZE'])
+        broadcaster.configure(
+            app,
+            version=DashboardService.current_version,
+            compute=lambda version, key, filters: DashboardService.entry(version, key, *filters)['payload'],
+            interval=app.config['LIVE_POLL_INTERVAL'],
+            max_streams=app.config['LIVE_MAX_STREAMS']
+        )
+
+        stamps = []
+        for name in ("base.html", "dashboard.html"):
+            path = os.path.join(app.root_path, app.template_folder, name)
+            try:
+                stat = os.stat(path)
+                stamps.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                stamps.append(name)
+        _template_stamp = "|".join(stamps)
+
+    @staticmethod
+    def cache_info():
+        """
+        Report dashboard cache counters.
+
+        Returns:
+            dict: hits, misses, hit_rate, size, maxsize, invalidations, version.
+        """
+
+        return cache.stats()
+
+    @staticmethod
+    def live_info():
+        """
+        Report live update counters.
+
+        Returns:
+            dict: streams (open), views (distinct filters watched) and
+            published (events queued).
+        """
+
+        return broadcaster.stats()
+
+    @staticmethod
+    def current_version():
+        return DataVersion.current()
+
+    @staticmethod
+    def subscribe(key, topic, start, end_exclusive, syndication, version):
+        """
+        Open a live update stream for a dashboard view.
+
+        Args:
+            key (tuple): Output of cache_key().
+            topic, start, end_exclusive, syndication: Filters for compute().
+            version (int | None): Data version of the client's page.
+
+        Returns:
+            Stream | None: Event stream, or None when the per-process
+            stream limit (LIVE_MAX_STREAMS) is reached.
+        """
+
+        return broadcaster.subscribe(key, (topic, start, end_exclusive, syndication), version)
+
+    @staticmethod
+    def unsubscribe(stream):
+        broadcaster.unsubscribe(stream)
+
+    @staticmethod
+    def notify():
+        """Push updates to open streams now (called after an ingest commits)."""
+
+        broadcaster.notify()
+
+    @staticmethod
+    def cache_key(topic, start, end, syndication):
+        """
+        Normalize dashboard filters into a cache key.
+
+        Args:
+            topic (str | None): Topic filter.
+            start (datetime | None): Inclusive start date.
+            end (datetime | None): Inclusive end date.
+            syndication (str | None): Near-duplicate handling.
+
+        Returns:
+            tuple[str]: Hashable, order-stable key.
+        """
+
+        return (
+            topic or "",
+            start.date().isoformat() if start else "",
+            end.date().isoformat() if end else "",
+            syndication or ""
+        )
+
+    @staticmethod
+    def etag(version, key):
+        """
+        Build the entity tag for a dashboard view.
+
+        The tag depends only on the data version, the filters and the
+        deployed templates, so every process produces the same tag for
+        the same content and proxies can revalidate against any of them.
+
+        Returns:
+            str: Hex digest (unquoted).
+        """
+
+        raw = "\x1f".join((str(version), _template_stamp, *key))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def compute(topic, start, end_exclusive, syndication):
+        """
+        Compute dashboard metrics from the database.
+
+        Args:
+            topic (str | None): Topic filter.
+            start (datetime | None): Inclusive lower bound on published_at.
+            end_exclusive (datetime | None): Exclusive upper bound.
+            syndication (str | None): "collapse", "weight" or None.
+
+        Returns:
+            dict: total_articles, source_metrics, bias_index, polarization,
+            chart_labels and chart_values.
+        """
+
+        if start is None and end_exclusive is None and syndication is None:
+            # Unfiltered: read aggregates maintained at ingest time
+            source_metrics = BiasService.stored_source_metrics(topic)
+            total_articles = sum(s['article_count'] for s in source_metrics)
+        else:
+            # Date ranges and syndication handling are aggregated in SQL
+            source_metrics = BiasService.query_source_metrics(
+                topic, start, end_exclusive, syndication
+            )
+            total_articles = BiasService.count_articles(topic, start, end_exclusive, syndication)
+
+        return {
+            'total_articles': total_articles,
+            'source_metrics': source_metrics,
+            'bias_index': BiasService.compute_bias_index(source_metrics),
+            'polarization': BiasService.compute_polarization(source_metrics),
+
+            # Data formatted for frontend chart rendering
+            'chart_labels': [s['source'] for s in source_metrics],
+            'chart_values': [s['avg_sentiment'] for s in source_metrics]
+        }
+
+    @staticmethod
+    def entry(version, key, topic, start, end_exclusive, syndication):
+        """
+        Return the cached entry for a view, computing it on a miss.
+
+        Args:
+            version (int): Data version read for this request.
+            key (tuple): Output of cache_key().
+            topic, start, end_exclusive, syndication: Filters for compute().
+
+        Returns:
+            dict: payload (compute() output) and html (rendered page, or
+            None until the first render stores it).
+        """
+
+        cached = cache.get(version, key)
+        if cached is not None:
+            return cached
+
+        cached = {
+            'payload': DashboardService.compute(topic, start, end_exclusive, syndication),
+            'html': None
+        }
+        cache.put(version, key, cached)
+
+        return cached
@@ -0,0 +1,186 @@
+"""
+database_service.py
+
+Database engine configuration for concurrent use.
+
+Responsibilities:
+    - SQLite: enable WAL journaling so dashboard reads proceed while an
+      ingest transaction is writing, set a busy timeout so concurrent
+      writers queue for the write lock instead of failing with
+      "database is locked", and relax fsync to synchronous=NORMAL
+      (durable across application crashes; WAL keeps it consistent
+      across power loss)
+    - Server databases (e.g. PostgreSQL): size the connection pool, check
+      connections before use (pre-ping) and recycle them periodically
+    - Optionally route read-only routes to a separate read engine
+      (READ_DATABASE_URL, e.g. a streaming replica)
+
+Position in Pipeline:
+    create_app → DatabaseService → SQLAlchemy engines → every service
+
+Notes:
+    - Options given in SQLALCHEMY_ENGINE_OPTIONS take precedence over
+      the computed defaults
+    - Routes opt into the read engine with @read_only. Inside them, ORM
+      queries, Core selects and session.connection() go to the read
+      engine while flushes and DML still go to the primary. A replica
+      may lag the primary slightly; cached dashboards are keyed by the
+      data version read from the same engine, so they stay consistent
+"""
+
+from functools import wraps
+
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.sql import Select
+
+
+# Bind key of the optional read engine
+READ_BIND = "read"
+
+
+def read_only(view):
+    """
+    Mark a view as read-only so its queries may use the read engine.
+
+    Args:
+        view (callable): Flask view function.
+
+    Returns:
+        callable: Wrapped view.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_read_only = True
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads from @read_only views to the read engine.
+
+    Falls back to Flask-SQLAlchemy's bind-key routing for everything
+    else, including when no read engine is configured.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and (clause is None or isinstance(clause, Select))
+            and has_app_context()
+            and g.get("db_read_only")
+        ):
+            engine = self._db.engines.get(READ_BIND)
+            if engine is not None:
+                return engine
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class DatabaseService:
+    """
+    DatabaseService
+
+    Static helpers to derive engine options from configuration and apply
+    per-connection SQLite settings.
+    """
+
+    @staticmethod
+    def is_sqlite(url):
+        return make_url(url).get_backend_name() == "sqlite"
+
+    @staticmethod
+    def engine_options(url, config):
+        """
+        Default engine options for a database URL.
+
+        Args:
+            url (str): Database URL.
+            config (dict): Application config.
+
+        Returns:
+            dict: Keyword arguments for create_engine (SQLite pragmas are
+            applied separately, per connection).
+        """
+
+        if DatabaseService.is_sqlite(url):
+            return {}
+
+        return {
+            'pool_size': config['DB_POOL_SIZE'],
+            'max_overflow': config['DB_MAX_OVERFLOW'],
+            'pool_timeout': config['DB_POOL_TIMEOUT'],
+            'pool_recycle': config['DB_POOL_RECYCLE'],
+            'pool_pre_ping': True
+        }
+
+    @staticmethod
+    def configure(app):
+        """
+        Fill in engine options and the read bind before db.init_app().
+
+        Args:
+            app (Flask): Application instance.
+        """
+
+        config = app.config
+
+        options = DatabaseService.engine_options(config['SQLALCHEMY_DATABASE_URI'], config)
+        options.update(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+        config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+        read_url = config.get('READ_DATABASE_URL')
+        if read_url:
+            binds = dict(config.get('SQLALCHEMY_BINDS') or {})
+            binds[READ_BIND] = dict(DatabaseService.engine_options(read_url, config), url=read_url)
+            config['SQLALCHEMY_BINDS'] = binds
+
+    @staticmethod
+    def sqlite_pragmas(config):
+        """
+        PRAGMA statements run on every new SQLite connection.
+
+        Args:
+            config (dict): Application config.
+
+        Returns:
+            list[str]: Statements (empty settings are left at SQLite defaults).
+        """
+
+        pragmas = [f"PRAGMA busy_timeout = {int(config['SQLITE_BUSY_TIMEOUT'])}"]
+        if config['SQLITE_JOURNAL_MODE']:
+            pragmas.append(f"PRAGMA journal_mode = {config['SQLITE_JOURNAL_MODE']}")
+        if config['SQLITE_SYNCHRONOUS']:
+            pragmas.append(f"PRAGMA synchronous = {config['SQLITE_SYNCHRONOUS']}")
+
+        return pragmas
+
+    @staticmethod
+    def init_engines(app, engines):
+        """
+        Attach per-connection settings to the app's SQLite engines.
+
+        Args:
+            app (Flask): Application instance.
+            engines (dict): db.engines for the app.
+        """
+
+        pragmas = DatabaseService.sqlite_pragmas(app.config)
+
+        def on_connect(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+        for engine in engines.values():
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", on_connect)
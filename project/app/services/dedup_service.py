@@ -0,0 +1,370 @@
+"""
+dedup_service.py
+
+Near-duplicate and syndicated article detection for NarrativeIQ.
+
+Exact title hashing (Article.title_hash) only catches identical headlines.
+Wire stories syndicated across outlets usually arrive with slightly
+different headlines and the same or similar descriptions; stored
+independently they skew per-source sentiment averages.
+
+Approach:
+    - Normalize title + description and split into character shingles
+    - Compute a MinHash signature (NUM_PERM values) per article
+    - Index signatures with banded LSH (BANDS x ROWS) in LshBucket
+    - New articles whose estimated Jaccard similarity to an LSH candidate
+      reaches SIMILARITY_THRESHOLD join that candidate's story cluster
+
+Each Article stores its signature (minhash) and story_id, the id of the
+first article seen in its cluster. BiasService can then collapse or
+down-weight syndicated copies.
+
+Archived articles keep their signature, story_id and buckets in
+ArchivedArticle / ArchivedLshBucket, so new copies of an archived story
+still join its cluster.
+
+Position in Pipeline:
+    NewsService.save_articles → DedupService → Article.story_id → BiasService
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from types import SimpleNamespace
+
+from sqlalchemy import bindparam, delete, insert, select, union_all, update
+
+from app import db
+from app.models.archived_article import ArchivedArticle
+from app.models.archived_lsh_bucket import ArchivedLshBucket
+from app.models.article import Article
+from app.models.lsh_bucket import LshBucket
+
+
+# Signature layout: BANDS * ROWS permutations. With 16 bands of 4 rows,
+# pairs with Jaccard similarity 0.5 become candidates ~65% of the time
+# and pairs at 0.8 ~99.9% of the time.
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Estimated Jaccard similarity needed to join an existing story cluster
+SIMILARITY_THRESHOLD = 0.6
+
+# Character shingle length
+SHINGLE_SIZE = 5
+
+# Buckets per IN (...) lookup
+LOOKUP_CHUNK_SIZE = 400
+
+
+@lru_cache(maxsize=None)
+def _hashing():
+    """
+    Universal hashing h(x) = (a * x + b) mod p with a Mersenne prime that
+    keeps a * x within uint64. Fixed seed: signatures must be stable
+    across processes and restarts.
+
+    Built on first use, so importing this module (and starting the app)
+    does not load NumPy.
+    """
+
+    import numpy as np
+
+    prime = np.uint64((1 << 31) - 1)
+    rng = np.random.default_rng(20240101)
+
+    return SimpleNamespace(
+        prime=prime,
+        shift=np.uint64(31),
+        a=rng.integers(1, int(prime), size=NUM_PERM, dtype=np.uint64),
+        b=rng.integers(0, int(prime), size=NUM_PERM, dtype=np.uint64),
+        # Packs a shingle's bytes into one integer (base-256 digits)
+        shingle_weights=np.array([256 ** i for i in range(SHINGLE_SIZE)], dtype=np.uint64)
+    )
+
+
+class DedupService:
+    """
+    DedupService
+
+    Provides static utilities for MinHash signatures, LSH candidate
+    lookup and story-cluster assignment.
+    """
+
+    @staticmethod
+    def shingles(text):
+        """
+        Hash the character shingles of a normalized text.
+
+        Each SHINGLE_SIZE-byte window of the lowercased, punctuation-free
+        text is packed into an integer (exact, collision-free) and reduced
+        modulo the hashing prime. Repeated shingles are kept: they do not
+        change a minimum.
+
+        Args:
+            text (str): Article title + description.
+
+        Returns:
+            numpy.ndarray: uint64 shingle hashes (< 2^31).
+        """
+
+        import numpy as np
+
+        hashing = _hashing()
+        normalized = " ".join(re.findall(r"\w+", (text or "").lower())).encode("utf-8")
+        data = np.frombuffer(normalized.ljust(SHINGLE_SIZE), dtype=np.uint8).astype(np.uint64)
+
+        windows = np.lib.stride_tricks.sliding_window_view(data, SHINGLE_SIZE)
+        return (windows @ hashing.shingle_weights) % hashing.prime
+
+    @staticmethod
+    def signature(text):
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text (str): Article title + description.
+
+        Returns:
+            numpy.ndarray: NUM_PERM uint32 minimum hash values.
+        """
+
+        import numpy as np
+
+        hashing = _hashing()
+        prime, shift = hashing.prime, hashing.shift
+        shingles = DedupService.shingles(text)
+        hashed = hashing.a[:, None] * shingles[None, :] + hashing.b[:, None]
+
+        # Reduce modulo the Mersenne prime 2^31 - 1 with shifts and masks,
+        # which is several times faster than uint64 %
+        hashed = (hashed & prime) + (hashed >> shift)
+        hashed = (hashed & prime) + (hashed >> shift)
+        hashed = np.where(hashed >= prime, hashed - prime, hashed)
+
+        return hashed.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(left, right):
+        """
+        Estimate Jaccard similarity from two signatures.
+
+        Returns:
+            float: Fraction of matching signature positions.
+        """
+
+        import numpy as np
+
+        return float(np.count_nonzero(left == right)) / NUM_PERM
+
+    @staticmethod
+    def band_keys(signature):
+        """
+        Hash each signature band to an LSH bucket.
+
+        Args:
+            signature (numpy.ndarray): Output of signature().
+
+        Returns:
+            list[tuple]: (band, bucket) pairs, one per band. Buckets are
+            signed 32-bit integers so they fit any integer column.
+        """
+
+        rows = signature.reshape(BANDS, ROWS)
+
+        return [
+            (band, zlib.crc32(rows[band].tobytes()) - (1 << 31))
+            for band in range(BANDS)
+        ]
+
+    @staticmethod
+    def _bucket_members(keys):
+        """
+        Find indexed articles in any of the given (band, bucket) pairs.
+
+        Live and archived articles are both candidates. Lookups are issued
+        per band as `band = ? AND bucket IN (...)`, which seeks on the
+        primary key prefix; a row-value IN over (band, bucket) pairs is a
+        full index scan on SQLite.
+
+        Returns:
+            dict: (band, bucket) -> list of article ids.
+        """
+
+        by_band = defaultdict(list)
+        for band, bucket in keys:
+            by_band[band].append(bucket)
+
+        members = defaultdict(list)
+
+        for band, buckets in sorted(by_band.items()):
+            for start in range(0, len(buckets), LOOKUP_CHUNK_SIZE):
+                chunk = buckets[start:start + LOOKUP_CHUNK_SIZE]
+                stmt = union_all(*(
+                    select(model.bucket, model.article_id).where(
+                        model.band == band, model.bucket.in_(chunk)
+                    )
+                    for model in (LshBucket, ArchivedLshBucket)
+                ))
+                for bucket, article_id in db.session.execute(stmt):
+                    members[(band, bucket)].append(article_id)
+
+        return members
+
+    @staticmethod
+    def _load_signatures(article_ids):
+        """
+        Load stored signatures and cluster ids.
+
+        Ids not found among live articles are looked up in ArchivedArticle.
+
+        Returns:
+            dict: article id -> (signature, story_id)
+        """
+
+        import numpy as np
+
+        article_ids = list(article_ids)
+        loaded = {}
+
+        for model in (Article, ArchivedArticle):
+            missing = [article_id for article_id in article_ids if article_id not in loaded]
+            for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                chunk = missing[start:start + LOOKUP_CHUNK_SIZE]
+                stmt = select(model.id, model.minhash, model.story_id).where(
+                    model.id.in_(chunk), model.minhash.isnot(None)
+                )
+                for article_id, minhash, story_id in db.session.execute(stmt):
+                    loaded[article_id] = (
+                        np.frombuffer(minhash, dtype=np.uint32),
+                        story_id or article_id
+                    )
+
+        return loaded
+
+    @staticmethod
+    def index_articles(articles):
+        """
+        Assign story clusters to newly inserted articles and index them.
+
+        Args:
+            articles (list[tuple]): (article_id, text) for each new article,
+                where text is title + description.
+
+        Returns:
+            dict: article id -> story_id.
+
+        Workflow:
+            1. Compute signatures and band keys for the batch
+            2. Fetch existing bucket members with one set-based lookup
+            3. Compare against candidates (stored and earlier in the batch)
+            4. Join the most similar cluster above the threshold, or start one
+            5. Persist story_id/minhash and the new bucket rows
+
+        Notes:
+            Runs inside the caller's transaction; nothing is committed here.
+        """
+
+        if not articles:
+            return {}
+
+        signatures = {
+            article_id: DedupService.signature(text) for article_id, text in articles
+        }
+        keys = {
+            article_id: DedupService.band_keys(signature)
+            for article_id, signature in signatures.items()
+        }
+
+        members = DedupService._bucket_members(
+            {key for article_keys in keys.values() for key in article_keys}
+        )
+        known = DedupService._load_signatures(
+            {article_id for ids in members.values() for article_id in ids}
+        )
+
+        stories = {}
+        for article_id, _ in articles:
+            signature = signatures[article_id]
+
+            candidates = {
+                candidate
+                for key in keys[article_id]
+                for candidate in members.get(key, ())
+            }
+
+            best_story, best_score = article_id, SIMILARITY_THRESHOLD
+            for candidate in candidates:
+                candidate_signature, candidate_story = known[candidate]
+                score = DedupService.similarity(signature, candidate_signature)
+                if score >= best_score:
+                    best_story, best_score = candidate_story, score
+
+            stories[article_id] = best_story
+
+            # Later articles in this batch can match this one
+            known[article_id] = (signature, best_story)
+            for key in keys[article_id]:
+                members[key].append(article_id)
+
+        db.session.execute(update(Article), [
+            {
+                'id': article_id,
+                'story_id': stories[article_id],
+                'minhash': signatures[article_id].tobytes()
+            }
+            for article_id, _ in articles
+        ])
+        db.session.execute(insert(LshBucket.__table__), [
+            {'band': band, 'bucket': bucket, 'article_id': article_id}
+            for article_id, article_keys in keys.items()
+            for band, bucket in article_keys
+        ])
+
+        return stories
+
+    @staticmethod
+    def archive_articles(rows):
+        """
+        Move the LSH index entries of articles about to be archived.
+
+        Bucket rows move from LshBucket to ArchivedLshBucket, so archived
+        articles stay near-duplicate candidates; their signatures are
+        read from ArchivedArticle. Old buckets are deleted by primary
+        key, recomputed from each stored signature, so no scan of the
+        index is needed.
+
+        Args:
+            rows (list): Rows with id and minhash; articles without a
+                signature were never indexed and are skipped.
+
+        Notes:
+            Runs inside the caller's transaction, after the articles'
+            ArchivedArticle rows are written and before the articles are
+            deleted; nothing is committed here.
+        """
+
+        import numpy as np
+
+        keys = [
+            (band, bucket, row.id)
+            for row in rows if row.minhash is not None
+            for band, bucket in DedupService.band_keys(np.frombuffer(row.minhash, dtype=np.uint32))
+        ]
+        if not keys:
+            return
+
+        buckets = LshBucket.__table__
+        db.session.execute(
+            delete(buckets).where(
+                buckets.c.band == bindparam("key_band"),
+                buckets.c.bucket == bindparam("key_bucket"),
+                buckets.c.article_id == bindparam("key_article")
+            ),
+            [{'key_band': band, 'key_bucket': bucket, 'key_article': article_id} for band, bucket, article_id in keys]
+        )
+        db.session.execute(insert(ArchivedLshBucket.__table__), [
+            {'band': band, 'bucket': bucket, 'article_id': article_id} for band, bucket, article_id in keys
+        ])
@@ -0,0 +1,283 @@
+"""
+export_service.py
+
+Bulk export of the Article dataset for offline analysis.
+
+Formats:
+    - csv: gzip-compressed CSV (no extra dependencies)
+    - parquet: Apache Parquet, one row group per chunk (requires pyarrow)
+    - arrow: Arrow IPC stream, one record batch per chunk (requires pyarrow)
+
+Rows are read in chunks through a streaming cursor (stream_results) and
+each chunk is encoded and written before the next one is fetched, so
+memory use is bounded by the chunk size regardless of how many articles
+match. The same writers back the `flask export-articles`
+command (to a file) and the /api/export endpoint (as a streamed
+response).
+
+pyarrow is optional: without it, Parquet and Arrow exports raise
+ExportUnavailable and CSV keeps working.
+"""
+
+import csv
+import io
+import zlib
+
+from sqlalchemy import DateTime, String, select, type_coerce
+
+from app import db
+from app.models.article import Article
+
+
+# Exported columns, in file order
+EXPORT_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.description,
+    Article.source,
+    Article.topic,
+    Article.sentiment_score,
+    Article.sentiment_label,
+    Article.published_at,
+    Article.created_at,
+    Article.story_id
+)
+
+# gzip level for CSV: level 1 is about twice as fast as the default 6 for
+# ~10% larger files, and compression dominates CSV export time
+CSV_COMPRESSLEVEL = 1
+
+FORMATS = {
+    'csv': {'extension': "csv.gz", 'mimetype': "application/gzip"},
+    'parquet': {'extension': "parquet", 'mimetype': "application/vnd.apache.parquet"},
+    'arrow': {'extension': "arrows", 'mimetype': "application/vnd.apache.arrow.stream"}
+}
+
+
+class ExportUnavailable(RuntimeError):
+    """Raised when a format needs an optional dependency that is missing."""
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ExportUnavailable(
+            "Parquet and Arrow exports require pyarrow (pip install pyarrow)"
+        ) from exc
+
+    return pyarrow
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file object that hands out what was written since the
+    last drain(), so encoders can be streamed without a temporary file.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class ExportService:
+    """
+    ExportService
+
+    Static helpers to read articles in chunks and encode them as CSV,
+    Parquet or Arrow.
+    """
+
+    @staticmethod
+    def iter_chunks(topic=None, start=None, end=None, chunk_size=10_000):
+        """
+        Read matching articles in chunks through a streaming cursor.
+
+        Args:
+            topic (str, optional): Restrict to a single topic.
+            start (datetime, optional): Inclusive lower bound on published_at.
+            end (datetime, optional): Exclusive upper bound on published_at.
+            chunk_size (int): Rows fetched per chunk.
+
+        Yields:
+            list[Row]: Up to chunk_size rows, ordered by id.
+        """
+
+        conditions = []
+        if topic:
+            conditions.append(Article.topic == topic)
+        if start is not None:
+            conditions.append(Article.published_at >= start)
+        if end is not None:
+            conditions.append(Article.published_at < end)
+
+        # Timestamps are fetched as the driver returns them (text on SQLite)
+        # instead of being parsed row by row; encoders convert them in bulk
+        columns = [
+            type_coerce(column, String).label(column.key)
+            if isinstance(column.type, DateTime) else column
+            for column in EXPORT_COLUMNS
+        ]
+
+        stmt = (
+            select(*columns)
+            .where(*conditions)
+            .order_by(Article.id)
+            .execution_options(stream_results=True, max_row_buffer=chunk_size)
+        )
+
+        # Core execution on the session's connection skips ORM row loading
+        result = db.session.connection().execute(stmt)
+        try:
+            yield from result.partitions(chunk_size)
+        finally:
+            result.close()
+
+    @staticmethod
+    def _columns(rows):
+        """Transpose a chunk of rows into per-column lists."""
+
+        return list(zip(*rows)) if rows else [() for _ in EXPORT_COLUMNS]
+
+    @staticmethod
+    def _arrow_schema(pa):
+        return pa.schema([
+            ("id", pa.int64()),
+            ("title", pa.string()),
+            ("description", pa.string()),
+            ("source", pa.string()),
+            ("topic", pa.string()),
+            ("sentiment_score", pa.float64()),
+            ("sentiment_label", pa.string()),
+            ("published_at", pa.timestamp("us")),
+            ("created_at", pa.timestamp("us")),
+            ("story_id", pa.int64())
+        ])
+
+    @staticmethod
+    def _arrow_batch(pa, schema, rows):
+        arrays = []
+        for values, field in zip(ExportService._columns(rows), schema):
+            if pa.types.is_timestamp(field.type):
+                # ISO text (SQLite) or datetimes (other drivers), cast in bulk
+                arrays.append(pa.array(values).cast(field.type))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+
+        return pa.record_batch(arrays, schema=schema)
+
+    @staticmethod
+    def encode(fmt, chunks):
+        """
+        Encode chunks of rows into a stream of bytes.
+
+        Args:
+            fmt (str): "csv", "parquet" or "arrow".
+            chunks (Iterable[list[Row]]): Output of iter_chunks().
+
+        Yields:
+            bytes: Encoded output, one piece per chunk (plus header/footer).
+
+        Raises:
+            ValueError: Unknown format.
+            ExportUnavailable: pyarrow is required but not installed.
+        """
+
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown export format: {fmt!r}")
+
+        if fmt == "csv":
+            yield from ExportService._encode_csv(chunks)
+            return
+
+        pa = _pyarrow()
+        schema = ExportService._arrow_schema(pa)
+        sink = _ChunkSink()
+
+        if fmt == "parquet":
+            writer = pa.parquet.ParquetWriter(sink, schema, compression="zstd")
+        else:
+            writer = pa.ipc.new_stream(sink, schema)
+
+        with writer:
+            for rows in chunks:
+                batch = ExportService._arrow_batch(pa, schema, rows)
+                if fmt == "parquet":
+                    # One row group per chunk
+                    writer.write_table(pa.Table.from_batches([batch]))
+                else:
+                    writer.write_batch(batch)
+                data = sink.drain()
+                if data:
+                    yield data
+
+        yield sink.drain()
+
+    @staticmethod
+    def _encode_csv(chunks):
+        # wbits=31 selects the gzip container, so the stream is a .gz file
+        compressor = zlib.compressobj(CSV_COMPRESSLEVEL, zlib.DEFLATED, 31)
+        text = io.StringIO()
+        writer = csv.writer(text)
+
+        writer.writerow([column.key for column in EXPORT_COLUMNS])
+
+        for rows in chunks:
+            # Timestamps arrive as text, or as datetimes whose str() is the
+            # same "YYYY-MM-DD HH:MM:SS[.ffffff]" form
+            writer.writerows(rows)
+
+            data = compressor.compress(text.getvalue().encode("utf-8"))
+            text.seek(0)
+            text.truncate()
+            if data:
+                yield data
+
+        yield compressor.compress(text.getvalue().encode("utf-8")) + compressor.flush()
+
+    @staticmethod
+    def export(fmt, fileobj, topic=None, start=None, end=None, chunk_size=10_000):
+        """
+        Write matching articles to a binary file object.
+
+        Args:
+            fmt (str): "csv", "parquet" or "arrow".
+            fileobj: Writable binary file object.
+            topic, start, end: Filters (see iter_chunks()).
+            chunk_size (int): Rows per chunk.
+
+        Returns:
+            dict: rows and bytes written.
+        """
+
+        counted = {'rows': 0, 'bytes': 0}
+
+        def counting(chunks):
+            for rows in chunks:
+                counted['rows'] += len(rows)
+                yield rows
+
+        chunks = counting(ExportService.iter_chunks(topic, start, end, chunk_size))
+        for data in ExportService.encode(fmt, chunks):
+            fileobj.write(data)
+            counted['bytes'] += len(data)
+
+        return counted
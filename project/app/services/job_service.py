@@ -0,0 +1,266 @@
+"""
+job_service.py
+
+Background ingestion jobs for NarrativeIQ.
+
+Submitting a topic no longer blocks the HTTP request on upstream fetches,
+sentiment scoring and the database commit. Instead the request enqueues
+an IngestJob and returns immediately; a small in-process worker pool runs
+the NewsService fetch → score → save pipeline and records progress.
+
+Responsibilities:
+    - Enqueue ingestion jobs and run them on background threads
+    - Coalesce submissions of a topic that is already queued or running
+    - Track per-job status, stage, counts and stage timings
+
+Notes:
+    - The queue lives in process memory: each server process has its own
+      workers and job registry, and jobs do not survive a restart
+    - Finished jobs are kept for JOB_HISTORY_SIZE lookups, oldest first out
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from flask import current_app
+
+from app import db
+from app.services.news_service import NewsService
+
+
+# Worker pool, created on first submission with INGEST_WORKERS threads
+_executor = None
+
+# job id -> IngestJob (insertion ordered, pruned to JOB_HISTORY_SIZE)
+_jobs = OrderedDict()
+
+# (mode, normalized topic) -> queued or running IngestJob
+_inflight = {}
+
+_lock = threading.Lock()
+
+
+class IngestJob:
+    """
+    IngestJob
+
+    Progress record for one topic ingestion.
+
+    Attributes:
+        id (str): Opaque job identifier.
+        topic (str): Topic being ingested.
+        deep (bool): Whether this is a paginated deep fetch.
+        status (str): queued, running, done or failed.
+        stage (str): Current pipeline stage (fetch, save, or stream for
+            deep fetches) while running.
+        fetched (int): Articles returned by the providers.
+        stored (int): New articles written to the database.
+        timings (dict): Seconds spent per completed stage.
+        error (str): Failure message when status is failed.
+    """
+
+    def __init__(self, topic, deep=False):
+        self.id = uuid.uuid4().hex
+        self.topic = topic
+        self.deep = deep
+        self.status = "queued"
+        self.stage = None
+        self.fetched = None
+        self.stored = None
+        self.timings = {}
+        self.error = None
+        self.submissions = 1
+        self.created_at = datetime.utcnow()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self):
+        """Serialize the job for the status endpoint."""
+
+        return {
+            'id': self.id,
+            'topic': self.topic,
+            'deep': self.deep,
+            'status': self.status,
+            'stage': self.stage,
+            'fetched': self.fetched,
+            'stored': self.stored,
+            'timings': {stage: round(seconds, 3) for stage, seconds in self.timings.items()},
+            'error': self.error,
+            'submissions': self.submissions,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class JobService:
+    """
+    JobService
+
+    Provides static utilities to enqueue and inspect ingestion jobs.
+    """
+
+    @staticmethod
+    def _topic_key(topic, deep):
+        """Normalize a topic (and fetch mode) for in-flight coalescing."""
+        return ("deep" if deep else "quick"), " ".join(topic.split()).lower()
+
+    @staticmethod
+    def _get_executor(app):
+        """Return the worker pool, creating it on first use."""
+
+        global _executor
+
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config['INGEST_WORKERS'],
+                thread_name_prefix="ingest"
+            )
+
+        return _executor
+
+    @staticmethod
+    def submit(topic, deep=False):
+        """
+        Enqueue ingestion of a topic.
+
+        If the same topic (case/whitespace-insensitive) is already queued or
+        running in the same mode, the existing job is returned instead of
+        starting another.
+
+        Args:
+            topic (str): Topic keyword to ingest.
+            deep (bool): Page through providers with NewsService.deep_ingest
+                instead of fetching a single page from each.
+
+        Returns:
+            IngestJob: The new or coalesced job.
+
+        Notes:
+            With INGEST_ASYNC disabled the job runs synchronously before
+            returning (useful for CLI use and debugging).
+        """
+
+        app = current_app._get_current_object()
+        key = JobService._topic_key(topic, deep)
+
+        with _lock:
+            job = _inflight.get(key)
+            if job is not None:
+                job.submissions += 1
+                return job
+
+            job = IngestJob(topic, deep)
+            _inflight[key] = job
+            _jobs[job.id] = job
+
+            # Forget the oldest finished jobs beyond the history bound
+            while len(_jobs) > app.config['JOB_HISTORY_SIZE']:
+                oldest = next(iter(_jobs.values()))
+                if oldest.status in ("queued", "running"):
+                    break
+                _jobs.popitem(last=False)
+
+            if app.config['INGEST_ASYNC']:
+                JobService._get_executor(app).submit(JobService._run, app, job, key)
+                return job
+
+        JobService._run(app, job, key)
+        return job
+
+    @staticmethod
+    def get(job_id):
+        """
+        Look up a job by id.
+
+        Args:
+            job_id (str): Identifier returned by submit().
+
+        Returns:
+            IngestJob | None: The job, or None if unknown or expired.
+        """
+
+        with _lock:
+            return _jobs.get(job_id)
+
+    @staticmethod
+    def _run_quick(job):
+        """
+        Fetch one page per provider, then score and save in one batch.
+
+        Args:
+            job (IngestJob): Job to execute and update.
+        """
+
+        job.stage = "fetch"
+        started = time.perf_counter()
+        articles = NewsService.fetch_all(job.topic)
+        job.timings['fetch'] = time.perf_counter() - started
+        job.fetched = len(articles)
+
+        # Scoring happens inside save_articles as one batch
+        job.stage = "save"
+        started = time.perf_counter()
+        job.stored = NewsService.save_articles(job.topic, articles)
+        job.timings['save'] = time.perf_counter() - started
+
+    @staticmethod
+    def _run_deep(job):
+        """
+        Execute a streaming deep fetch, updating counts after each commit.
+
+        Args:
+            job (IngestJob): Job to execute and update.
+        """
+
+        def progress(fetched, stored):
+            job.fetched = fetched
+            job.stored = stored
+
+        job.stage = "stream"
+        job.fetched = job.stored = 0
+
+        started = time.perf_counter()
+        NewsService.deep_ingest(job.topic, on_progress=progress)
+        job.timings['stream'] = time.perf_counter() - started
+
+    @staticmethod
+    def _run(app, job, key):
+        """
+        Execute the fetch → score → save pipeline for a job.
+
+        Args:
+            app (Flask): Application whose context the worker runs in.
+            job (IngestJob): Job to execute and update.
+            key (tuple): Coalescing key to release when finished.
+        """
+
+        with app.app_context():
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+
+            try:
+                if job.deep:
+                    JobService._run_deep(job)
+                else:
+                    JobService._run_quick(job)
+                job.status = "done"
+            except Exception as exc:
+                db.session.rollback()
+                app.logger.exception("Ingest job %s for %r failed", job.id, job.topic)
+                job.status = "failed"
+                job.error = str(exc)
+            finally:
+                job.stage = None
+                job.finished_at = datetime.utcnow()
+                job.timings['total'] = (job.finished_at - job.started_at).total_seconds()
+                db.session.remove()
+
+                with _lock:
+                    if _inflight.get(key) is job:
+                        del _inflight[key]
@@ -0,0 +1,346 @@
+"""
+metrics_service.py
+
+Pipeline instrumentation for NarrativeIQ, exposed in the Prometheus text
+exposition format on /metrics.
+
+Responsibilities:
+    - Time pipeline stages (provider fetches, sentiment scoring, the
+      duplicate-check query, inserts and commit, bias computations,
+      template rendering) into histograms
+    - Count articles fetched, dropped as duplicates and stored per provider
+    - Time HTTP requests per endpoint
+    - Render all series, plus cache statistics, as Prometheus text
+
+Position in Pipeline:
+    Every stage → MetricsService → /metrics → Prometheus scraper
+
+Notes:
+    - Disabled by default (METRICS_ENABLED). While disabled, timed()
+      wrappers and count() reduce to a flag check, and /metrics is 404
+    - Series live in process memory: with several server processes each
+      one reports its own values, so scrape every process (or aggregate
+      the per-process series in Prometheus)
+    - No client library is required; the format is produced directly
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+
+# Whether instrumentation records anything (set by configure())
+_enabled = False
+
+# Cache statistics that only grow, exposed as counters (<name>_total);
+# every other numeric statistic is a gauge
+CACHE_COUNTER_FIELDS = frozenset({
+    'hits', 'stale_hits', 'misses', 'bytes_saved', 'evictions', 'invalidations'
+})
+
+# Upper bounds (seconds) shared by every histogram; +Inf is implicit
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonic counter with a fixed set of label names.
+
+    Args:
+        name (str): Metric name (should end in _total).
+        documentation (str): HELP text.
+        labelnames (tuple[str]): Label names, in exposition order.
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self):
+        with self._lock:
+            values = sorted(self._values.items())
+
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, value in values:
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative histogram with a fixed set of label names.
+
+    Args:
+        name (str): Metric name (should end in a unit, e.g. _seconds).
+        documentation (str): HELP text.
+        labelnames (tuple[str]): Label names, in exposition order.
+        buckets (tuple[float]): Sorted upper bounds, excluding +Inf.
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels[name] for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket (non-cumulative) counts incl. +Inf, sum, count
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def collect(self):
+        with self._lock:
+            series = sorted((key, (list(b), s, c)) for key, (b, s, c) in self._series.items())
+
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+# Pipeline series
+STAGE_SECONDS = Histogram(
+    "narrativeiq_stage_duration_seconds",
+    "Time spent in each ingest and analytics stage.",
+    ("stage",)
+)
+FETCH_SECONDS = Histogram(
+    "narrativeiq_fetch_duration_seconds",
+    "Time spent fetching one page from a news provider (including cache lookups).",
+    ("provider",)
+)
+RENDER_SECONDS = Histogram(
+    "narrativeiq_render_duration_seconds",
+    "Time spent rendering page templates.",
+    ("template",)
+)
+HTTP_SECONDS = Histogram(
+    "narrativeiq_http_request_duration_seconds",
+    "HTTP request latency by endpoint.",
+    ("endpoint", "method", "status")
+)
+ARTICLES_TOTAL = Counter(
+    "narrativeiq_articles_total",
+    "Articles by provider and outcome (fetched, duplicate, stored).",
+    ("provider", "outcome")
+)
+
+REGISTRY = (STAGE_SECONDS, FETCH_SECONDS, RENDER_SECONDS, HTTP_SECONDS, ARTICLES_TOTAL)
+
+
+class MetricsService:
+    """
+    MetricsService
+
+    Static helpers to record pipeline metrics and render them for scraping.
+    """
+
+    @staticmethod
+    def configure(enabled):
+        """
+        Turn recording on or off for this process.
+
+        Args:
+            enabled (bool): Whether timers and counters record values.
+        """
+
+        global _enabled
+        _enabled = bool(enabled)
+
+    @staticmethod
+    def enabled():
+        return _enabled
+
+    @staticmethod
+    def timed(histogram, **labels):
+        """
+        Decorator recording a function's wall time into a histogram.
+
+        Args:
+            histogram (Histogram): Target series family.
+            **labels: Label values for the series.
+
+        Returns:
+            callable: Decorator. When metrics are disabled the wrapped
+            function is called directly after a single flag check.
+        """
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not _enabled:
+                    return fn(*args, **kwargs)
+
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start, **labels)
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    @contextmanager
+    def timer(histogram, **labels):
+        """
+        Context manager recording the enclosed block's wall time.
+
+        Args:
+            histogram (Histogram): Target series family.
+            **labels: Label values for the series.
+        """
+
+        if not _enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def count(counter, amount=1, **labels):
+        """
+        Increment a counter when metrics are enabled.
+
+        Args:
+            counter (Counter): Target series family.
+            amount (int): Increment (zero is skipped).
+            **labels: Label values for the series.
+        """
+
+        if _enabled and amount:
+            counter.inc(amount, **labels)
+
+    @staticmethod
+    def _cache_lines():
+        """
+        Expose sentiment, response and dashboard cache statistics.
+
+        Monotonic statistics (CACHE_COUNTER_FIELDS) are counters named
+        narrativeiq_cache_<field>_total; the rest are gauges.
+        """
+
+        from app.services.dashboard_service import DashboardService
+        from app.services.news_service import NewsService
+        from app.services.sentiment_service import SentimentService
+
+        # field -> [(cache, value)], so each family is declared once
+        fields = {}
+        for cache, stats in (("sentiment", SentimentService.cache_info()),
+                             ("response", NewsService.cache_info()),
+                             ("dashboard", DashboardService.cache_info())):
+            for field, value in stats.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                fields.setdefault(field, []).append((cache, value))
+
+        lines = []
+        for field, samples in sorted(fields.items()):
+            if field in CACHE_COUNTER_FIELDS:
+                name = f"narrativeiq_cache_{field}_total"
+                lines.append(f"# TYPE {name} counter")
+            else:
+                name = f"narrativeiq_cache_{field}"
+                lines.append(f"# TYPE {name} gauge")
+            for cache, value in samples:
+                lines.append(f'{name}{{cache="{cache}"}} {_number(value)}')
+
+        return lines
+
+    @staticmethod
+    def render():
+        """
+        Render every series in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text (version 0.0.4).
+        """
+
+        lines = []
+        for metric in REGISTRY:
+            lines.extend(metric.collect())
+        lines.extend(MetricsService._cache_lines())
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def init_app(app):
+        """
+        Enable metrics per METRICS_ENABLED and time every HTTP request.
+
+        Args:
+            app (Flask): Application instance.
+        """
+
+        MetricsService.configure(app.config['METRICS_ENABLED'])
+        if not _enabled:
+            return
+
+        from flask import g, request
+
+        @app.before_request
+        def _start_timer():
+            g.metrics_started = time.perf_counter()
+
+        @app.after_request
+        def _record_request(response):
+            started = g.pop("metrics_started", None)
+            if started is not None:
+                HTTP_SECONDS.observe(
+                    time.perf_counter() - started,
+                    endpoint=request.endpoint or "unmatched",
+                    method=request.method,
+                    status=str(response.status_code)
+                )
+            return response
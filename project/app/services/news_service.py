@@ -16,16 +16,79 @@ Notes:
     - Each API has its own rate limits and response structures
     - Only English articles are fetched
     - Duplicate titles are skipped to maintain dataset integrity
+    - Near-duplicates (syndicated copies) are stored but grouped into
+      story clusters (see dedup_service.py)
+    - Providers are queried concurrently over pooled keep-alive sessions
+      with per-provider timeouts and bounded retries
+    - Requests are paced per provider by a token bucket; every attempt,
+      retries included, takes a token
+    - Responses are cached on disk with a TTL and served stale while
+      being revalidated (see response_cache.py)
+    - deep_ingest() pages through providers and streams results through
+      scoring and saving in bounded chunks
+    - Fetches and save stages are timed, and articles fetched, dropped as
+      duplicates and stored are counted per provider (metrics_service.py)
 """
 
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from types import SimpleNamespace
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
 from flask import current_app
+from sqlalchemy import insert, select, union_all
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.archived_article import ArchivedArticle
 from app.models.article import Article
+from app.models.data_version import DataVersion
 from app import db
 from datetime import datetime
+from app.services.aggregate_service import AggregateService
+from app.services.dashboard_service import DashboardService
+from app.services.dedup_service import DedupService
+from app.services.metrics_service import (
+    ARTICLES_TOTAL, FETCH_SECONDS, STAGE_SECONDS, MetricsService
+)
+from app.services.rate_limiter import TokenBucket
+from app.services.response_cache import STALE, ResponseCache
 from app.services.sentiment_service import SentimentService
 
 
+# Shared HTTP session (connection pooling), created on first use
+_session = None
+_session_lock = threading.Lock()
+
+# Per-provider token buckets, created on first use
+_rate_limiters = {}
+
+# Cached provider responses, and keys with a background refresh in flight
+response_cache = ResponseCache()
+_refreshing = set()
+
+# Worker threads used to query providers in parallel for interactive
+# fetches (fetch_all), kept apart from background work so a running deep
+# ingest or cache refresh never delays them past FETCH_DEADLINE
+_fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="news-fetch")
+
+# Worker threads for deep-ingest page producers and stale cache refreshes
+_background_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="news-background")
+
+# Hashes per IN (...) lookup; keeps well under SQLite's bound-parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+# Provider responses that are retried (rate limited or transient server errors)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Parses Retry-After headers (seconds or HTTP date)
+_retry_after = Retry(total=0)
+
+
 class NewsService:
     """
     NewsService
@@ -34,13 +97,330 @@ class NewsService:
     Acts as the ingestion layer of the NarrativeIQ architecture.
     """
 
+    # Provider names; each maps to a fetch_from_<name>(topic) method
+    PROVIDERS = ("newsapi", "gnews")
+
+    @staticmethod
+    def _get_session():
+        """
+        Return the process-wide HTTP session, creating it on first use.
+
+        The session keeps keep-alive connections to each provider host. It
+        does not retry on its own: retries go through _request_json so
+        each attempt is paced by the provider's token bucket.
+
+        Returns:
+            requests.Session: Pooled session shared by all fetch threads.
+        """
+
+        global _session
+
+        if _session is None:
+            with _session_lock:
+                if _session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=len(NewsService.PROVIDERS),
+                        pool_maxsize=current_app.config['FETCH_POOL_SIZE'],
+                        max_retries=0
+                    )
+
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    _session = session
+
+        return _session
+
+    @staticmethod
+    def _get_rate_limiter(provider):
+        """
+        Return the process-wide token bucket for a provider.
+
+        Rates come from <PROVIDER>_RATE (requests per second) and
+        <PROVIDER>_BURST in the app config.
+        """
+
+        limiter = _rate_limiters.get(provider)
+
+        if limiter is None:
+            with _session_lock:
+                limiter = _rate_limiters.get(provider)
+                if limiter is None:
+                    config = current_app.config
+                    limiter = TokenBucket(
+                        config[f"{provider.upper()}_RATE"],
+                        config[f"{provider.upper()}_BURST"]
+                    )
+                    _rate_limiters[provider] = limiter
+
+        return limiter
+
+    @staticmethod
+    def configure_cache(path, ttl, stale_ttl, max_bytes):
+        """
+        Configure the provider response cache.
+
+        Args:
+            path (str | None): SQLite file, or None to disable caching.
+            ttl (float): Seconds a response is served without refetching.
+            stale_ttl (float): Extra seconds a stale response is served while
+                it is refreshed in the background.
+            max_bytes (int): Size bound of the on-disk store.
+        """
+
+        response_cache.configure(path, ttl, stale_ttl, max_bytes)
+
+    @staticmethod
+    def cache_info():
+        """
+        Report provider response cache counters.
+
+        Returns:
+            dict: hits, stale_hits, misses, hit_rate, bytes_saved, evictions,
+            size_bytes, max_bytes, enabled.
+        """
+
+        return response_cache.stats()
+
+    @staticmethod
+    def _request_json(provider, params):
+        """
+        Perform a rate-limited GET against a provider and decode JSON.
+
+        The endpoint and timeout come from <PROVIDER>_URL and
+        <PROVIDER>_TIMEOUT in the app config. Connection errors, timeouts,
+        429 and 5xx responses are retried up to FETCH_RETRIES times with
+        exponential backoff (FETCH_BACKOFF), honouring Retry-After headers.
+        Each wait is capped at FETCH_RETRY_MAX_WAIT so a long Retry-After
+        cannot hold a fetch thread past FETCH_DEADLINE. Every attempt
+        takes a token first, so a throttled provider never sees more
+        requests than its bucket allows.
+
+        Args:
+            provider (str): Provider name (see PROVIDERS).
+            params (dict): Query string parameters.
+
+        Returns:
+            tuple: (data, status_code, body_size)
+
+        Raises:
+            requests.RequestException: On network or server failure after retries.
+            ValueError: If the response body is not valid JSON.
+        """
+
+        config = current_app.config
+        retries = config['FETCH_RETRIES']
+        limiter = NewsService._get_rate_limiter(provider)
+
+        for attempt in range(retries + 1):
+            limiter.acquire()
+
+            try:
+                response = NewsService._get_session().get(
+                    config[f"{provider.upper()}_URL"], params=params,
+                    timeout=config[f"{provider.upper()}_TIMEOUT"]
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == retries:
+                    raise
+                time.sleep(NewsService._retry_wait(None, attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                break
+            time.sleep(NewsService._retry_wait(response, attempt))
+
+        # 4xx bodies carry provider error details; 5xx means retries ran out
+        if response.status_code >= 500:
+            response.raise_for_status()
+
+        return response.json(), response.status_code, len(response.content)
+
+    @staticmethod
+    def _retry_wait(response, attempt):
+        """
+        Seconds to sleep before retrying attempt number `attempt` (0-based).
+
+        A valid Retry-After header wins over exponential backoff; either
+        is capped at FETCH_RETRY_MAX_WAIT.
+        """
+
+        config = current_app.config
+        wait = config['FETCH_BACKOFF'] * 2 ** attempt
+
+        header = response.headers.get('Retry-After') if response is not None else None
+        if header:
+            try:
+                wait = _retry_after.parse_retry_after(header)
+            except InvalidHeader:
+                pass
+
+        return min(wait, config['FETCH_RETRY_MAX_WAIT'])
+
+    @staticmethod
+    def _refresh(app, provider, params, key):
+        """
+        Refetch a stale cached response (runs on a background thread).
+        """
+
+        with app.app_context():
+            try:
+                data, status, size = NewsService._request_json(provider, params)
+                if status == 200:
+                    response_cache.put(key, provider, data, size)
+            except (requests.RequestException, ValueError) as exc:
+                app.logger.warning("%s cache refresh failed: %s", provider, exc)
+            finally:
+                with _session_lock:
+                    _refreshing.discard(key)
+
+    @staticmethod
+    def _get_json(provider, params):
+        """
+        Fetch a provider response through the response cache.
+
+        Fresh entries are returned directly. Stale entries are returned
+        immediately while a single background refresh per key updates the
+        cache. Misses hit the provider; successful (HTTP 200) responses are
+        stored.
+
+        Args:
+            provider (str): Provider name (see PROVIDERS).
+            params (dict): Query string parameters.
+
+        Returns:
+            dict: Decoded JSON response body.
+
+        Raises:
+            requests.RequestException: On network or server failure after retries.
+            ValueError: If the response body is not valid JSON.
+        """
+
+        key = response_cache.key(provider, params)
+        cached = response_cache.get(key)
+
+        if cached is not None:
+            data, state = cached
+
+            if state == STALE:
+                with _session_lock:
+                    start_refresh = key not in _refreshing
+                    _refreshing.add(key)
+                if start_refresh:
+                    _background_executor.submit(
+                        NewsService._refresh,
+                        current_app._get_current_object(), provider, params, key
+                    )
+
+            return data
+
+        data, status, size = NewsService._request_json(provider, params)
+        if status == 200:
+            response_cache.put(key, provider, data, size)
+
+        return data
+
+    @staticmethod
+    def normalize_item(item, provider=None):
+        """
+        Convert a raw NewsAPI/GNews article into the internal shape.
+
+        Both providers share the same article layout.
+
+        Args:
+            item (dict): Article object from a provider response.
+            provider (str, optional): Provider the article came from.
+
+        Returns:
+            dict: title, description, source, published_at (ISO string)
+            and provider.
+        """
+
+        return {
+            'title': item.get('title'),
+            'description': item.get('description'),
+            'source': (item.get('source') or {}).get('name'),
+            'published_at': item.get('publishedAt'),
+            'provider': provider
+        }
+
+    @staticmethod
+    def sentiment_text(title, description):
+        """
+        Build the text scored for an article (title + description).
+
+        Shared by ingestion and rescoring backfills so both score the
+        same input.
+        """
+
+        return f"{title} {description}"
+
+    @staticmethod
+    def _fetch_in_context(app, provider, topic):
+        """
+        Run a provider fetch inside an application context.
+
+        Worker threads do not inherit the request's app context, which the
+        fetch methods need for configuration lookups.
+        """
+
+        with app.app_context():
+            fetch = getattr(NewsService, f"fetch_from_{provider}")
+            return fetch(topic)
+
+    @staticmethod
+    def fetch_all(topic):
+        """
+        Fetch articles from every provider concurrently.
+
+        Args:
+            topic (str): Keyword for searching relevant news articles.
+
+        Returns:
+            list[dict]: Combined normalized articles, in provider order.
+
+        Notes:
+            - Latency is bounded by the slowest provider, not the sum
+            - Partial results: a provider that fails or misses the
+              FETCH_DEADLINE is logged and contributes no articles
+        """
+
+        app = current_app._get_current_object()
+
+        futures = {
+            provider: _fetch_executor.submit(
+                NewsService._fetch_in_context, app, provider, topic
+            )
+            for provider in NewsService.PROVIDERS
+        }
+        done, _ = wait(futures.values(), timeout=app.config['FETCH_DEADLINE'])
+
+        articles = []
+        for provider, future in futures.items():
+            if future not in done:
+                app.logger.warning(
+                    "%s fetch for %r exceeded %.1fs deadline; skipping",
+                    provider, topic, app.config['FETCH_DEADLINE']
+                )
+                continue
+
+            try:
+                articles.extend(future.result())
+            except (requests.RequestException, ValueError) as exc:
+                app.logger.warning("%s fetch for %r failed: %s", provider, topic, exc)
+
+        return articles
+
     @staticmethod
-    def fetch_from_newsapi(topic):
+    @MetricsService.timed(FETCH_SECONDS, provider="newsapi")
+    def fetch_from_newsapi(topic, page=1, page_size=10):
         """
         Fetch articles from NewsAPI for a given topic.
 
         Args:
             topic (str): Keyword for searching relevant news articles.
+            page (int): 1-based results page.
+            page_size (int): Articles per page (NewsAPI allows up to 100).
 
         Returns:
             list[dict]: Normalized list of articles containing:
@@ -48,45 +428,42 @@ class NewsService:
                 - description (str)
                 - source (str)
                 - published_at (str ISO timestamp)
-        
+
         Notes:
-            - Limits results to 10 articles
+            - Defaults to the first 10 articles
             - Only English articles are fetched
         """
 
-        url = "https://newsapi.org/v2/everything"
-
         params = {
             'q': topic,
             'apiKey': current_app.config['NEWS_API_KEY'],
             'language': 'en',
-            'pageSize': 10
+            'pageSize': page_size,
+            'page': page
         }
 
-        response = requests.get(url, params=params)
-        data = response.json()
+        data = NewsService._get_json("newsapi", params)
 
         articles = []
 
         if data.get('status') == 'ok':
             for item in data.get('articles', []):
-                article = {
-                    'title': item.get('title'),
-                    'description': item.get('description'),
-                    'source': item.get('source', {}).get('name'),
-                    'published_at': item.get('publishedAt')                    
-                }
-                articles.append(article)
+                articles.append(NewsService.normalize_item(item, "newsapi"))
+
+        MetricsService.count(ARTICLES_TOTAL, len(articles), provider="newsapi", outcome="fetched")
 
         return articles
 
     @staticmethod
-    def fetch_from_gnews(topic):
+    @MetricsService.timed(FETCH_SECONDS, provider="gnews")
+    def fetch_from_gnews(topic, page=1, page_size=10):
         """
         Fetch articles from GNews API for a given topic.
 
         Args:
             topic (str): Keyword for searching relevant news articles.
+            page (int): 1-based results page.
+            page_size (int): Articles per page (plan-dependent maximum).
 
         Returns:
             list[dict]: Normalized list of articles with:
@@ -96,83 +473,381 @@ class NewsService:
                 - published_at
 
         Notes:
-            - Limits results to 10 articles
+            - Defaults to the first 10 articles
             - Only English articles are fetched
         """
 
-        url = 'https://gnews.io/api/v4/search'
         params = {
             'q': topic,
             'token': current_app.config['GNEWS_API_KEY'],
             'lang': 'en',
-            'max': 10
+            'max': page_size,
+            'page': page
         }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
+
+        data = NewsService._get_json("gnews", params)
         articles = []
 
         for item in data.get('articles', []):
-            article = {
-                'title': item.get('title'),
-                'description': item.get('description'),
-                'source': item.get('source', {}).get('name'),
-                'published_at': item.get('publishedAt')
-            }
-            articles.append(article)
+            articles.append(NewsService.normalize_item(item, "gnews"))
+
+        MetricsService.count(ARTICLES_TOTAL, len(articles), provider="gnews", outcome="fetched")
 
         return articles
 
     @staticmethod
-    def save_articles(topic, articles):
+    def iter_pages(provider, topic, max_pages, page_size):
+        """
+        Page through a provider's results for a topic.
+
+        Args:
+            provider (str): Provider name (see PROVIDERS).
+            topic (str): Keyword for searching relevant news articles.
+            max_pages (int): Upper bound on pages requested.
+            page_size (int): Articles requested per page.
+
+        Yields:
+            list[dict]: Normalized articles, one non-empty page at a time.
+
+        Notes:
+            - Stops early at the first short or empty page (end of
+              results, or a provider error such as a plan page limit)
+            - Each request waits on the provider's token bucket
+        """
+
+        fetch = getattr(NewsService, f"fetch_from_{provider}")
+
+        for page in range(1, max_pages + 1):
+            articles = fetch(topic, page=page, page_size=page_size)
+
+            if articles:
+                yield articles
+            if len(articles) < page_size:
+                return
+
+    @staticmethod
+    def _offer(pages, item, stop):
+        """
+        Put an item on the pipeline queue, giving up once stop is set.
+
+        Returns:
+            bool: True if the item was enqueued.
+        """
+
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    @staticmethod
+    def _produce_pages(app, provider, topic, pages, stop):
+        """
+        Feed one provider's pages into the pipeline queue.
+
+        Runs on a background thread. Blocks while the queue is full, which
+        throttles crawling to the speed of scoring and saving. Always
+        finishes by enqueuing the provider name as an end marker.
+        """
+
+        with app.app_context():
+            config = app.config
+            try:
+                for articles in NewsService.iter_pages(
+                    provider, topic,
+                    config['DEEP_FETCH_MAX_PAGES'], config['DEEP_FETCH_PAGE_SIZE']
+                ):
+                    if not NewsService._offer(pages, articles, stop):
+                        return
+            except (requests.RequestException, ValueError) as exc:
+                app.logger.warning("%s deep fetch for %r failed: %s", provider, topic, exc)
+            finally:
+                NewsService._offer(pages, provider, stop)
+
+    @staticmethod
+    def deep_ingest(topic, on_progress=None):
+        """
+        Crawl every provider page-by-page and save results as they arrive.
+
+        Pages flow through a bounded queue from one background thread per
+        provider into the calling thread, which scores and commits them in
+        chunks of DEEP_FETCH_CHUNK_SIZE articles via save_articles().
+
+        Args:
+            topic (str): Keyword for searching relevant news articles.
+            on_progress (callable, optional): Called as
+                on_progress(fetched, stored) after every committed chunk.
+
+        Returns:
+            dict: fetched, stored and chunks (commits) totals.
+
+        Notes:
+            - Memory stays bounded by the queue size plus one chunk
+            - Committed chunks are visible to readers while the crawl continues
+            - Provider failures end that provider's crawl but keep the rest
+        """
+
+        app = current_app._get_current_object()
+        config = app.config
+
+        pages = queue.Queue(maxsize=config['DEEP_FETCH_QUEUE_SIZE'])
+        stop = threading.Event()
+
+        for provider in NewsService.PROVIDERS:
+            _background_executor.submit(
+                NewsService._produce_pages, app, provider, topic, pages, stop
+            )
+
+        totals = {'fetched': 0, 'stored': 0, 'chunks': 0}
+        buffer = []
+
+        def flush():
+            totals['stored'] += NewsService.save_articles(topic, buffer)
+            totals['chunks'] += 1
+            buffer.clear()
+            if on_progress is not None:
+                on_progress(totals['fetched'], totals['stored'])
+
+        try:
+            remaining = len(NewsService.PROVIDERS)
+            while remaining:
+                page = pages.get()
+
+                # A provider name marks the end of that provider's pages
+                if isinstance(page, str):
+                    remaining -= 1
+                    continue
+
+                totals['fetched'] += len(page)
+                buffer.extend(page)
+                if len(buffer) >= config['DEEP_FETCH_CHUNK_SIZE']:
+                    flush()
+
+            if buffer:
+                flush()
+        finally:
+            # Release producers blocked on a full queue if we bailed out
+            stop.set()
+
+        return totals
+
+    @staticmethod
+    def _existing_title_hashes(title_hashes):
+        """
+        Return the subset of title hashes already stored.
+
+        Lookups are issued as set-based IN queries over the unique
+        title_hash index, chunked to stay under driver parameter limits.
+        Archived articles count as stored (ArchivedArticle keeps their
+        hashes), so a provider returning one does not re-insert it.
+
+        Args:
+            title_hashes (Iterable[str]): Candidate hashes.
+
+        Returns:
+            set[str]: Hashes that already exist in the database.
+        """
+
+        title_hashes = list(title_hashes)
+        existing = set()
+
+        for start in range(0, len(title_hashes), LOOKUP_CHUNK_SIZE):
+            chunk = title_hashes[start:start + LOOKUP_CHUNK_SIZE]
+            existing.update(db.session.scalars(union_all(
+                select(Article.title_hash).where(Article.title_hash.in_(chunk)),
+                select(ArchivedArticle.title_hash).where(ArchivedArticle.title_hash.in_(chunk))
+            )))
+
+        return existing
+
+    @staticmethod
+    def _insert_articles(rows):
+        """
+        Bulk insert Article rows, skipping title_hash conflicts.
+
+        SQLite and PostgreSQL get INSERT ... ON CONFLICT DO NOTHING, which
+        covers concurrent ingests racing on the same headline, with
+        RETURNING so only rows actually written are reported. Other
+        backends fall back to a plain INSERT.
+
+        Without executemany RETURNING, rows are inserted one statement at a
+        time and reported from their own row count and primary key: reading
+        them back by title hash would also return rows another writer
+        committed meanwhile, which record_ingest would then count twice.
+
+        Args:
+            rows (list[dict]): Column values for each new article.
+
+        Returns:
+            list[Row]: id, title_hash, topic, source, sentiment_score,
+            published_at and created_at of each inserted row.
+        """
+
+        dialect = db.session.get_bind().dialect
+        returned = (
+            Article.id, Article.title_hash, Article.topic, Article.source,
+            Article.sentiment_score, Article.published_at, Article.created_at
+        )
+
+        if dialect.name in ("sqlite", "postgresql"):
+            dialect_insert = sqlite_insert if dialect.name == "sqlite" else postgresql_insert
+            stmt = dialect_insert(Article).on_conflict_do_nothing(
+                index_elements=[Article.title_hash]
+            )
+        else:
+            stmt = insert(Article)
+
+        if dialect.insert_executemany_returning:
+            return db.session.execute(stmt.returning(*returned), rows).all()
+
+        inserted = []
+        for row in rows:
+            # Set created_at here so the reported row matches the stored one
+            row = dict(row, created_at=row.get('created_at') or datetime.utcnow())
+            result = db.session.connection().execute(stmt, row)
+            if result.rowcount != 1:
+                continue
+
+            inserted.append(SimpleNamespace(
+                id=result.inserted_primary_key[0],
+                **{column.key: row.get(column.key) for column in returned[1:]}
+            ))
+
+        return inserted
+
+    @staticmethod
+    def _count_outcomes(articles, batch, inserted):
+        """
+        Count duplicate and stored articles per provider for /metrics.
+
+        Args:
+            articles (list[dict]): The batch passed to save_articles().
+            batch (dict): title_hash -> item after in-batch deduplication.
+            inserted (list[Row]): Rows actually inserted.
+        """
+
+        stored = {}
+        for row in inserted:
+            provider = batch[row.title_hash].get('provider') or "unknown"
+            stored[provider] = stored.get(provider, 0) + 1
+
+        received = {}
+        for item in articles:
+            if item['title']:
+                provider = item.get('provider') or "unknown"
+                received[provider] = received.get(provider, 0) + 1
+
+        for provider, count in received.items():
+            MetricsService.count(ARTICLES_TOTAL, count - stored.get(provider, 0),
+                                 provider=provider, outcome="duplicate")
+        for provider, count in stored.items():
+            MetricsService.count(ARTICLES_TOTAL, count, provider=provider, outcome="stored")
+
+    @staticmethod
+    def save_articles(topic, articles, pool=None):
         """
         Persist fetched articles into the database after NLP enrichment.
 
         Args:
             topic (str): The search topic used for these articles.
             articles (list[dict]): List of articles fetched from APIs.
+            pool (Executor, optional): Process pool for sentiment scoring
+                (see SentimentService.analyze_batch).
+
+        Returns:
+            int: Number of new articles stored.
 
         Workflow:
             1. Skip articles without titles
-            2. Check for duplicates based on title
-            3. Combine title + description for sentiment analysis
-            4. Use SentimentService to generate sentiment score & label
-            5. Store enriched Article object in database
+            2. Hash normalized titles and drop duplicates within the batch
+            3. Drop titles already stored, using one set-based lookup
+            4. Combine title + description for sentiment analysis
+            5. Score the whole batch with one SentimentService.analyze_batch call
+            6. Bulk insert the enriched rows
+            7. Add the inserted scores to the SourceMetric and
+               SentimentRollup running sums
+            8. Assign near-duplicate story clusters via MinHash/LSH
+            9. Bump the data version (invalidates cached dashboards)
 
         Notes:
             - Converts ISO timestamp from API to datetime
             - Commits all valid articles in a single transaction
+            - Duplicate checks cost O(batch) index probes, independent of table size
         """
 
+        # Deduplicate the batch itself; first occurrence of a headline wins
+        batch = {}
         for item in articles:
             if not item['title']:
                 continue
-
-            # Skip duplicates
-            existing = Article.query.filter_by(
-                title=item['title'],
-            ).first()
-            if existing:
-                continue
-
-            # Prepare text for sentiment analysis
-            full_text = f"{item['title']} {item['description']}"
-            sentiment_score, sentiment_label = SentimentService.analyze_sentiment(full_text)
-
-            # Create Article instance
-            article = Article(
-                title=item["title"],
-                description=item["description"],
-                source=item["source"],
-                topic=topic,
-                published_at=datetime.fromisoformat(
+            batch.setdefault(Article.hash_title(item['title']), item)
+
+        # Skip duplicates already stored
+        with MetricsService.timer(STAGE_SECONDS, stage="duplicate_check"):
+            existing = NewsService._existing_title_hashes(batch.keys())
+
+        new_items = [
+            (title_hash, item) for title_hash, item in batch.items()
+            if title_hash not in existing
+        ]
+
+        # Score all new articles in one batched call (title + description)
+        sentiments = SentimentService.analyze_batch(
+            [NewsService.sentiment_text(item['title'], item['description']) for _, item in new_items],
+            workers=current_app.config['SENTIMENT_WORKERS'],
+            pool=pool
+        )
+
+        scorer_version = SentimentService.scorer_version()
+        label_version = SentimentService.label_version()
+
+        rows = []
+        for (title_hash, item), (sentiment_score, sentiment_label) in zip(new_items, sentiments):
+            rows.append({
+                'title': item["title"],
+                'title_hash': title_hash,
+                'description': item["description"],
+                'source': item["source"],
+                'topic': topic,
+                'published_at': datetime.fromisoformat(
                     item["published_at"].replace("Z", "+00:00")
                 ) if item["published_at"] else None,
-                sentiment_score=sentiment_score,
-                sentiment_label=sentiment_label
-            )
+                'sentiment_score': sentiment_score,
+                'sentiment_label': sentiment_label,
+                'scorer_version': scorer_version,
+                'label_version': label_version
+            })
+
+        # Bulk insert new articles, then update per-source aggregates and
+        # the near-duplicate index in the same transaction
+        with MetricsService.timer(STAGE_SECONDS, stage="insert"):
+            inserted = NewsService._insert_articles(rows) if rows else []
+
+        with MetricsService.timer(STAGE_SECONDS, stage="aggregates"):
+            AggregateService.record_ingest(inserted)
+
+        texts = {
+            title_hash: f"{item['title']} {item['description'] or ''}"
+            for title_hash, item in new_items
+        }
+        with MetricsService.timer(STAGE_SECONDS, stage="near_duplicate_index"):
+            DedupService.index_articles([(row.id, texts[row.title_hash]) for row in inserted])
+
+        # Invalidate cached dashboards in every process
+        if inserted:
+            DataVersion.bump()
+
+        with MetricsService.timer(STAGE_SECONDS, stage="commit"):
+            db.session.commit()
+
+        # Push the new metrics to open dashboards in this process
+        if inserted:
+            DashboardService.notify()
 
-            db.session.add(article)
+        if MetricsService.enabled():
+            NewsService._count_outcomes(articles, batch, inserted)
 
-        # Commit all new articles to the database
-        db.session.commit()
\ No newline at end of file
+        return len(inserted)
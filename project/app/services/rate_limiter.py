@@ -0,0 +1,75 @@
+"""
+rate_limiter.py
+
+Token-bucket rate limiting for upstream news providers.
+
+Each provider gets one bucket per process. Tokens refill continuously at
+`rate` per second up to `capacity`; every outbound request takes one
+token and blocks until one is available. This lets short bursts through
+while holding the long-run request rate at the provider's limit, which
+matters once deep fetches issue many page requests per topic.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    TokenBucket
+
+    Thread-safe blocking token bucket.
+
+    Args:
+        rate (float): Tokens added per second. Zero or less disables limiting.
+        capacity (float): Maximum stored tokens (burst size).
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Add tokens accrued since the last update."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """
+        Take tokens without waiting.
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the number of
+            seconds until enough tokens will be available.
+        """
+
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens, sleeping until they are available.
+
+        Returns:
+            float: Total seconds spent waiting.
+        """
+
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay == 0.0:
+                return waited
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,294 @@
+"""
+response_cache.py
+
+On-disk TTL cache for upstream news provider responses.
+
+Resubmitting a popular topic would otherwise call NewsAPI and GNews again,
+spending quota and adding latency even when the previous results are only
+seconds old. Responses are cached under the provider name plus normalized
+query parameters (credentials excluded).
+
+Behaviour:
+    - Fresh (age <= ttl): served from cache
+    - Stale (ttl < age <= ttl + stale_ttl): served from cache while the
+      caller refreshes it in the background (stale-while-revalidate)
+    - Older or absent: treated as a miss
+
+Storage:
+    A single SQLite file holding zlib-compressed JSON bodies. The total
+    stored size is bounded by max_bytes; least recently used entries are
+    evicted first. Several processes (e.g. web workers) may share the
+    file, so the stored size is not tracked per process: a one-row table
+    (response_totals) holds the running total, kept by triggers on every
+    insert, update and delete in the same transaction, and seeded once
+    from the stored rows when a file is first opened by this version.
+    Reading it is O(1), however large the cache.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+
+# Query parameters that carry credentials and must not affect the key
+SECRET_PARAMS = frozenset({'apiKey', 'token'})
+
+# Least recently used entries read per eviction query
+EVICT_BATCH = 50
+
+# Running total of stored bytes, maintained by triggers; the INSERT seeds
+# it from existing rows and is a no-op once the row exists
+TOTALS_DDL = (
+    "CREATE TABLE IF NOT EXISTS response_totals ("
+    "id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)",
+
+    "INSERT OR IGNORE INTO response_totals (id, size) "
+    "SELECT 0, COALESCE(SUM(size), 0) FROM responses",
+
+    "CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN "
+    "UPDATE response_totals SET size = size + new.size WHERE id = 0; END",
+
+    "CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN "
+    "UPDATE response_totals SET size = size - old.size WHERE id = 0; END",
+
+    "CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size ON responses BEGIN "
+    "UPDATE response_totals SET size = size - old.size + new.size WHERE id = 0; END"
+)
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+class ResponseCache:
+    """
+    ResponseCache
+
+    Size-bounded, thread-safe SQLite cache of decoded JSON responses.
+    Disabled (every lookup misses, nothing is stored) until configured
+    with a path.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.ttl = 300.0
+        self.stale_ttl = 600.0
+        self.max_bytes = 50 * 1024 * 1024
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def configure(self, path, ttl, stale_ttl, max_bytes):
+        """
+        (Re)configure the cache.
+
+        Args:
+            path (str | None): SQLite file, or None to disable caching.
+            ttl (float): Seconds a response is considered fresh.
+            stale_ttl (float): Extra seconds a stale response may be served
+                while it is revalidated.
+            max_bytes (int): Upper bound on stored (compressed) bytes.
+        """
+
+        with self._lock:
+            self.ttl = ttl
+            self.stale_ttl = stale_ttl
+            self.max_bytes = max_bytes
+
+            if path != self.path:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+                if path:
+                    self._conn = sqlite3.connect(path, check_same_thread=False)
+                    self._conn.execute("PRAGMA journal_mode=WAL")
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+                    self._conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses ("
+                        "key TEXT PRIMARY KEY, provider TEXT NOT NULL, "
+                        "body BLOB NOT NULL, size INTEGER NOT NULL, "
+                        "raw_size INTEGER NOT NULL, fetched_at REAL NOT NULL, "
+                        "accessed_at REAL NOT NULL)"
+                    )
+                    self._conn.execute(
+                        "CREATE INDEX IF NOT EXISTS ix_responses_accessed_at "
+                        "ON responses (accessed_at)"
+                    )
+                    # One write transaction, so no other process stores
+                    # an entry between the seed and the triggers
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    for statement in TOTALS_DDL:
+                        self._conn.execute(statement)
+                    self._conn.commit()
+                self.path = path
+
+            if self._conn is not None:
+                self._evict()
+                self._conn.commit()
+
+    @property
+    def enabled(self):
+        """Whether a backing store is attached."""
+        return self._conn is not None
+
+    @staticmethod
+    def key(provider, params):
+        """
+        Build a cache key from a provider and its query parameters.
+
+        Credentials are dropped, string values are whitespace-collapsed and
+        lowercased, and parameters are sorted, so equivalent requests share
+        an entry.
+
+        Args:
+            provider (str): Provider name.
+            params (dict): Request query parameters.
+
+        Returns:
+            str: Cache key.
+        """
+
+        normalized = sorted(
+            (name, " ".join(value.split()).lower() if isinstance(value, str) else value)
+            for name, value in params.items()
+            if name not in SECRET_PARAMS
+        )
+
+        return f"{provider}:{json.dumps(normalized)}"
+
+    def get(self, key):
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Key from key().
+
+        Returns:
+            tuple | None: (data, state) with state FRESH or STALE, or None
+            on a miss (including entries past the stale window).
+        """
+
+        if self._conn is None:
+            return None
+
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, raw_size, fetched_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or now - row[2] > self.ttl + self.stale_ttl:
+                self.misses += 1
+                return None
+
+            body, raw_size, fetched_at = row
+            state = FRESH if now - fetched_at <= self.ttl else STALE
+
+            if state == FRESH:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            self.bytes_saved += raw_size
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+
+        return json.loads(zlib.decompress(body)), state
+
+    def put(self, key, provider, data, raw_size):
+        """
+        Store a response, evicting least recently used entries if needed.
+
+        Args:
+            key (str): Key from key().
+            provider (str): Provider name (for inspection only).
+            data (dict): Decoded JSON body.
+            raw_size (int): Size of the original response body in bytes,
+                credited to bytes_saved on later hits.
+        """
+
+        if self._conn is None:
+            return
+
+        body = zlib.compress(json.dumps(data).encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            # The INSERT opens the write transaction, so the total read by
+            # _evict() includes every process's entries and no other
+            # writer can change it before the commit. An upsert rather
+            # than INSERT OR REPLACE: REPLACE's implicit delete does not
+            # fire the delete trigger, so the total would drift.
+            self._conn.execute(
+                "INSERT INTO responses "
+                "(key, provider, body, size, raw_size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET provider = excluded.provider, "
+                "body = excluded.body, size = excluded.size, raw_size = excluded.raw_size, "
+                "fetched_at = excluded.fetched_at, accessed_at = excluded.accessed_at",
+                (key, provider, body, len(body), raw_size, now, now)
+            )
+
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        """
+        Return cache counters.
+
+        Returns:
+            dict: hits, stale_hits, misses, hit_rate (fresh + stale over all
+            lookups), bytes_saved, evictions, size_bytes, max_bytes, enabled.
+        """
+
+        with self._lock:
+            served = self.hits + self.stale_hits
+            lookups = served + self.misses
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_rate': round(served / lookups, 4) if lookups else 0.0,
+                'bytes_saved': self.bytes_saved,
+                'evictions': self.evictions,
+                'size_bytes': self._stored_bytes() if self._conn is not None else 0,
+                'max_bytes': self.max_bytes,
+                'enabled': self._conn is not None
+            }
+
+    def _stored_bytes(self):
+        """Compressed bytes stored by all processes sharing the file (lock held)."""
+
+        return self._conn.execute("SELECT size FROM response_totals WHERE id = 0").fetchone()[0]
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)."""
+
+        excess = self._stored_bytes() - self.max_bytes
+
+        while excess > 0:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT ?",
+                (EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                return
+
+            for key, size in rows:
+                if excess <= 0:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                excess -= size
+                self.evictions += 1
@@ -0,0 +1,266 @@
+"""
+schema_service.py
+
+Brings an existing NarrativeIQ database up to the current schema.
+
+db.create_all() creates missing tables but never alters existing ones,
+so a database created before columns such as Article.title_hash or
+Article.scorer_version existed cannot store new articles until it is
+upgraded. `flask upgrade-db` runs upgrade(), which is safe to run on a
+database that is already current (every step is a no-op there) and
+resumes where it stopped if interrupted.
+
+Steps:
+    1. Create missing tables (create_all)
+    2. Add the Article / ArchivedArticle columns the tables lack
+       (ALTER TABLE ... ADD COLUMN)
+    3. On SQLite, rebuild an article table created without AUTOINCREMENT
+       and seed its sequence above every live, archived and archive-file
+       id, so the ids of archived articles are never handed out again
+    4. Mark rows stored without scorer_version / label_version as
+       LEGACY_VERSION, so `flask backfill-sentiment` rescores and
+       relabels them; hash the titles of rows stored without a
+       title_hash (BackfillService.title_hashes)
+    5. Create the missing Article indexes; after step 4, so repeated
+       headlines no longer block the unique title_hash index
+    6. Sign and cluster rows stored without a MinHash signature
+       (BackfillService.stories), so near-duplicates of stored stories
+       are grouped
+    7. Fill the tables derived from Article (SourceMetric, SentimentRollup)
+       when this run created them, and build the search index (SQLite)
+       if the database has none
+    8. Copy topic, source and score of articles archived before
+       ArchivedArticle stored them from the archive files
+       (ArchiveService.backfill_archived_articles)
+
+Position in Pipeline:
+    existing database → SchemaService.upgrade → NewsService / dashboards / backfills
+"""
+
+from sqlalchemy import MetaData, func, inspect, or_, select, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateTable
+
+from app import db
+from app.models.archive_file import ArchiveFile
+from app.models.archived_article import ArchivedArticle
+from app.models.article import Article
+from app.models.sentiment_rollup import SentimentRollup
+from app.models.source_metric import SourceMetric
+from app.services.aggregate_service import AggregateService
+from app.services.archive_service import ArchiveService
+from app.services.backfill_service import BackfillService
+from app.services.search_service import FTS_TABLE, SearchService
+from app.services.sentiment_service import LEGACY_VERSION
+
+
+class SchemaService:
+    """
+    SchemaService
+
+    Static helpers to inspect and upgrade the database schema.
+    """
+
+    @staticmethod
+    def _tables():
+        return set(inspect(db.engine).get_table_names())
+
+    @staticmethod
+    def _add_missing_columns():
+        """
+        Add the Article and ArchivedArticle columns missing from the
+        stored tables.
+
+        Returns:
+            list[str]: Names of the columns added, as table.column.
+        """
+
+        added = []
+        for table in (Article.__table__, ArchivedArticle.__table__):
+            present = {column['name'] for column in inspect(db.engine).get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                db.session.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                added.append(f"{table.name}.{column.name}")
+        db.session.commit()
+
+        return added
+
+    @staticmethod
+    def _rebuild_with_autoincrement():
+        """
+        Recreate a SQLite article table that lacks AUTOINCREMENT.
+
+        `sqlite_autoincrement` only applies when the table is created.
+        Without it SQLite hands out max(id) + 1, which reuses the id of
+        an archived article whenever it was the newest one. The table is
+        copied into one created from the current model, renamed into
+        place, and its sequence set to the highest id ever used: live
+        articles, ArchivedArticle and the archive file manifest.
+
+        Returns:
+            bool: Whether the table was rebuilt.
+
+        Notes:
+            Indexes and search triggers are dropped with the old table;
+            upgrade() recreates them. Foreign keys are not enforced on
+            these connections, so the LSH rows referencing article ids
+            are left in place.
+        """
+
+        if db.engine.dialect.name != "sqlite":
+            return False
+
+        table = Article.__table__
+        sql = db.session.scalar(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': table.name}
+        )
+        if sql is None or "AUTOINCREMENT" in sql.upper():
+            return False
+
+        rebuilt = table.to_metadata(MetaData(), name=f"{table.name}_rebuild")
+        columns = ", ".join(column.name for column in table.columns)
+
+        # A copy left by an interrupted run is incomplete
+        db.session.execute(text(f"DROP TABLE IF EXISTS {rebuilt.name}"))
+        db.session.execute(CreateTable(rebuilt))
+        db.session.execute(text(
+            f"INSERT INTO {rebuilt.name} ({columns}) SELECT {columns} FROM {table.name}"
+        ))
+        db.session.execute(text(f"DROP TABLE {table.name}"))
+        db.session.execute(text(f"ALTER TABLE {rebuilt.name} RENAME TO {table.name}"))
+
+        high = max(
+            db.session.scalar(select(func.max(Article.id))) or 0,
+            db.session.scalar(select(func.max(ArchivedArticle.id))) or 0,
+            db.session.scalar(select(func.max(ArchiveFile.last_id))) or 0
+        )
+        db.session.execute(text("DELETE FROM sqlite_sequence WHERE name = :name"), {'name': table.name})
+        db.session.execute(
+            text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+            {'name': table.name, 'seq': high}
+        )
+        db.session.commit()
+
+        return True
+
+    @staticmethod
+    def _mark_legacy_versions():
+        """
+        Set LEGACY_VERSION where an article has no scorer or label version.
+
+        Returns:
+            int: Articles marked.
+        """
+
+        result = db.session.execute(
+            update(Article)
+            .where(or_(Article.scorer_version.is_(None), Article.label_version.is_(None)))
+            .values(
+                scorer_version=func.coalesce(Article.scorer_version, LEGACY_VERSION),
+                label_version=func.coalesce(Article.label_version, LEGACY_VERSION)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        return result.rowcount
+
+    @staticmethod
+    def _create_missing_indexes():
+        """
+        Create the Article indexes missing from the stored table.
+
+        Returns:
+            list[str]: Names of the indexes created.
+        """
+
+        present = {index['name'] for index in inspect(db.engine).get_indexes(Article.__tablename__)}
+
+        created = []
+        for index in sorted(Article.__table__.indexes, key=lambda index: index.name):
+            if index.name not in present:
+                index.create(db.engine)
+                created.append(index.name)
+
+        return created
+
+    @staticmethod
+    def upgrade(chunk_size=None, on_progress=None):
+        """
+        Upgrade the database to the current schema.
+
+        Args:
+            chunk_size (int, optional): Articles per backfill transaction
+                (default BACKFILL_CHUNK_SIZE).
+            on_progress (callable, optional): Called with (step, totals)
+                after every committed backfill chunk.
+
+        Returns:
+            dict: tables_created, columns_added and indexes_created (names),
+            legacy_versions (articles marked), title_hashes and stories
+            (BackfillService totals), rebuilt (tables recreated, or
+            derived tables filled from Article) and archived_articles (updated and chunks of
+            the ArchivedArticle fill from the archive files).
+        """
+
+        def progress(step):
+            if on_progress is None:
+                return None
+            return lambda totals: on_progress(step, totals)
+
+        before = SchemaService._tables()
+        db.create_all()
+        created = sorted(SchemaService._tables() - before)
+
+        columns_added = SchemaService._add_missing_columns()
+        rebuilt = []
+        if SchemaService._rebuild_with_autoincrement():
+            rebuilt.append(Article.__tablename__)
+            # The search triggers were dropped with the old table
+            if FTS_TABLE in SchemaService._tables():
+                SearchService.install(db.session.connection())
+                db.session.commit()
+
+        report = {
+            'tables_created': created,
+            'columns_added': columns_added,
+            'legacy_versions': SchemaService._mark_legacy_versions(),
+            'title_hashes': BackfillService.title_hashes(
+                chunk_size=chunk_size, on_progress=progress("title_hashes")
+            ),
+            'indexes_created': SchemaService._create_missing_indexes(),
+            'stories': BackfillService.stories(
+                chunk_size=chunk_size, on_progress=progress("stories")
+            ),
+            'rebuilt': rebuilt
+        }
+
+        # New tables derived from Article start empty; a new database has
+        # no articles, so this only runs when upgrading one that does
+        if before and db.session.scalar(select(func.count()).select_from(Article)):
+            if SourceMetric.__tablename__ in created:
+                AggregateService.rebuild_source_metrics()
+                report['rebuilt'].append(SourceMetric.__tablename__)
+            if SentimentRollup.__tablename__ in created:
+                AggregateService.rebuild_rollups()
+                report['rebuilt'].append(SentimentRollup.__tablename__)
+
+        # create_all only adds the search index with a new Article table
+        if db.engine.dialect.name == "sqlite" and FTS_TABLE not in SchemaService._tables():
+            try:
+                SearchService.rebuild()
+                report['rebuilt'].append(FTS_TABLE)
+            except OperationalError:
+                # SQLite built without FTS5: search falls back to LIKE
+                db.session.rollback()
+
+        report['archived_articles'] = ArchiveService.backfill_archived_articles(
+            on_progress=progress("archived_articles")
+        )
+
+        return report
@@ -0,0 +1,447 @@
+"""
+search_service.py
+
+Full-text search over stored article titles and descriptions.
+
+On SQLite the Article table is indexed by an FTS5 external-content table
+(article_fts): the index stores only tokens and reads titles and
+descriptions back from Article. Triggers keep it in step with every
+insert, delete (e.g. archiving) and title/description update, including
+bulk Core inserts, so no ingest code has to know about it.
+
+Responsibilities:
+    - Create the index and triggers with the Article table, or for an
+      existing database through `flask rebuild-search-index`
+    - Turn free text into a safe FTS5 query: quoted terms and "phrases",
+      all required, with a trailing * for prefix matches
+    - Rank matches by BM25 (title hits weigh more than description hits)
+      combined with the explorer's topic / source / label filters, within
+      windows of the newest matches so common words stay cheap
+    - Highlight matches in the title and a description snippet
+
+Notes:
+    - Without the index (PostgreSQL, or SQLite built without FTS5) search
+      falls back to case-insensitive LIKE over both columns, newest first;
+      results are the same shape but unranked and need a full scan
+    - Archived articles are not searched (see archive_service.py)
+    - Porter stemming: "elections" also matches "election"
+
+Position in Pipeline:
+    Article inserts → triggers → article_fts → SearchService → Articles explorer / API
+"""
+
+import base64
+import binascii
+import re
+
+from markupsafe import Markup, escape
+from sqlalchemy import column, event, func, literal_column, or_, select, table, text
+from sqlalchemy.exc import OperationalError
+
+from app import db
+from app.models.article import Article
+from app.services.article_service import ArticleService
+
+
+# Index table and the statements that create and maintain it
+FTS_TABLE = "article_fts"
+
+_ARTICLES = Article.__tablename__
+
+INDEX_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"title, description, content='{_ARTICLES}', content_rowid='id', "
+    f"tokenize='porter unicode61 remove_diacritics 2')",
+
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON {_ARTICLES} BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description); "
+    f"END",
+
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON {_ARTICLES} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+    f"VALUES ('delete', old.id, old.title, old.description); "
+    f"END",
+
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF title, description ON {_ARTICLES} BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+    f"VALUES ('delete', old.id, old.title, old.description); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description); "
+    f"END",
+
+    # BM25 column weights (title, description) used by ORDER BY rank
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', 'bm25(5.0, 1.0)')"
+)
+
+fts = table(FTS_TABLE, column("rowid"), column("rank"))
+
+# Highlight markers: control characters that article text does not
+# contain and HTML escaping leaves alone, replaced with <mark> tags once
+# the text is escaped
+MARK_START = "\x02"
+MARK_END = "\x03"
+
+# Description tokens shown around the matches
+SNIPPET_TOKENS = 24
+
+# Query syntax: "quoted phrases" or bare words, optional trailing *
+_TOKEN = re.compile(r'"([^"]*)"?|(\S+)')
+_WORD = re.compile(r"\w+")
+
+# SQLite URLs whose database is known to have the index
+_indexed = set()
+
+
+class SearchService:
+    """
+    SearchService
+
+    Provides static utilities to maintain and query the article search index.
+    """
+
+    @staticmethod
+    def install(connection):
+        """
+        Create the search index and its triggers if missing.
+
+        Args:
+            connection: SQLAlchemy connection to a SQLite database.
+
+        Notes:
+            - Articles stored before the index existed are not indexed;
+              run rebuild() to index them
+        """
+
+        for statement in INDEX_DDL:
+            connection.exec_driver_sql(statement)
+
+    @staticmethod
+    def available():
+        """
+        Tell whether the current database has the search index.
+
+        Returns:
+            bool: True when FTS5 search is used, False for the LIKE fallback.
+        """
+
+        bind = db.session.get_bind()
+        if bind.dialect.name != "sqlite":
+            return False
+
+        url = str(bind.url)
+        if url not in _indexed and db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': FTS_TABLE}
+        ).first():
+            _indexed.add(url)
+
+        return url in _indexed
+
+    @staticmethod
+    def rebuild():
+        """
+        Create the index if needed and rebuild it from every stored article.
+
+        Returns:
+            int: Articles indexed.
+
+        Raises:
+            RuntimeError: If the database is not SQLite.
+        """
+
+        if db.session.get_bind().dialect.name != "sqlite":
+            raise RuntimeError("full-text index requires SQLite; other databases use LIKE search")
+
+        SearchService.install(db.session.connection())
+        db.session.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        db.session.commit()
+
+        return db.session.scalar(text(f"SELECT count(*) FROM {_ARTICLES}"))
+
+    @staticmethod
+    def parse(query):
+        """
+        Split free text into search terms.
+
+        Args:
+            query (str): User input, e.g. 'climate "carbon tax" elect*'.
+
+        Returns:
+            list[tuple]: (words, prefix) per term, where words is a list
+            of tokens matched as a phrase and prefix is True when the
+            term ended with *.
+        """
+
+        terms = []
+        for phrase, bare in _TOKEN.findall(query or ""):
+            words = _WORD.findall(phrase or bare)
+            if words:
+                terms.append((words, bool(bare) and bare.endswith("*")))
+
+        return terms
+
+    @staticmethod
+    def match_expression(terms):
+        """
+        Build an FTS5 MATCH expression requiring every term.
+
+        Terms are quoted, so FTS5 operators and column filters typed by
+        the user are searched as text rather than interpreted.
+
+        Args:
+            terms (list[tuple]): Output of parse().
+
+        Returns:
+            str: MATCH expression.
+        """
+
+        return " ".join(
+            '"' + " ".join(words) + '"' + ("*" if prefix else "")
+            for words, prefix in terms
+        )
+
+    @staticmethod
+    def render(marked):
+        """
+        Escape text and turn highlight markers into <mark> tags.
+
+        Args:
+            marked (str | None): Text with MARK_START / MARK_END markers.
+
+        Returns:
+            Markup: Safe HTML.
+        """
+
+        html = str(escape(marked or ""))
+        return Markup(html.replace(MARK_START, "<mark>").replace(MARK_END, "</mark>"))
+
+    @staticmethod
+    def _mark(value, pattern):
+        """Wrap every pattern match in highlight markers."""
+
+        return pattern.sub(lambda m: MARK_START + m.group(0) + MARK_END, value or "")
+
+    @staticmethod
+    def _excerpt(value, pattern):
+        """Cut about SNIPPET_TOKENS words around the first match, marked."""
+
+        value = value or ""
+        match = pattern.search(value)
+        words = value.split()
+        first = len(value[:match.start()].split()) if match else 0
+        start = max(0, min(first - SNIPPET_TOKENS // 4, len(words) - SNIPPET_TOKENS))
+        excerpt = " ".join(words[start:start + SNIPPET_TOKENS])
+
+        return (
+            ("…" if start > 0 else "")
+            + SearchService._mark(excerpt, pattern)
+            + ("…" if start + SNIPPET_TOKENS < len(words) else "")
+        )
+
+    @staticmethod
+    def _escape_like(value):
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def encode_cursor(upper, offset):
+        """
+        Encode a search position as an opaque, URL-safe cursor.
+
+        Args:
+            upper (int | None): Exclusive upper article id of the current
+                rank window. The first page sets it to the newest match's
+                id + 1, so articles stored between pages do not shift
+                later pages. None only for a search without results.
+            offset (int): Results of that window already returned.
+
+        Returns:
+            str: Cursor token for the next page.
+        """
+
+        raw = f"{'' if upper is None else upper}|{offset}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(token):
+        """
+        Decode a cursor produced by encode_cursor().
+
+        Args:
+            token (str): Cursor token.
+
+        Returns:
+            tuple: (upper, offset)
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+
+        try:
+            raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+            upper, offset = raw.split("|")
+            upper, offset = (int(upper) if upper else None), int(offset)
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise ValueError(f"invalid cursor: {token!r}") from exc
+
+        if offset < 0:
+            raise ValueError(f"invalid cursor: {token!r}")
+
+        return upper, offset
+
+    @staticmethod
+    def _window_start(match, upper, window):
+        """Lowest article id among the `window` newest matches below upper."""
+
+        stmt = select(fts.c.rowid).where(match)
+        if upper is not None:
+            stmt = stmt.where(fts.c.rowid < upper)
+
+        return db.session.scalar(stmt.order_by(fts.c.rowid.desc()).limit(1).offset(window - 1))
+
+    @staticmethod
+    def _ranked(stmt, match, upper, offset, limit, window):
+        """
+        Read one page of BM25-ranked matches, window by window.
+
+        BM25 scores every match before sorting, so ranking all matches of
+        a common word costs time in proportion to its frequency. Each
+        window holds the `window` newest remaining matches (an article id
+        range the index seeks to directly); matches are ranked within a
+        window, and a page that exhausts one continues in the next.
+
+        The first page (upper None) is pinned below the newest match at
+        the time, so results inserted between pages cannot move a later
+        page's window or offset.
+
+        Returns:
+            tuple: (rows, next position as (upper, offset) or None).
+        """
+
+        if upper is None:
+            newest = db.session.scalar(
+                select(fts.c.rowid).where(match).order_by(fts.c.rowid.desc()).limit(1)
+            )
+            if newest is None:
+                return [], None
+            upper = newest + 1
+
+        rows = []
+        while True:
+            bounded = stmt.where(fts.c.rowid < upper)
+            lower = SearchService._window_start(match, upper, window) if window else None
+            if lower is not None:
+                bounded = bounded.where(fts.c.rowid >= lower)
+
+            # Fetch one extra row to learn whether another page exists
+            wanted = limit - len(rows)
+            batch = db.session.execute(bounded.limit(wanted + 1).offset(offset)).all()
+            if len(batch) > wanted:
+                return rows + batch[:wanted], (upper, offset + wanted)
+
+            rows.extend(batch)
+            if lower is None:
+                return rows, None
+            upper, offset = lower, 0
+
+    @staticmethod
+    def search(query, topic=None, source=None, label=None, cursor=None, limit=50, window=1000):
+        """
+        Find articles matching every term, best match first.
+
+        Args:
+            query (str): Free-text query (see parse()).
+            topic / source / label (str, optional): Explorer filters.
+            cursor (str, optional): Token from a previous page's next_cursor.
+            limit (int): Maximum results per page.
+            window (int): Matches ranked together, newest first (see
+                _ranked()); 0 ranks all matches at once.
+
+        Returns:
+            tuple: (results, next_cursor). Each result is an
+            ArticleService.to_dict() dict plus title_html and snippet
+            (Markup with <mark> highlights) and rank (BM25, lower is
+            better; None for the LIKE fallback). next_cursor is None on
+            the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+
+        upper, offset = SearchService.decode_cursor(cursor) if cursor else (None, 0)
+
+        terms = SearchService.parse(query)
+        if not terms:
+            return [], None
+
+        stmt = ArticleService.filtered_query(topic, source, label)
+
+        if SearchService.available():
+            match = literal_column(FTS_TABLE).op("MATCH")(SearchService.match_expression(terms))
+            stmt = (
+                stmt.add_columns(
+                    func.highlight(literal_column(FTS_TABLE), 0, MARK_START, MARK_END).label("title_marked"),
+                    func.snippet(literal_column(FTS_TABLE), 1, MARK_START, MARK_END, "…", SNIPPET_TOKENS)
+                    .label("snippet_marked"),
+                    fts.c.rank
+                )
+                .join(fts, fts.c.rowid == Article.id)
+                .where(match)
+                # Rank alone lets FTS5 sort internally (ties by rowid), so
+                # highlights and snippets are built for returned rows only
+                .order_by(fts.c.rank)
+            )
+            rows, position = SearchService._ranked(stmt, match, upper, offset, limit, window)
+            pattern = None
+        else:
+            # Pin later pages below the articles stored when paging began
+            if upper is None:
+                upper = (db.session.scalar(select(func.max(Article.id))) or 0) + 1
+            stmt = stmt.where(Article.id < upper)
+
+            for words, _ in terms:
+                like = "%" + SearchService._escape_like(" ".join(words)) + "%"
+                stmt = stmt.where(or_(
+                    Article.title.ilike(like, escape="\\"),
+                    Article.description.ilike(like, escape="\\")
+                ))
+            stmt = stmt.order_by(Article.created_at.desc(), Article.id.desc())
+
+            # Fetch one extra row to learn whether another page exists
+            rows = db.session.execute(stmt.limit(limit + 1).offset(offset)).all()
+            rows, position = rows[:limit], (upper, offset + limit) if len(rows) > limit else None
+            pattern = re.compile(
+                "|".join(r"\W+".join(map(re.escape, words)) for words, _ in terms),
+                re.IGNORECASE
+            )
+
+        results = []
+        for row in rows:
+            data = ArticleService.to_dict(row)
+            if pattern is None:
+                title = data.pop('title_marked')
+                snippet = data.pop('snippet_marked')
+            else:
+                title = SearchService._mark(row.title, pattern)
+                snippet = SearchService._excerpt(row.description, pattern)
+                data['rank'] = None
+
+            data['title_html'] = SearchService.render(title)
+            data['snippet'] = SearchService.render(snippet)
+            results.append(data)
+
+        next_cursor = SearchService.encode_cursor(*position) if position else None
+
+        return results, next_cursor
+
+
+@event.listens_for(Article.__table__, "after_create")
+def _create_index(target, connection, **kw):
+    """Create the search index alongside a new Article table on SQLite."""
+
+    if connection.dialect.name != "sqlite":
+        return
+
+    try:
+        SearchService.install(connection)
+    except OperationalError:
+        # SQLite built without FTS5: search falls back to LIKE
+        pass
@@ -0,0 +1,274 @@
+"""
+sentiment_cache.py
+
+Content-addressed memoization cache for sentiment scores.
+
+The same headline frequently arrives from several providers and from
+repeated submissions of a topic. Rather than rerun VADER each time,
+results are memoized under a hash of the normalized text combined with
+a scorer fingerprint (scorer/lexicon version and label thresholds).
+
+Layers:
+    - In-process LRU bounded to a fixed number of entries
+    - Optional persistent SQLite table, so hits survive restarts
+
+Invalidation:
+    The fingerprint is part of every key, so changing the lexicon or label
+    thresholds invalidates the cache without manual intervention. Rows of
+    other fingerprints are left alone: several processes with different
+    configurations may share one file. The persistent table is instead
+    bounded by age and row count; the oldest rows are evicted first,
+    which drops unused fingerprints over time.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+# Keys per SELECT ... IN (...) against the persistent table
+LOOKUP_CHUNK_SIZE = 500
+
+# Rows written between two evictions from the persistent table
+EVICT_INTERVAL = 10_000
+
+
+class SentimentCache:
+    """
+    SentimentCache
+
+    Two-level (memory + disk) cache mapping text keys to
+    (sentiment_score, sentiment_label) pairs. Safe to share across threads.
+    """
+
+    def __init__(self, maxsize=10_000):
+        self.maxsize = maxsize
+        self.fingerprint = ""
+        self.path = None
+        self.max_rows = 1_000_000
+        self.max_age = 30 * 86400.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._conn = None
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def configure(self, maxsize=None, path=None, max_rows=None, max_age=None):
+        """
+        (Re)configure the cache.
+
+        Args:
+            maxsize (int, optional): In-process LRU capacity.
+            path (str, optional): SQLite file for the persistent layer.
+                None keeps the cache in memory only.
+            max_rows (int, optional): Row bound of the persistent table.
+            max_age (float, optional): Seconds a persistent row is kept.
+
+        Notes:
+            Old and excess persistent rows, of any fingerprint, are
+            evicted here and every EVICT_INTERVAL written rows.
+        """
+
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if max_rows is not None:
+                self.max_rows = max_rows
+            if max_age is not None:
+                self.max_age = max_age
+
+            if path != self.path:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+                if path:
+                    self._conn = sqlite3.connect(path, check_same_thread=False)
+                    # Cache rows are reproducible, so trade durability for speed
+                    self._conn.execute("PRAGMA journal_mode=WAL")
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+                    self._conn.execute(
+                        "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                        "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+                        "score REAL NOT NULL, label TEXT NOT NULL, "
+                        "stored_at REAL NOT NULL DEFAULT 0)"
+                    )
+                    columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sentiment_cache)")}
+                    if "stored_at" not in columns:
+                        # Files written before eviction by age: rows count as oldest
+                        self._conn.execute(
+                            "ALTER TABLE sentiment_cache ADD COLUMN stored_at REAL NOT NULL DEFAULT 0"
+                        )
+                    self._conn.execute(
+                        "CREATE INDEX IF NOT EXISTS ix_sentiment_cache_stored_at "
+                        "ON sentiment_cache (stored_at)"
+                    )
+                self.path = path
+
+            if self._conn is not None:
+                self._evict()
+                self._conn.commit()
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def use_fingerprint(self, fingerprint):
+        """
+        Switch the scorer identity that keys are built from.
+
+        Args:
+            fingerprint (str): Scorer identity; part of every key.
+
+        Notes:
+            The in-process layer is cleared when the fingerprint changes.
+            Persistent rows stay: their keys simply no longer match.
+        """
+
+        with self._lock:
+            if fingerprint != self.fingerprint:
+                self._entries.clear()
+            self.fingerprint = fingerprint
+
+    def key(self, text):
+        """
+        Compute the cache key for a text.
+
+        Whitespace is collapsed but case is preserved, since VADER scores
+        capitalized words differently.
+
+        Args:
+            text (str): Text to be scored.
+
+        Returns:
+            str: Hex SHA-256 of fingerprint + normalized text.
+        """
+
+        normalized = re.sub(r"\s+", " ", text).strip()
+        payload = f"{self.fingerprint}\0{normalized}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get_many(self, keys):
+        """
+        Look up several keys, consulting memory first and then disk.
+
+        Args:
+            keys (Iterable[str]): Keys produced by key().
+
+        Returns:
+            dict: key -> (sentiment_score, sentiment_label) for every hit.
+        """
+
+        keys = list(dict.fromkeys(keys))
+        found = {}
+
+        with self._lock:
+            missing = []
+            for key in keys:
+                value = self._entries.get(key)
+                if value is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+
+            if missing and self._conn is not None:
+                for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                    chunk = missing[start:start + LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, score, label FROM sentiment_cache "
+                        f"WHERE key IN ({placeholders})",
+                        chunk
+                    )
+                    for key, score, label in rows:
+                        found[key] = (score, label)
+                        self._remember(key, (score, label))
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def put_many(self, values):
+        """
+        Store freshly computed results in both layers.
+
+        Args:
+            values (dict): key -> (sentiment_score, sentiment_label).
+        """
+
+        if not values:
+            return
+
+        with self._lock:
+            for key, value in values.items():
+                self._remember(key, value)
+
+            if self._conn is not None:
+                now = time.time()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache "
+                    "(key, fingerprint, score, label, stored_at) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (key, self.fingerprint, score, label, now)
+                        for key, (score, label) in values.items()
+                    ]
+                )
+
+                self._writes += len(values)
+                if self._writes >= EVICT_INTERVAL:
+                    self._evict()
+                self._conn.commit()
+
+    def stats(self):
+        """
+        Return cache counters.
+
+        Returns:
+            dict: hits, misses, hit_rate, size (in-process entries),
+            maxsize, evictions (persistent rows) and persistent (whether
+            a disk layer is attached).
+        """
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'evictions': self.evictions,
+                'persistent': self._conn is not None
+            }
+
+    def _remember(self, key, value):
+        """Insert into the LRU, evicting the least recently used entry."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _evict(self):
+        """Drop persistent rows past max_age, then the oldest past max_rows (lock held)."""
+
+        self._writes = 0
+
+        self.evictions += self._conn.execute(
+            "DELETE FROM sentiment_cache WHERE stored_at < ?",
+            (time.time() - self.max_age,)
+        ).rowcount
+
+        excess = self._conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0] - self.max_rows
+        if excess > 0:
+            self.evictions += self._conn.execute(
+                "DELETE FROM sentiment_cache WHERE key IN "
+                "(SELECT key FROM sentiment_cache ORDER BY stored_at LIMIT ?)",
+                (excess,)
+            ).rowcount
@@ -0,0 +1,100 @@
+"""
+timeseries_service.py
+
+Serves sentiment trends over time from the SentimentRollup table.
+
+Rollups are maintained per (topic, source) in hourly and daily buckets
+by AggregateService at ingest time, so a trend query reads at most one
+row per (bucket, topic, source) in the requested window and never scans
+the Article table. Hourly buckets of archived months are compacted away
+(see archive_service.py); daily buckets cover the whole history.
+
+Position in Pipeline:
+    AggregateService → SentimentRollup → TimeseriesService → Dashboard / API
+"""
+
+from sqlalchemy import func, select
+
+from app import db
+from app.models.sentiment_rollup import SentimentRollup
+from app.services.aggregate_service import ROLLUP_GRANULARITIES
+from app.services.bias_service import BiasService
+
+
+class TimeseriesService:
+    """
+    TimeseriesService
+
+    Static helpers for querying precomputed sentiment rollups.
+    """
+
+    GRANULARITIES = tuple(ROLLUP_GRANULARITIES)
+
+    @staticmethod
+    def series(granularity="day", topic=None, source=None, start=None, end=None, by_source=False):
+        """
+        Return the sentiment time series for a window.
+
+        Args:
+            granularity (str): "hour" or "day".
+            topic (str, optional): Restrict to one topic.
+            source (str, optional): Restrict to one source.
+            start (datetime, optional): Inclusive lower bound on bucket_start.
+            end (datetime, optional): Exclusive upper bound on bucket_start.
+            by_source (bool): Return one series per source instead of a
+                single series combining all sources.
+
+        Returns:
+            list[dict]: Points ordered by bucket, each with bucket (ISO
+            string), article_count, avg_sentiment and sentiment_stdev,
+            plus source when by_source is set. Buckets without articles
+            are omitted.
+
+        Raises:
+            ValueError: If granularity is not supported.
+        """
+
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"unsupported granularity: {granularity!r}")
+
+        group = [SentimentRollup.bucket_start]
+        if by_source:
+            group.append(SentimentRollup.source)
+
+        stmt = (
+            select(
+                *group,
+                func.sum(SentimentRollup.article_count),
+                func.sum(SentimentRollup.score_sum),
+                func.sum(SentimentRollup.score_sq_sum)
+            )
+            .where(SentimentRollup.granularity == granularity)
+            .group_by(*group)
+            .order_by(*group)
+        )
+
+        if topic:
+            stmt = stmt.where(SentimentRollup.topic == topic)
+        if source:
+            stmt = stmt.where(SentimentRollup.source == source)
+        if start:
+            stmt = stmt.where(SentimentRollup.bucket_start >= start)
+        if end:
+            stmt = stmt.where(SentimentRollup.bucket_start < end)
+
+        points = []
+
+        for row in db.session.execute(stmt):
+            bucket, row_source = row[0], (row[1] if by_source else None)
+            count, total, total_sq = row[-3:]
+            if not count:
+                continue
+
+            point = BiasService.metrics_from_sums(row_source or None, count, total, total_sq)
+            point['bucket'] = bucket.isoformat()
+            if not by_source:
+                del point['source']
+
+            points.append(point)
+
+        return points
@@ -0,0 +1,296 @@
+"""
+vader_engine.py
+
+Fast VADER compound scorer, compatible bit for bit with NLTK's
+SentimentIntensityAnalyzer.
+
+NLTK's implementation spends most of its time on setup it repeats for
+every text: it builds a {punctuation + word: word} dictionary with 34
+entries per distinct word to strip punctuation, lowercases the same
+tokens many times, looks up each word's position with list.index() and
+re-checks booster, negation and idiom rules for every repeated word.
+
+This engine takes the lexicon and rule tables from an NLTK analyzer
+once and then scores each text in a single tokenizing pass:
+
+    - Punctuation is stripped with str.strip-style checks on the rare
+      tokens that start or end with punctuation (same result as NLTK's
+      lookup table, see _strip())
+    - Each token is lowercased once
+    - Valence is computed once per distinct token and reused for
+      repeats (NLTK evaluates every repeat at the position of its first
+      occurrence, so the values are identical)
+    - Idiom strings are only built when a nearby token can be part of
+      an idiom or a two-word booster
+
+Floating-point operations are performed in the same order as NLTK's so
+that compound scores are identical, not merely close;
+benchmarks/bench_vader.py checks this against a differential corpus.
+
+Position in Pipeline:
+    Article Text → SentimentService → VaderEngine → Sentiment Score
+"""
+
+import math
+import string
+
+
+# Characters NLTK treats as punctuation (REGEX_REMOVE_PUNCTUATION)
+PUNCTUATION = string.punctuation
+
+_REMOVE_PUNCTUATION = str.maketrans("", "", PUNCTUATION)
+
+
+class VaderEngine:
+    """
+    Compiled VADER scorer.
+
+    Args:
+        lexicon (dict): word -> valence, as SentimentIntensityAnalyzer.lexicon.
+        constants (VaderConstants): NLTK rule tables and constants.
+    """
+
+    def __init__(self, lexicon, constants):
+        self.lexicon = dict(lexicon)
+        self.negate = frozenset(constants.NEGATE)
+        self.boosters = dict(constants.BOOSTER_DICT)
+        self.idioms = dict(constants.SPECIAL_CASE_IDIOMS)
+        self.punc_list = frozenset(constants.PUNC_LIST)
+
+        self.b_decr = constants.B_DECR
+        self.c_incr = constants.C_INCR
+        self.n_scalar = constants.N_SCALAR
+
+        # Tokens (case-sensitive, as NLTK compares them) that can appear
+        # in an idiom or a multi-word booster such as "kind of"
+        self.phrase_words = frozenset(
+            word
+            for phrase in list(self.idioms) + [key for key in self.boosters if " " in key]
+            for word in phrase.split()
+        )
+
+    @classmethod
+    def from_analyzer(cls, analyzer):
+        """
+        Build an engine sharing an NLTK analyzer's lexicon and constants.
+
+        Args:
+            analyzer (SentimentIntensityAnalyzer): Loaded NLTK analyzer.
+
+        Returns:
+            VaderEngine
+        """
+
+        return cls(analyzer.lexicon, analyzer.constants)
+
+    def _strip(self, token):
+        """
+        Remove leading or trailing punctuation the way NLTK does.
+
+        NLTK maps a token to w when it equals p + w or w + p, with p in
+        PUNC_LIST and w a punctuation-free word of two or more
+        characters. Since w contains no punctuation, p must be the whole
+        leading (or trailing) punctuation run, which is checked directly.
+        """
+
+        head = token.rstrip(PUNCTUATION)
+        if len(head) != len(token):
+            if (token[len(head):] in self.punc_list and len(head) > 1
+                    and head.translate(_REMOVE_PUNCTUATION) == head):
+                return head
+            return token
+
+        tail = token.lstrip(PUNCTUATION)
+        if (token[:len(token) - len(tail)] in self.punc_list and len(tail) > 1
+                and tail.translate(_REMOVE_PUNCTUATION) == tail):
+            return tail
+        return token
+
+    def tokenize(self, text):
+        """
+        Split text into VADER tokens (NLTK SentiText.words_and_emoticons).
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            list[str]: Tokens of two or more characters, with surrounding
+            punctuation removed where NLTK removes it.
+        """
+
+        words = []
+        for token in text.split():
+            if len(token) < 2:
+                continue
+            if token[0] in PUNCTUATION or token[-1] in PUNCTUATION:
+                token = self._strip(token)
+            words.append(token)
+
+        return words
+
+    def _negated(self, lowered):
+        return lowered in self.negate or "n't" in lowered
+
+    def _idioms(self, valence, words, i):
+        """NLTK's _idioms_check for the token at index i (i > 2)."""
+
+        n = len(words)
+        onezero = f"{words[i - 1]} {words[i]}"
+        twoonezero = f"{words[i - 2]} {words[i - 1]} {words[i]}"
+        twoone = f"{words[i - 2]} {words[i - 1]}"
+        threetwoone = f"{words[i - 3]} {words[i - 2]} {words[i - 1]}"
+        threetwo = f"{words[i - 3]} {words[i - 2]}"
+
+        for sequence in (onezero, twoonezero, twoone, threetwoone, threetwo):
+            if sequence in self.idioms:
+                valence = self.idioms[sequence]
+                break
+
+        if n - 1 > i:
+            zeroone = f"{words[i]} {words[i + 1]}"
+            if zeroone in self.idioms:
+                valence = self.idioms[zeroone]
+        if n - 1 > i + 1:
+            zeroonetwo = f"{words[i]} {words[i + 1]} {words[i + 2]}"
+            if zeroonetwo in self.idioms:
+                valence = self.idioms[zeroonetwo]
+
+        if threetwo in self.boosters or twoone in self.boosters:
+            valence = valence + self.b_decr
+
+        return valence
+
+    def _valence(self, words, lowered, i, is_cap_diff):
+        """Valence of the token at index i (NLTK polarity_scores loop body)."""
+
+        lexicon = self.lexicon
+        low = lowered[i]
+
+        if low in self.boosters or (
+            low == "kind" and i < len(words) - 1 and lowered[i + 1] == "of"
+        ):
+            return 0
+
+        valence = lexicon.get(low)
+        if valence is None:
+            return 0
+
+        # Sentiment-laden word in ALL CAPS while others are not
+        if is_cap_diff and words[i].isupper():
+            if valence > 0:
+                valence += self.c_incr
+            else:
+                valence -= self.c_incr
+
+        for start_i in range(3):
+            if i <= start_i:
+                break
+
+            previous_low = lowered[i - (start_i + 1)]
+            if previous_low in lexicon:
+                continue
+
+            # Booster / dampener, fading with distance
+            scalar = 0.0
+            if previous_low in self.boosters:
+                scalar = self.boosters[previous_low]
+                if valence < 0:
+                    scalar *= -1
+                if is_cap_diff and words[i - (start_i + 1)].isupper():
+                    if valence > 0:
+                        scalar += self.c_incr
+                    else:
+                        scalar -= self.c_incr
+            if start_i == 1 and scalar != 0:
+                scalar = scalar * 0.95
+            if start_i == 2 and scalar != 0:
+                scalar = scalar * 0.9
+            valence = valence + scalar
+
+            # Negation ("never so" / "never this" intensify instead)
+            if start_i == 0:
+                if self._negated(lowered[i - 1]):
+                    valence = valence * self.n_scalar
+            elif start_i == 1:
+                if words[i - 2] == "never" and words[i - 1] in ("so", "this"):
+                    valence = valence * 1.5
+                elif self._negated(lowered[i - 2]):
+                    valence = valence * self.n_scalar
+            else:
+                if (words[i - 3] == "never" and words[i - 2] in ("so", "this")) \
+                        or words[i - 1] in ("so", "this"):
+                    valence = valence * 1.25
+                elif self._negated(lowered[i - 3]):
+                    valence = valence * self.n_scalar
+
+                if not self.phrase_words.isdisjoint(words[i - 3:i + 3]):
+                    valence = self._idioms(valence, words, i)
+
+        # "least" negation, unless "at least" / "very least"
+        if i > 1 and lowered[i - 1] not in lexicon and lowered[i - 1] == "least":
+            if lowered[i - 2] != "at" and lowered[i - 2] != "very":
+                valence = valence * self.n_scalar
+        elif i > 0 and lowered[i - 1] not in lexicon and lowered[i - 1] == "least":
+            valence = valence * self.n_scalar
+
+        return valence
+
+    def compound(self, text):
+        """
+        Compute the VADER compound score.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            float: Compound score in [-1, 1], rounded to 4 decimals
+            exactly as NLTK's polarity_scores()['compound'].
+        """
+
+        if not isinstance(text, str):
+            text = str(text.encode("utf-8"))
+
+        words = self.tokenize(text)
+        if not words:
+            return 0.0
+
+        lowered = [word.lower() for word in words]
+
+        # Some but not all tokens in ALL CAPS
+        caps = sum(1 for word in words if word.isupper())
+        is_cap_diff = 0 < caps < len(words)
+
+        # NLTK scores every token at the index of its first occurrence
+        first = {}
+        for index, word in enumerate(words):
+            first.setdefault(word, index)
+
+        valences = {
+            word: self._valence(words, lowered, index, is_cap_diff)
+            for word, index in first.items()
+        }
+        sentiments = [valences[word] for word in words]
+
+        # Contrast: "but" halves what precedes it and boosts what follows
+        if "but" in lowered:
+            but_index = lowered.index("but")
+            for index, sentiment in enumerate(sentiments):
+                if index < but_index:
+                    sentiments[index] = sentiment * 0.5
+                elif index > but_index:
+                    sentiments[index] = sentiment * 1.5
+
+        total = float(sum(sentiments))
+
+        # Emphasis from exclamation points (up to 4) and question marks
+        questions = text.count("?")
+        emphasis = min(text.count("!"), 4) * 0.292
+        if questions > 1:
+            emphasis += questions * 0.18 if questions <= 3 else 0.96
+
+        if total > 0:
+            total += emphasis
+        elif total < 0:
+            total -= emphasis
+
+        return round(total / math.sqrt(total * total + 15), 4)
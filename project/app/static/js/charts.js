@@ -3,7 +3,16 @@ function loadSentimentChart(labels, values) {
 
     if (!ctx) return;
 
-    new Chart(ctx, {
+    // Update an existing chart in place rather than creating a second one
+    const existing = Chart.getChart(ctx);
+    if (existing) {
+        existing.data.labels = labels;
+        existing.data.datasets[0].data = values;
+        existing.update();
+        return existing;
+    }
+
+    return new Chart(ctx, {
         type: 'bar',
         data: {
             labels: labels,
@@ -21,4 +30,113 @@ function loadSentimentChart(labels, values) {
             }
         }
     });
-}
\ No newline at end of file
+}
+
+function applyDashboardUpdate(chart, kind, update) {
+    const labels = chart.data.labels;
+    const values = chart.data.datasets[0].data;
+
+    if (kind === 'snapshot') {
+        labels.length = 0;
+        values.length = 0;
+    }
+
+    update.sources.forEach(entry => {
+        const index = labels.indexOf(entry.source);
+        if (index !== -1) {
+            values[index] = entry.avg_sentiment;
+            return;
+        }
+
+        // Keep the server's source order
+        let position = labels.findIndex(label => label > entry.source);
+        if (position === -1) position = labels.length;
+        labels.splice(position, 0, entry.source);
+        values.splice(position, 0, entry.avg_sentiment);
+    });
+
+    (update.removed || []).forEach(source => {
+        const index = labels.indexOf(source);
+        if (index !== -1) {
+            labels.splice(index, 1);
+            values.splice(index, 1);
+        }
+    });
+
+    chart.update();
+
+    ['bias_index', 'polarization', 'total_articles'].forEach(name => {
+        const element = document.querySelector('[data-metric="' + name + '"]');
+        if (element) element.textContent = update[name];
+    });
+}
+
+function connectDashboardStream(element, chart) {
+    if (!element || !chart || !window.EventSource) return;
+
+    // EventSource reconnects by itself, resuming from the last event id
+    const source = new EventSource(element.dataset.streamUrl);
+
+    ['delta', 'snapshot'].forEach(kind => {
+        source.addEventListener(kind, event => {
+            applyDashboardUpdate(chart, kind, JSON.parse(event.data));
+        });
+    });
+
+    return source;
+}
+
+function loadTrendChart(canvas) {
+    if (!canvas) return;
+
+    fetch(canvas.dataset.seriesUrl)
+        .then(response => response.json())
+        .then(series => {
+            new Chart(canvas, {
+                type: 'line',
+                data: {
+                    labels: series.points.map(point => point.bucket.slice(0, 10)),
+                    datasets: [{
+                        label: "Daily Average Sentiment",
+                        data: series.points.map(point => point.avg_sentiment)
+                    }]
+                },
+                options: {
+                    scales: {
+                        y: {
+                            min: -1,
+                            max: 1
+                        }
+                    }
+                }
+            });
+        });
+}
+
+function trackIngestJob(element) {
+    if (!element) return;
+
+    const url = element.dataset.jobUrl;
+
+    function poll() {
+        fetch(url)
+            .then(response => response.json())
+            .then(job => {
+                if (job.status === 'done' && window.EventSource) {
+                    // The live stream has already applied the new metrics
+                    element.textContent = 'Collected ' + (job.stored || 0) + ' articles for "' + job.topic + '".';
+                } else if (job.status === 'done') {
+                    // Reload without the job parameter to show fresh metrics
+                    window.location.replace(window.location.pathname);
+                } else if (job.status === 'failed' || job.error) {
+                    element.textContent = 'Ingestion failed: ' + (job.error || 'unknown job');
+                } else {
+                    element.textContent = 'Collecting articles for "' + job.topic + '" (' +
+                        (job.stage || job.status) + ')\u2026';
+                    setTimeout(poll, 1000);
+                }
+            });
+    }
+
+    poll();
+}
@@ -0,0 +1,18 @@
+"""
+benchmarks
+
+Performance benchmarks for NarrativeIQ.
+
+Each module is runnable from the project root, e.g.:
+
+    python -m benchmarks.bench_ingest
+
+Benchmarks build their own scratch SQLite databases under a temporary
+directory and never touch the configured application database. Network
+benchmarks use local provider stand-ins (benchmarks.providers).
+
+Every benchmark prints one JSON object per result line. To run the
+whole suite and collect a single JSON report for tracking regressions:
+
+    python -m benchmarks.run --output report.json
+"""
@@ -0,0 +1,175 @@
+"""
+bench_bias.py
+
+Benchmarks the NumPy BiasEngine against the list-based BiasService code
+it replaced.
+
+Scores are drawn per source around a source-specific mean and rounded to
+two decimals like SentimentService output. The legacy path groups
+Article-like objects in a defaultdict and uses statistics.stdev; the
+engine path runs on columnar arrays (source codes and scores). Both must
+produce identical source metrics, bias index and polarization. Encoding
+source names to codes and bootstrap confidence intervals are timed
+separately.
+
+Differential check: small random datasets (unscored articles, missing
+sources, scores on and off the two-decimal grid) go through the legacy
+code, BiasService.compute_source_metrics / compute_bias_index /
+compute_polarization and BiasEngine.analyze; results must be equal (==).
+The process exits with status 1 on any difference, so CI can run the
+check alone with --check-only.
+
+Usage:
+    python -m benchmarks.bench_bias [--rows 1000000] [--sources 25] [--iterations 1000]
+                                    [--trials 5000] [--check-only]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.bias_engine import BiasEngine
+from app.services.bias_service import BiasService
+
+
+def legacy_analyze(articles):
+    """The pre-engine BiasService.compute_source_metrics / indices."""
+
+    source_score = defaultdict(list)
+    for article in articles:
+        if article.sentiment_score is not None:
+            source_score[article.source].append(article.sentiment_score)
+
+    source_metrics = []
+    for source, scores in source_score.items():
+        source_metrics.append({
+            'source': source,
+            'avg_sentiment': round(sum(scores) / len(scores), 3),
+            'article_count': len(scores)
+        })
+
+    values = [s['avg_sentiment'] for s in source_metrics]
+    bias_index = round(max(values) - min(values), 3) if values else 0.0
+    polarization = round(statistics.stdev(values), 3) if len(values) > 1 else 0.0
+
+    return source_metrics, bias_index, polarization
+
+
+def random_articles(rng):
+    """A small dataset with unscored articles and missing sources."""
+
+    sources = [f"source-{n}" for n in range(rng.randint(1, 8))] + [None]
+    on_grid = rng.random() < 0.5
+
+    articles = []
+    for _ in range(rng.randint(0, 60)):
+        score = rng.uniform(-1, 1)
+        articles.append(SimpleNamespace(
+            source=rng.choice(sources),
+            sentiment_score=None if rng.random() < 0.15 else (round(score, 2) if on_grid else score)
+        ))
+
+    return articles
+
+
+def differential(trials, seed=5):
+    """Compare the shipped paths with legacy_analyze on random datasets."""
+
+    rng = random.Random(seed)
+    mismatches = []
+
+    for _ in range(trials):
+        articles = random_articles(rng)
+        expected = legacy_analyze(articles)
+
+        metrics = BiasService.compute_source_metrics(articles)
+        service = (metrics, BiasService.compute_bias_index(metrics), BiasService.compute_polarization(metrics))
+
+        codes, names = BiasEngine.encode_sources([article.source for article in articles])
+        scores = np.array([article.sentiment_score for article in articles], dtype=np.float64)
+        analyzed = BiasEngine.analyze(codes, scores, names, iterations=0)
+        engine = (analyzed['source_metrics'], analyzed['bias_index'], analyzed['polarization'])
+
+        for path, actual in (("service", service), ("engine", engine)):
+            if actual != expected:
+                mismatches.append({'path': path, 'legacy': expected, 'actual': actual})
+
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sources", type=int, default=25)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--trials", type=int, default=5000)
+    parser.add_argument("--check-only", action="store_true", help="Run the differential check only.")
+    args = parser.parse_args()
+
+    mismatches = differential(args.trials)
+    print(json.dumps({
+        'check': "differential",
+        'trials': args.trials,
+        'mismatches': len(mismatches),
+        'examples': mismatches[:3]
+    }), flush=True)
+
+    if args.check_only or mismatches:
+        sys.exit(1 if mismatches else 0)
+
+    rng = np.random.default_rng(11)
+    names = np.array([f"source-{n:02d}" for n in range(args.sources)], dtype=object)
+    codes = rng.integers(0, args.sources, args.rows)
+    scores = np.round(np.clip(rng.normal(rng.uniform(-0.5, 0.5, args.sources)[codes], 0.4), -1, 1), 2)
+    sources = names[codes]
+
+    articles = [
+        SimpleNamespace(source=source, sentiment_score=score)
+        for source, score in zip(sources.tolist(), scores.tolist())
+    ]
+
+    def best(fn):
+        timings = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - t0)
+        return min(timings), result
+
+    legacy_s, legacy = best(lambda: legacy_analyze(articles))
+    encode_s, (codes, names) = best(lambda: BiasEngine.encode_sources(sources))
+    engine_s, engine = best(lambda: BiasEngine.analyze(codes, scores, names, iterations=0))
+
+    assert engine['source_metrics'] == legacy[0], "source metrics differ"
+    assert (engine['bias_index'], engine['polarization']) == legacy[1:], "indices differ"
+
+    bootstrap_s, intervals = best(lambda: BiasEngine.analyze(
+        codes, scores, names, iterations=args.iterations, seed=1
+    ))
+
+    print(json.dumps({
+        'rows': args.rows,
+        'sources': args.sources,
+        'legacy_ms': round(1e3 * legacy_s, 1),
+        'engine_ms': round(1e3 * engine_s, 1),
+        'speedup': round(legacy_s / engine_s, 1),
+        'encode_sources_ms': round(1e3 * encode_s, 1),
+        'engine_with_bootstrap_ms': round(1e3 * bootstrap_s, 1),
+        'bootstrap_iterations': args.iterations,
+        'bias_index': engine['bias_index'],
+        'bias_index_ci': intervals['bias_index_ci'],
+        'polarization': engine['polarization'],
+        'polarization_ci': intervals['polarization_ci']
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+bench_db_concurrency.py
+
+Mixed read/write load test against a file-backed SQLite database.
+
+Writer processes call NewsService.save_articles() in a loop with fresh
+corpus batches (scoring, dedup, aggregates, commit), while reader
+processes request /dashboard and /articles through the Flask test
+client, all for a fixed duration. The same workload runs twice on
+identically prefilled databases:
+
+    - before: rollback journal, synchronous=FULL and the driver's 5 s
+      busy timeout (SQLite defaults)
+    - after: the default configuration (WAL, synchronous=NORMAL, 30 s
+      busy timeout)
+
+Reported per mode: completed reads and write batches per second,
+latency percentiles, and operations that failed (e.g. "database is
+locked"). The dashboard cache is disabled so every read hits the
+database.
+
+Usage:
+    python -m benchmarks.bench_db_concurrency [--rows 20000] [--writers 4] [--readers 4] [--batch 10] [--duration 20]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+
+from app import create_app, db
+from app.models.article import Article
+from app.services.aggregate_service import AggregateService
+from benchmarks import corpus
+
+
+MODES = {
+    'before': {'SQLITE_JOURNAL_MODE': "DELETE", 'SQLITE_SYNCHRONOUS': "FULL", 'SQLITE_BUSY_TIMEOUT': 5000},
+    'after': {}
+}
+
+READ_PATHS = (
+    "/dashboard?topic=ai",
+    "/dashboard?topic=ai&start=2026-03-01&end=2026-05-31",
+    "/articles?topic=ai"
+)
+
+
+def make_app(path, mode):
+    return create_app(dict(
+        MODES[mode],
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}",
+        SENTIMENT_CACHE_PATH='',
+        RESPONSE_CACHE_PATH='',
+        DASHBOARD_CACHE_SIZE=0
+    ))
+
+
+def prefill(path, mode, rows):
+    app = make_app(path, mode)
+    with app.app_context():
+        db.create_all()
+        batch = []
+        for row in corpus.article_rows(rows):
+            batch.append(row)
+            if len(batch) == 10_000:
+                db.session.execute(insert(Article), batch)
+                batch = []
+        if batch:
+            db.session.execute(insert(Article), batch)
+        db.session.commit()
+
+        AggregateService.rebuild_source_metrics()
+        AggregateService.rebuild_rollups()
+        db.engine.dispose()
+
+
+def writer(path, mode, index, batch_size, start, deadline, results):
+    app = make_app(path, mode)
+    from app.services.news_service import NewsService
+
+    items = [
+        dict(item, provider="newsapi")
+        for item in corpus.generate(20_000, duplicate_rate=0.0, seed=100 + index)
+    ]
+
+    latencies, errors, stored = [], 0, 0
+    with app.app_context():
+        start.wait()
+        offset = 0
+        while time.time() < deadline:
+            batch = items[offset:offset + batch_size]
+            offset = (offset + batch_size) % len(items)
+
+            began = time.perf_counter()
+            try:
+                stored += NewsService.save_articles("ai", batch)
+                latencies.append(time.perf_counter() - began)
+            except OperationalError:
+                db.session.rollback()
+                errors += 1
+
+    results.put({'role': "writer", 'latencies': latencies, 'errors': errors, 'stored': stored})
+
+
+def reader(path, mode, index, start, deadline, results):
+    client = make_app(path, mode).test_client()
+
+    latencies, errors = [], 0
+    start.wait()
+    n = index
+    while time.time() < deadline:
+        began = time.perf_counter()
+        try:
+            status = client.get(READ_PATHS[n % len(READ_PATHS)]).status_code
+        except OperationalError:
+            status = None
+        n += 1
+
+        if status == 200:
+            latencies.append(time.perf_counter() - began)
+        else:
+            errors += 1
+
+    results.put({'role': "reader", 'latencies': latencies, 'errors': errors})
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(1000 * values[int(fraction * (len(values) - 1))], 1)
+
+
+def run_mode(mode, args):
+    context = multiprocessing.get_context("fork")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        prefill(path, mode, args.rows)
+
+        start = context.Event()
+        results = context.Queue()
+        # Deadline leaves time for every process to build its app first
+        deadline = time.time() + 5 + args.duration
+
+        processes = [
+            context.Process(target=writer, args=(path, mode, i, args.batch, start, deadline, results))
+            for i in range(args.writers)
+        ] + [
+            context.Process(target=reader, args=(path, mode, i, start, deadline, results))
+            for i in range(args.readers)
+        ]
+        for process in processes:
+            process.start()
+
+        time.sleep(deadline - args.duration - time.time())
+        start.set()
+
+        collected = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    reads = [value for r in collected if r['role'] == "reader" for value in r['latencies']]
+    writes = [value for r in collected if r['role'] == "writer" for value in r['latencies']]
+
+    return {
+        'mode': mode,
+        'table_rows': args.rows,
+        'writers': args.writers,
+        'readers': args.readers,
+        'duration_s': args.duration,
+        'reads_per_s': round(len(reads) / args.duration, 1),
+        'read_p50_ms': round(1000 * statistics.median(reads), 1) if reads else None,
+        'read_p95_ms': percentile(reads, 0.95),
+        'read_errors': sum(r['errors'] for r in collected if r['role'] == "reader"),
+        'write_batches_per_s': round(len(writes) / args.duration, 1),
+        'articles_stored_per_s': round(
+            sum(r['stored'] for r in collected if r['role'] == "writer") / args.duration, 1
+        ),
+        'write_p95_ms': percentile(writes, 0.95),
+        'write_errors': sum(r['errors'] for r in collected if r['role'] == "writer")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=20.0)
+    args = parser.parse_args()
+
+    for mode in MODES:
+        print(json.dumps(run_mode(mode, args)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+bench_dedup.py
+
+Benchmarks near-duplicate detection as ingest runs it: DedupService.index_articles
+against a SQLite database.
+
+A synthetic corpus is stored batch by batch. Each batch's Article rows are
+inserted untimed, then index_articles is timed on them: signatures, the
+set-based LshBucket candidate lookup, loading candidate signatures, the
+bulk story_id/minhash UPDATE and the LshBucket inserts, plus the commit.
+Per-batch cost is sampled as the table grows; if it stays flat, candidate
+checks are sublinear in corpus size. Cluster assignments read back from
+Article.story_id are scored against the corpus ground truth.
+
+Usage:
+    python -m benchmarks.bench_dedup [--articles 1000000] [--duplicate-rate 0.2] [--batch-size 100]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+from sqlalchemy import func, insert, select
+
+from app import create_app, db
+from app.models.article import Article
+from app.models.lsh_bucket import LshBucket
+from app.services.dedup_service import DedupService
+from benchmarks import corpus
+
+
+def store(batch, first_id):
+    """Insert a batch of corpus items as Article rows with known ids."""
+
+    db.session.execute(insert(Article), [
+        {
+            'id': first_id + offset,
+            'title': item['title'],
+            'description': item['description'],
+            'source': item['source'],
+            'topic': item['topic'],
+            'sentiment_score': 0.0,
+            'sentiment_label': "Neutral"
+        }
+        for offset, item in enumerate(batch)
+    ])
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--duplicate-rate", type=float, default=0.2)
+    parser.add_argument("--batch-size", type=int, default=100,
+                        help="Articles per index_articles call (one provider page).")
+    args = parser.parse_args()
+
+    checkpoints = {int(args.articles * f) for f in (0.01, 0.1, 0.5, 1.0)}
+    truth = np.empty(args.articles, dtype=np.int64)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{path}",
+            'SENTIMENT_CACHE_PATH': '',
+            'RESPONSE_CACHE_PATH': ''
+        })
+
+        with app.app_context():
+            db.create_all()
+
+            window = {'batches': 0, 'articles': 0, 'index_s': 0.0, 'commit_s': 0.0}
+            total_s = 0.0
+            stored = 0
+            batch = []
+
+            def flush():
+                nonlocal stored, total_s, window
+
+                first_id = stored + 1
+                store(batch, first_id)
+
+                t0 = time.perf_counter()
+                DedupService.index_articles([
+                    (first_id + offset, f"{item['title']} {item['description']}")
+                    for offset, item in enumerate(batch)
+                ])
+                t1 = time.perf_counter()
+                db.session.commit()
+                t2 = time.perf_counter()
+
+                total_s += t2 - t0
+                window['batches'] += 1
+                window['articles'] += len(batch)
+                window['index_s'] += t1 - t0
+                window['commit_s'] += t2 - t1
+
+                previous, stored = stored, stored + len(batch)
+                batch.clear()
+
+                if any(previous < checkpoint <= stored for checkpoint in checkpoints):
+                    print(json.dumps({
+                        'indexed_articles': stored,
+                        'index_ms_per_batch': round(1000 * window['index_s'] / window['batches'], 2),
+                        'commit_ms_per_batch': round(1000 * window['commit_s'] / window['batches'], 2),
+                        'us_per_article': round(
+                            1e6 * (window['index_s'] + window['commit_s']) / window['articles'], 1
+                        ),
+                        'lsh_rows': db.session.scalar(select(func.count()).select_from(LshBucket)),
+                        'db_mb': round(os.path.getsize(path) / 2**20, 1)
+                    }), flush=True)
+                    window = {'batches': 0, 'articles': 0, 'index_s': 0.0, 'commit_s': 0.0}
+
+            for index, item in enumerate(corpus.generate(args.articles, args.duplicate_rate)):
+                truth[index] = item['story']
+                batch.append(item)
+                if len(batch) == args.batch_size:
+                    flush()
+            if batch:
+                flush()
+
+            # Article ids are corpus index + 1
+            stories = np.fromiter(
+                db.session.scalars(select(Article.story_id).order_by(Article.id)),
+                dtype=np.int64, count=args.articles
+            ) - 1
+
+            db.session.remove()
+            db.engine.dispose()
+
+    # Ground truth: truth[i] is the index of the story's original article.
+    # Clustering is correct when an article lands in its original's cluster.
+    positions = np.arange(args.articles)
+    originals = truth == positions
+    correct = stories[truth] == stories
+    detected = (stories != positions) & ~originals
+
+    duplicates = int((~originals).sum())
+    false_merges = int((originals & (stories != positions)).sum())
+
+    print(json.dumps({
+        'articles': args.articles,
+        'duplicate_rate': args.duplicate_rate,
+        'batch_size': args.batch_size,
+        'articles_per_s': round(args.articles / total_s, 1),
+        'cluster_accuracy': round(float(correct.mean()), 4),
+        'duplicate_recall': round(int(detected.sum()) / duplicates, 4) if duplicates else None,
+        'false_merges': false_merges
+    }))
+
+
+if __name__ == "__main__":
+    main()
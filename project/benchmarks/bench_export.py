@@ -0,0 +1,124 @@
+"""
+bench_export.py
+
+Compares chunked ExportService exports with a naive pandas.read_sql of
+the full Article table.
+
+A scratch database is bulk-loaded once; each mode then runs in a fresh
+interpreter that reports wall time and peak resident memory above its
+post-import baseline. The naive mode loads the whole table into a
+DataFrame before writing Parquet, so its memory grows with the table;
+the chunked modes should stay flat.
+
+Usage:
+    python -m benchmarks.bench_export [--rows 1000000] [--chunk-size 10000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from sqlalchemy import insert
+
+from app import create_app, db
+from app.models.article import Article
+from benchmarks import corpus
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("naive_read_sql_parquet", "export_parquet", "export_arrow", "export_csv")
+
+CHILD = """
+import json, os, resource, sys, time
+mode, database, output, chunk_size = sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4])
+
+import pandas as pd
+import pyarrow, pyarrow.parquet
+from app import create_app, db
+from app.services.export_service import ExportService
+
+app = create_app({
+    'SQLALCHEMY_DATABASE_URI': f"sqlite:///{database}",
+    'SENTIMENT_CACHE_PATH': '',
+    'RESPONSE_CACHE_PATH': ''
+})
+
+with app.app_context():
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+
+    if mode == "naive_read_sql_parquet":
+        frame = pd.read_sql("SELECT * FROM article", db.engine)
+        frame.to_parquet(output, compression="zstd")
+        rows = len(frame)
+    else:
+        with open(output, "wb") as handle:
+            rows = ExportService.export(mode.split("_")[1], handle, chunk_size=chunk_size)['rows']
+
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({
+    'rows': rows,
+    'elapsed_s': elapsed,
+    'peak_rss_delta_mb': (peak - baseline) / 1024,
+    'output_mb': os.path.getsize(output) / 2 ** 20
+}))
+"""
+
+
+def prefill(path, rows):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{path}",
+        'SENTIMENT_CACHE_PATH': '',
+        'RESPONSE_CACHE_PATH': ''
+    })
+    with app.app_context():
+        db.create_all()
+        batch = []
+        for row in corpus.article_rows(rows):
+            batch.append(row)
+            if len(batch) == 10_000:
+                db.session.execute(insert(Article), batch)
+                batch = []
+        if batch:
+            db.session.execute(insert(Article), batch)
+        db.session.commit()
+        db.engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = os.path.join(tmp, "bench.db")
+        prefill(database, args.rows)
+
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, "-c", CHILD, mode, database,
+                 os.path.join(tmp, f"out-{mode}"), str(args.chunk_size)],
+                cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+
+            print(json.dumps({
+                'mode': mode,
+                'rows': result['rows'],
+                'chunk_size': None if mode.startswith("naive") else args.chunk_size,
+                'elapsed_s': round(result['elapsed_s'], 2),
+                'rows_per_s': round(result['rows'] / result['elapsed_s'], 1),
+                'peak_rss_delta_mb': round(result['peak_rss_delta_mb'], 1),
+                'output_mb': round(result['output_mb'], 1)
+            }), flush=True)
+
+
+if __name__ == "__main__":
+    main()
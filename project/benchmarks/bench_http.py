@@ -0,0 +1,146 @@
+"""
+bench_http.py
+
+Measures /dashboard, /articles and /api/timeseries latency as the
+Article table grows.
+
+For each size a scratch database is bulk-loaded with pre-scored corpus
+rows, SourceMetric and SentimentRollup are rebuilt, and each endpoint is
+requested repeatedly through the Flask test client (no network). Median
+and 95th percentile latency per endpoint should stay roughly flat with
+table size for every read path that uses an index or a precomputed
+aggregate.
+
+Endpoints are timed with the dashboard cache disabled, so every request
+does the full work. The date-range dashboard is then timed again with
+the cache enabled (warm) and as a conditional GET answered with 304.
+
+Usage:
+    python -m benchmarks.bench_http [--sizes 10000 100000 1000000] [--requests 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import func, insert, select
+
+from app import create_app, db
+from app.models.article import Article
+from app.services import dashboard_service
+from app.services.aggregate_service import AggregateService
+from app.services.article_service import ArticleService
+from benchmarks import corpus
+
+
+INSERT_CHUNK = 10_000
+WARMUP_REQUESTS = 2
+
+
+def prefill(size):
+    rows = []
+    for row in corpus.article_rows(size):
+        rows.append(row)
+        if len(rows) == INSERT_CHUNK:
+            db.session.execute(insert(Article), rows)
+            rows = []
+    if rows:
+        db.session.execute(insert(Article), rows)
+    db.session.commit()
+
+    AggregateService.rebuild_source_metrics()
+    AggregateService.rebuild_rollups()
+
+
+def endpoints():
+    """Request paths to time, including a cursor from the middle of the table."""
+
+    middle = db.session.execute(
+        select(Article.created_at, Article.id)
+        .order_by(Article.created_at.desc(), Article.id.desc())
+        .offset(db.session.scalar(select(func.count()).select_from(Article)) // 2)
+        .limit(1)
+    ).one()
+    cursor = ArticleService.encode_cursor(SimpleNamespace(created_at=middle[0], id=middle[1]))
+
+    return {
+        'dashboard': "/dashboard",
+        'dashboard_topic': "/dashboard?topic=ai",
+        'dashboard_date_range': "/dashboard?topic=ai&start=2026-03-01&end=2026-05-31",
+        'articles_first_page': "/articles",
+        'articles_deep_page': f"/articles?cursor={cursor}",
+        'articles_source_filter': "/articles?source=Source+3",
+        'timeseries_daily': "/api/timeseries?granularity=day&topic=ai"
+    }
+
+
+def run_size(size, requests):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            'SENTIMENT_CACHE_PATH': '',
+            'RESPONSE_CACHE_PATH': '',
+            'DASHBOARD_CACHE_SIZE': 0
+        })
+        client = app.test_client()
+
+        with app.app_context():
+            db.create_all()
+
+            start = time.perf_counter()
+            prefill(size)
+            load_s = time.perf_counter() - start
+
+            paths = endpoints()
+
+        result = {'table_rows': size, 'load_s': round(load_s, 1), 'requests': requests}
+
+        def measure(name, path, headers=None, status=200):
+            timings = []
+            for n in range(WARMUP_REQUESTS + requests):
+                start = time.perf_counter()
+                response = client.get(path, headers=headers)
+                elapsed = time.perf_counter() - start
+
+                assert response.status_code == status, (path, response.status_code)
+                if n >= WARMUP_REQUESTS:
+                    timings.append(elapsed)
+
+            timings.sort()
+            result[f"{name}_p50_ms"] = round(1000 * statistics.median(timings), 2)
+            result[f"{name}_p95_ms"] = round(1000 * timings[int(0.95 * (len(timings) - 1))], 2)
+            return response
+
+        for name, path in paths.items():
+            measure(name, path)
+
+        dashboard_service.cache.configure(256)
+        response = measure("dashboard_date_range_cached", paths['dashboard_date_range'])
+        measure(
+            "dashboard_date_range_304", paths['dashboard_date_range'],
+            headers={'If-None-Match': response.headers['ETag']}, status=304
+        )
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(json.dumps(run_size(size, args.requests)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
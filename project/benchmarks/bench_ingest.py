@@ -0,0 +1,115 @@
+"""
+bench_ingest.py
+
+Measures NewsService.save_articles ingest cost as the Article table grows.
+
+For each table size the database is pre-filled with synthetic rows, then
+batches of fresh and already-stored headlines are ingested. Per-batch
+latency of the set-based path should stay flat with table size, while the
+legacy per-title lookup (one unindexed `title =` query per article) grows
+linearly.
+
+Usage:
+    python -m benchmarks.bench_ingest [--sizes 1000 10000 100000] [--batches 20]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import insert
+
+from app import create_app, db
+from app.models.article import Article
+from app.services.news_service import NewsService
+from app.services.sentiment_service import SentimentService
+
+
+BATCH_SIZE = 40
+
+
+def make_item(n):
+    return {
+        'title': f"Synthetic headline number {n} about markets",
+        'description': "Analysts weigh the outlook as investors react.",
+        'source': f"Source {n % 25}",
+        'published_at': "2026-01-01T12:00:00Z"
+    }
+
+
+def prefill(size):
+    rows = []
+    for n in range(size):
+        item = make_item(n)
+        rows.append({
+            'title': item['title'],
+            'title_hash': Article.hash_title(item['title']),
+            'description': item['description'],
+            'source': item['source'],
+            'topic': "bench",
+            'sentiment_score': 0.0,
+            'sentiment_label': "Neutral"
+        })
+        if len(rows) == 10_000:
+            db.session.execute(insert(Article), rows)
+            rows = []
+    if rows:
+        db.session.execute(insert(Article), rows)
+    db.session.commit()
+
+
+def run_size(size, batches):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            'SENTIMENT_CACHE_PATH': os.path.join(tmp, 'sentiment_cache.db'),
+            'RESPONSE_CACHE_PATH': ''
+        })
+
+        with app.app_context():
+            db.create_all()
+            prefill(size)
+            SentimentService.warm_up()
+
+            ingest, legacy = [], []
+            for b in range(batches):
+                # Half the batch is new, half already stored
+                fresh = [make_item(size + b * BATCH_SIZE + i) for i in range(BATCH_SIZE // 2)]
+                dupes = [make_item((b * BATCH_SIZE + i) % size) for i in range(BATCH_SIZE // 2)]
+                batch = fresh + dupes
+
+                start = time.perf_counter()
+                for item in batch:
+                    Article.query.filter_by(title=item['title']).first()
+                legacy.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                NewsService.save_articles("bench", batch)
+                ingest.append(time.perf_counter() - start)
+
+            db.session.remove()
+            db.engine.dispose()
+
+    return {
+        'table_rows': size,
+        'batch_size': BATCH_SIZE,
+        'batches': batches,
+        'ingest_ms_per_batch': round(1000 * sum(ingest) / batches, 3),
+        'legacy_lookup_ms_per_batch': round(1000 * sum(legacy) / batches, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--batches", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(json.dumps(run_size(size, args.batches)))
+
+
+if __name__ == "__main__":
+    main()
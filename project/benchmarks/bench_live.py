@@ -0,0 +1,228 @@
+"""
+bench_live.py
+
+Measures live dashboard updates pushed over Server-Sent Events.
+
+A scratch database is prefilled with corpus articles, then --clients
+streams are opened, split across two dashboard views (all topics and
+one topic). Each of --ingests batches is saved through
+NewsService.save_articles, and the run waits until every stream has
+received the new data version before the next batch.
+
+Reported: dashboard computations per ingest (the broadcaster should
+compute each view once, however many clients watch it), commit-to-event
+latency (median and worst over all streams), the size of a delta event
+against the full dashboard page a client reloaded before, and the time
+to serve --clients page reloads for comparison. The SSE wire format is
+checked end to end through the test client.
+
+Usage:
+    python -m benchmarks.bench_live [--rows 100000] [--clients 200] [--ingests 10] [--batch 50]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from sqlalchemy import insert
+
+from app import create_app, db
+from app.models.article import Article
+from app.services.aggregate_service import AggregateService
+from benchmarks import corpus
+
+
+VIEWS = [(None, None, None, None), ("ai", None, None, None)]
+
+
+def prefill(rows):
+    batch = []
+    for row in corpus.article_rows(rows):
+        batch.append(row)
+        if len(batch) == 10_000:
+            db.session.execute(insert(Article), batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(Article), batch)
+    db.session.commit()
+
+    AggregateService.rebuild_source_metrics()
+    AggregateService.rebuild_rollups()
+
+
+def consume(stream, final, received):
+    """Record when each version arrives on a stream, up to the final one."""
+
+    while True:
+        event = stream.get(30)
+        if event is None:
+            return
+        version, kind, data = event
+        received.append((version, kind, len(json.dumps(data)), time.perf_counter()))
+        if version >= final:
+            return
+
+
+def check_wire_format(app, ingest):
+    """Read one event through the route and check its SSE framing."""
+
+    from app.services.dashboard_service import DashboardService
+
+    client = app.test_client()
+    with app.app_context():
+        version = DashboardService.current_version()
+
+    response = client.get(f"/api/dashboard/stream?version={version}", buffered=False)
+    chunks = iter(response.response)
+
+    timer = threading.Timer(0.2, ingest)
+    timer.start()
+    chunk = next(chunks)
+    while chunk.startswith(b":"):
+        chunk = next(chunks)
+    timer.join()
+    response.close()
+
+    text = chunk.decode()
+    lines = text.split("\n")
+
+    return (
+        response.mimetype == "text/event-stream"
+        and lines[0] == f"id: {version + 1}"
+        and lines[1] == "event: delta"
+        and lines[2].startswith("data: {")
+        and text.endswith("\n\n")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--ingests", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            'SENTIMENT_CACHE_PATH': '',
+            'RESPONSE_CACHE_PATH': '',
+            # Only ingests in this process should trigger a broadcast
+            'LIVE_POLL_INTERVAL': 60,
+            'LIVE_MAX_STREAMS': args.clients + 1
+        })
+
+        from app.services import dashboard_service
+        from app.services.dashboard_service import DashboardService
+        from app.services.news_service import NewsService
+
+        # Count dashboard computations and time each broadcast trigger
+        computations = [0]
+        compute = DashboardService.compute
+
+        def counted(*filters):
+            computations[0] += 1
+            return compute(*filters)
+
+        DashboardService.compute = staticmethod(counted)
+
+        notified = {}
+        notify = dashboard_service.broadcaster.notify
+
+        def timed_notify():
+            notified[DashboardService.current_version()] = time.perf_counter()
+            notify()
+
+        dashboard_service.broadcaster.notify = timed_notify
+
+        articles = iter(corpus.generate(args.rows + (args.ingests + 1) * args.batch, seed=11))
+
+        def ingest():
+            with app.app_context():
+                NewsService.save_articles("ai", [next(articles) for _ in range(args.batch)])
+
+        with app.app_context():
+            db.create_all()
+            prefill(args.rows)
+            for _ in range(args.rows):
+                next(articles)
+
+            version = DashboardService.current_version()
+            streams = []
+            for n in range(args.clients):
+                topic, start, end, syndication = VIEWS[n % len(VIEWS)]
+                key = DashboardService.cache_key(topic, start, end, syndication)
+                # Warm the view so the broadcaster's first pass is a cache hit
+                DashboardService.entry(version, key, topic, start, None, syndication)
+                streams.append(DashboardService.subscribe(key, topic, start, None, syndication, version))
+
+        client = app.test_client()
+        page = client.get("/dashboard")
+        page_bytes = len(page.data)
+
+        received = [[] for _ in streams]
+        consumers = [
+            threading.Thread(target=consume, args=(stream, version + args.ingests, log), daemon=True)
+            for stream, log in zip(streams, received)
+        ]
+        for consumer in consumers:
+            consumer.start()
+
+        computations[0] = 0
+        started = time.perf_counter()
+        for n in range(args.ingests):
+            ingest()
+            target = version + n + 1
+            while not all(any(entry[0] >= target for entry in log) for log in received):
+                time.sleep(0.001)
+        elapsed = time.perf_counter() - started
+        computed = computations[0]
+        for consumer in consumers:
+            consumer.join(5)
+
+        with app.app_context():
+            for stream in streams:
+                DashboardService.unsubscribe(stream)
+
+        latencies = [
+            entry[3] - notified[entry[0]]
+            for log in received for entry in log if entry[0] in notified
+        ]
+        deltas = [entry[2] for log in received for entry in log if entry[1] == "delta"]
+
+        # Before live updates every open page reloaded after an ingest
+        started = time.perf_counter()
+        for _ in range(args.clients):
+            client.get("/dashboard")
+        reload_s = time.perf_counter() - started
+
+        wire_ok = check_wire_format(app, ingest)
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    print(json.dumps({
+        'rows': args.rows,
+        'clients': args.clients,
+        'views': len(VIEWS),
+        'ingests': args.ingests,
+        'events': sum(len(log) for log in received),
+        'computations_per_ingest': round(computed / args.ingests, 2),
+        'ingest_cycle_ms': round(1000 * elapsed / args.ingests, 1),
+        'event_latency_median_ms': round(1000 * statistics.median(latencies), 2),
+        'event_latency_max_ms': round(1000 * max(latencies), 2),
+        'delta_bytes_mean': round(statistics.mean(deltas)),
+        'page_bytes': page_bytes,
+        'page_reloads_ms': round(1000 * reload_s, 1),
+        'wire_format_ok': wire_ok
+    }), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+bench_pipeline.py
+
+Measures end-to-end ingest throughput against local provider stand-ins.
+
+Both providers are served by ProviderStub with configurable latency, and
+the application is pointed at them through NEWSAPI_URL / GNEWS_URL. Two
+paths are timed on a fresh database:
+
+    - quick: NewsService.fetch_all + save_articles for a batch of topics
+      (the dashboard "Analyze" flow)
+    - deep: NewsService.deep_ingest, which pages through every provider
+      and saves in chunks as pages arrive
+
+Each result reports articles fetched and stored, wall time and stored
+articles per second, including fetch, scoring, dedup and commit.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--latency 0.1] [--topics 20] [--deep-total 2000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from app import create_app, db
+from app.services.news_service import NewsService
+from app.services.sentiment_service import SentimentService
+from benchmarks.providers import ProviderStub
+
+
+def make_app(tmp, stubs, page_size):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+        'SENTIMENT_CACHE_PATH': os.path.join(tmp, 'sentiment_cache.db'),
+        'RESPONSE_CACHE_PATH': '',
+        'NEWS_API_KEY': "bench",
+        'GNEWS_API_KEY': "bench",
+        'NEWSAPI_URL': stubs['newsapi'].url,
+        'GNEWS_URL': stubs['gnews'].url,
+        # Stubs are local; lift provider quotas so the pipeline is the bottleneck
+        'NEWSAPI_RATE': 1000.0,
+        'NEWSAPI_BURST': 1000,
+        'GNEWS_RATE': 1000.0,
+        'GNEWS_BURST': 1000,
+        'DEEP_FETCH_PAGE_SIZE': page_size
+    })
+
+
+def run_quick(stubs, topics):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(tmp, stubs, page_size=100)
+
+        with app.app_context():
+            db.create_all()
+            SentimentService.warm_up()
+
+            fetched = stored = 0
+            start = time.perf_counter()
+            for n in range(topics):
+                topic = f"topic-{n}"
+                articles = NewsService.fetch_all(topic)
+                fetched += len(articles)
+                stored += NewsService.save_articles(topic, articles)
+            elapsed = time.perf_counter() - start
+
+            db.session.remove()
+            db.engine.dispose()
+
+    return {
+        'path': "quick",
+        'topics': topics,
+        'fetched': fetched,
+        'stored': stored,
+        'elapsed_s': round(elapsed, 3),
+        'articles_per_s': round(stored / elapsed, 1)
+    }
+
+
+def run_deep(stubs, page_size):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(tmp, stubs, page_size)
+        app.config['DEEP_FETCH_MAX_PAGES'] = max(
+            -(-stub.total // page_size) for stub in stubs.values()
+        )
+
+        with app.app_context():
+            db.create_all()
+            SentimentService.warm_up()
+
+            start = time.perf_counter()
+            totals = NewsService.deep_ingest("deep-topic")
+            elapsed = time.perf_counter() - start
+
+            db.session.remove()
+            db.engine.dispose()
+
+    return {
+        'path': "deep",
+        'page_size': page_size,
+        **totals,
+        'elapsed_s': round(elapsed, 3),
+        'articles_per_s': round(totals['stored'] / elapsed, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--deep-total", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    common = {'latency': args.latency, 'jitter': args.jitter}
+
+    stubs = {
+        provider: ProviderStub(provider, total=10, **common).start()
+        for provider in NewsService.PROVIDERS
+    }
+    try:
+        result = run_quick(stubs, args.topics)
+    finally:
+        for stub in stubs.values():
+            stub.stop()
+    print(json.dumps({'latency_s': args.latency, **result}), flush=True)
+
+    stubs = {
+        provider: ProviderStub(provider, total=args.deep_total, **common).start()
+        for provider in NewsService.PROVIDERS
+    }
+    try:
+        result = run_deep(stubs, args.page_size)
+    finally:
+        for stub in stubs.values():
+            stub.stop()
+    print(json.dumps({'latency_s': args.latency, **result}))
+
+
+if __name__ == "__main__":
+    main()
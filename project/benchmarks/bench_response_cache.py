@@ -0,0 +1,205 @@
+"""
+bench_response_cache.py
+
+Checks the provider response cache against a local NewsAPI stand-in and
+measures what a hit saves.
+
+NewsService.fetch_from_newsapi is pointed at a ProviderStub with
+--latency and the cache is reconfigured for each check:
+
+    - fresh: a repeated request within the TTL is served from the cache
+      without reaching the provider
+    - ttl_expiry: once TTL and stale window have passed the entry is a
+      miss and the provider is called again
+    - stale_while_revalidate: within the stale window the cached response
+      is returned without waiting for the provider, one background
+      refresh updates it, and the next request is a fresh hit
+    - lru_eviction: past max_bytes the least recently read entry is
+      evicted, not the oldest written one
+    - shared_size: two caches on one file (two processes) stay under
+      max_bytes together, and the running total they report matches the
+      bytes actually stored, including after an entry is overwritten
+
+Reported per check: ok plus the values checked. Timing: median latency
+of a miss (provider round trip) and of a fresh hit. The process exits
+with status 1 if any check fails.
+
+Usage:
+    python -m benchmarks.bench_response_cache [--latency 0.1] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from app import create_app
+from app.services import news_service
+from app.services.news_service import NewsService
+from app.services.response_cache import ResponseCache
+from benchmarks.providers import ProviderStub
+
+
+def timed_fetch(topic):
+    started = time.perf_counter()
+    articles = NewsService.fetch_from_newsapi(topic)
+    return articles, time.perf_counter() - started
+
+
+def check_fresh(stub, path, repeat):
+    NewsService.configure_cache(path, 60.0, 0.0, 10 * 1024 * 1024)
+
+    miss, hit = [], []
+    for n in range(repeat):
+        before = stub.requests
+        first, miss_s = timed_fetch(f"fresh-{n}")
+        second, hit_s = timed_fetch(f"fresh-{n}")
+        miss.append(miss_s)
+        hit.append(hit_s)
+        if stub.requests - before != 1 or first != second:
+            return {'ok': False, 'provider_requests': stub.requests - before}
+
+    return {
+        'ok': True,
+        'miss_ms': round(1000 * statistics.median(miss), 2),
+        'hit_ms': round(1000 * statistics.median(hit), 3),
+        'speedup': round(statistics.median(miss) / statistics.median(hit), 1)
+    }
+
+
+def check_ttl_expiry(stub, path):
+    NewsService.configure_cache(path, 0.2, 0.0, 10 * 1024 * 1024)
+
+    before = stub.requests
+    timed_fetch("expiry")
+    timed_fetch("expiry")
+    cached = stub.requests - before
+    time.sleep(0.3)
+    timed_fetch("expiry")
+    expired = stub.requests - before
+
+    return {'ok': cached == 1 and expired == 2, 'requests_within_ttl': cached, 'requests_after_ttl': expired}
+
+
+def check_stale_while_revalidate(stub, path):
+    NewsService.configure_cache(path, 0.2, 60.0, 10 * 1024 * 1024)
+
+    before = stub.requests
+    timed_fetch("swr")
+    time.sleep(0.3)
+
+    stale_hits = news_service.response_cache.stats()['stale_hits']
+    _, stale_s = timed_fetch("swr")
+    served_stale = news_service.response_cache.stats()['stale_hits'] - stale_hits
+
+    # Wait for the background refresh to land
+    deadline = time.monotonic() + 10 * stub.latency + 5
+    while news_service._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    refreshed = stub.requests - before
+
+    hits = news_service.response_cache.stats()['hits']
+    timed_fetch("swr")
+    fresh_after = news_service.response_cache.stats()['hits'] - hits
+
+    return {
+        'ok': served_stale == 1 and stale_s < stub.latency and refreshed == 2
+        and fresh_after == 1 and stub.requests - before == 2,
+        'stale_ms': round(1000 * stale_s, 3),
+        'provider_requests': stub.requests - before
+    }
+
+
+def check_lru_eviction(tmp):
+    cache = ResponseCache()
+    cache.configure(os.path.join(tmp, "lru.db"), 60.0, 0.0, 10 * 1024 * 1024)
+
+    body = {'articles': [os.urandom(512).hex()]}
+    for key in ("a", "b", "c"):
+        cache.put(key, "newsapi", body, 0)
+        time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+
+    # Room for three and a half entries, so a fourth evicts exactly one
+    size = cache.stats()['size_bytes']
+    cache.configure(cache.path, 60.0, 0.0, size + size // 6)
+    cache.put("d", "newsapi", body, 0)
+    kept = [key for key in ("a", "b", "c", "d") if cache.get(key) is not None]
+
+    return {'ok': kept == ["a", "c", "d"], 'kept': kept, 'evictions': cache.stats()['evictions']}
+
+
+def check_shared_size(tmp):
+    path = os.path.join(tmp, "shared.db")
+    max_bytes = 64 * 1024
+    workers = [ResponseCache(), ResponseCache()]
+    for cache in workers:
+        cache.configure(path, 60.0, 0.0, max_bytes)
+
+    # Each worker fills the cache on its own, one after the other
+    for n, cache in enumerate(workers):
+        for m in range(150):
+            cache.put(f"key-{n}-{m}", "newsapi", {'articles': [os.urandom(256).hex()]}, 0)
+
+    # Overwrite an entry the other worker stored, with a different size
+    workers[0].put("key-1-149", "newsapi", {'articles': [os.urandom(64).hex()]}, 0)
+
+    # Measured on the file itself, not from either cache's own accounting
+    with sqlite3.connect(path) as conn:
+        size = conn.execute("SELECT SUM(length(body)) FROM responses").fetchone()[0]
+    tracked = [cache.stats()['size_bytes'] for cache in workers]
+
+    return {
+        'ok': 0 < size <= max_bytes and tracked == [size, size],
+        'size_bytes': size,
+        'tracked_bytes': tracked,
+        'max_bytes': max_bytes
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    failed = False
+
+    with tempfile.TemporaryDirectory() as tmp, ProviderStub("newsapi", latency=args.latency) as stub:
+        path = os.path.join(tmp, "responses.db")
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            'SENTIMENT_CACHE_PATH': '',
+            'RESPONSE_CACHE_PATH': '',
+            'NEWS_API_KEY': "bench",
+            'NEWSAPI_URL': stub.url,
+            'NEWSAPI_RATE': 1000.0,
+            'NEWSAPI_BURST': 1000
+        })
+
+        with app.app_context():
+            checks = {
+                'fresh': lambda: check_fresh(stub, path, args.repeat),
+                'ttl_expiry': lambda: check_ttl_expiry(stub, path),
+                'stale_while_revalidate': lambda: check_stale_while_revalidate(stub, path),
+                'lru_eviction': lambda: check_lru_eviction(tmp),
+                'shared_size': lambda: check_shared_size(tmp)
+            }
+            for name, check in checks.items():
+                result = check()
+                failed = failed or not result['ok']
+                print(json.dumps({'check': name, **result}), flush=True)
+
+            NewsService.configure_cache(None, 0.0, 0.0, 0)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
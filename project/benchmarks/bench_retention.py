@@ -0,0 +1,179 @@
+"""
+bench_retention.py
+
+Measures archiving old articles out of the Article table.
+
+A scratch database is bulk-loaded with corpus articles published across
+2026 and copied once per archive format. For each copy, dashboard
+metrics are computed (dashboard cache disabled) for a recent date range
+that stays in the live table, a historical range that moves to the
+archive, and the unfiltered view with and without collapsing syndicated
+copies (neither reads the archive files). Then ArchiveService archives
+every month before the cutoff and the database is vacuumed, and the
+same views are timed again.
+
+Reported per format: archive throughput, live rows and database size
+before and after, archive size on disk, per-view latency before and
+after, and the largest difference in any source average or article
+count between the two (archiving should not change the metrics beyond
+last-digit rounding).
+
+Usage:
+    python -m benchmarks.bench_retention [--rows 300000] [--cutoff 2026-09-01] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import func, insert, select
+
+from app import create_app, db
+from app.models.article import Article
+from app.services.aggregate_service import AggregateService
+from benchmarks import corpus
+
+
+VIEWS = {
+    'recent_range': ("ai", datetime(2026, 10, 1), datetime(2026, 12, 1), None),
+    'historical_range': ("ai", datetime(2026, 3, 1), datetime(2026, 5, 1), None),
+    'historical_weight': (None, datetime(2026, 2, 1), datetime(2026, 4, 1), "weight"),
+    'unfiltered': (None, None, None, None),
+    'unfiltered_collapse': (None, None, None, "collapse")
+}
+
+
+def make_app(path, archive_dir):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{path}",
+        'SENTIMENT_CACHE_PATH': '',
+        'RESPONSE_CACHE_PATH': '',
+        'DASHBOARD_CACHE_SIZE': 0,
+        'ARCHIVE_DIR': archive_dir
+    })
+
+
+def prefill(path, rows):
+    app = make_app(path, None)
+    with app.app_context():
+        db.create_all()
+        batch = []
+        for row in corpus.article_rows(rows):
+            batch.append(row)
+            if len(batch) == 10_000:
+                db.session.execute(insert(Article), batch)
+                batch = []
+        if batch:
+            db.session.execute(insert(Article), batch)
+        db.session.commit()
+
+        AggregateService.rebuild_source_metrics()
+        AggregateService.rebuild_rollups()
+        db.engine.dispose()
+
+
+def directory_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path) for name in names
+    )
+
+
+def measure(repeat):
+    from app.services.dashboard_service import DashboardService
+
+    timings, payloads = {}, {}
+    for name, filters in VIEWS.items():
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            payloads[name] = DashboardService.compute(*filters)
+            samples.append(time.perf_counter() - started)
+        timings[name] = round(1000 * statistics.median(samples), 1)
+
+    return timings, payloads
+
+
+def max_difference(before, after):
+    worst = 0.0
+    for name in VIEWS:
+        old, new = before[name], after[name]
+        if old['total_articles'] != new['total_articles'] or len(old['source_metrics']) != len(new['source_metrics']):
+            return None
+        for left, right in zip(old['source_metrics'], new['source_metrics']):
+            if left['article_count'] != right['article_count']:
+                return None
+            worst = max(worst, abs(left['avg_sentiment'] - right['avg_sentiment']))
+
+    return round(worst, 3)
+
+
+def run_format(fmt, source_db, tmp, cutoff, repeat):
+    path = os.path.join(tmp, f"{fmt}.db")
+    archive_dir = os.path.join(tmp, f"archive-{fmt}")
+    shutil.copy(source_db, path)
+
+    app = make_app(path, archive_dir)
+    with app.app_context():
+        from app.services.archive_service import ArchiveService
+
+        live_before = db.session.scalar(select(func.count()).select_from(Article))
+        size_before = os.path.getsize(path)
+        before, payloads_before = measure(repeat)
+
+        started = time.perf_counter()
+        totals = ArchiveService.archive(cutoff, fmt=fmt, chunk_size=app.config['ARCHIVE_CHUNK_SIZE'])
+        archive_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        ArchiveService.vacuum()
+        vacuum_s = time.perf_counter() - started
+
+        live_after = db.session.scalar(select(func.count()).select_from(Article))
+        after, payloads_after = measure(repeat)
+
+    result = {
+        'format': fmt,
+        'archived': totals['archived'],
+        'archive_files': totals['files'],
+        'archive_s': round(archive_s, 2),
+        'archive_rows_per_s': round(totals['archived'] / archive_s, 1),
+        'vacuum_s': round(vacuum_s, 2),
+        'live_rows_before': live_before,
+        'live_rows_after': live_after,
+        'db_mb_before': round(size_before / 1e6, 1),
+        'db_mb_after': round(os.path.getsize(path) / 1e6, 1),
+        'archive_mb': round(directory_size(archive_dir) / 1e6, 1),
+        'max_avg_difference': max_difference(payloads_before, payloads_after)
+    }
+    for name in VIEWS:
+        result[f"{name}_before_ms"] = before[name]
+        result[f"{name}_after_ms"] = after[name]
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--cutoff", type=lambda value: datetime.strptime(value, "%Y-%m-%d"),
+                        default=datetime(2026, 9, 1))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--formats", nargs="+", default=["ndjson", "parquet"], choices=["ndjson", "parquet"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_db = os.path.join(tmp, "source.db")
+        prefill(source_db, args.rows)
+
+        for fmt in args.formats:
+            print(json.dumps(run_format(fmt, source_db, tmp, args.cutoff, args.repeat)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
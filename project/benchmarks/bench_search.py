@@ -0,0 +1,170 @@
+"""
+bench_search.py
+
+Measures full-text article search (SearchService) against the LIKE scan
+it replaces.
+
+A scratch SQLite database is bulk-loaded with corpus articles through
+the index triggers. Then a batch of articles is inserted with and
+without the insert trigger to price index maintenance, the index is
+rebuilt from scratch, and a set of queries (single word, two words,
+phrase, prefix, and a word combined with topic and sentiment filters)
+is timed through SearchService.search on the FTS5 index and through its
+LIKE fallback.
+
+Reported: load and rebuild throughput, index size, insert cost per
+batch with and without the index, and per query the number of matching
+articles and the median latency of a first page of results for both
+engines.
+
+Usage:
+    python -m benchmarks.bench_search [--rows 1000000] [--batch 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert, text
+
+from app import create_app, db
+from app.models.article import Article
+from benchmarks import corpus
+
+
+def load(rows, batch_size, seed):
+    batch = []
+    for row in corpus.article_rows(rows, seed=seed):
+        batch.append(row)
+        if len(batch) == batch_size:
+            db.session.execute(insert(Article), batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(Article), batch)
+    db.session.commit()
+
+
+def queries(sample):
+    """Search terms drawn from stored articles, so each one matches."""
+
+    title = sample.title.lower().split()
+    description = sample.description.rstrip(".").split()
+
+    return {
+        'word': (title[0], {}),
+        'two_words': (f"{title[0]} {description[0]}", {}),
+        'phrase': (f'"{description[1]} {description[2]}"', {}),
+        'prefix': (title[1][:3] + "*", {}),
+        'word_filtered': (title[2], {'topic': sample.topic, 'label': "Negative"})
+    }
+
+
+def time_search(query, filters, repeat):
+    from app.services.search_service import SearchService
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        SearchService.search(query, limit=50, **filters)
+        samples.append(time.perf_counter() - started)
+
+    return round(1000 * statistics.median(samples), 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--like-repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            'SENTIMENT_CACHE_PATH': '',
+            'RESPONSE_CACHE_PATH': ''
+        })
+
+        with app.app_context():
+            from app.services.search_service import FTS_TABLE, SearchService
+
+            db.create_all()
+
+            started = time.perf_counter()
+            load(args.rows, 10_000, seed=7)
+            load_s = time.perf_counter() - started
+
+            # Index maintenance cost: one batch through the trigger, one without
+            started = time.perf_counter()
+            load(args.batch, args.batch, seed=8)
+            indexed_insert_s = time.perf_counter() - started
+
+            db.session.execute(text(f"DROP TRIGGER {FTS_TABLE}_insert"))
+            started = time.perf_counter()
+            load(args.batch, args.batch, seed=9)
+            plain_insert_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            indexed = SearchService.rebuild()
+            rebuild_s = time.perf_counter() - started
+
+            try:
+                index_bytes = db.session.scalar(
+                    text("SELECT sum(pgsize) FROM dbstat WHERE name LIKE :name"),
+                    {'name': f"{FTS_TABLE}%"}
+                )
+            except Exception:
+                index_bytes = None
+            db.session.rollback()
+
+            sample = db.session.get(Article, args.rows // 2)
+            results = []
+            for name, (query, filters) in queries(sample).items():
+                match = SearchService.match_expression(SearchService.parse(query))
+                matches = db.session.scalar(
+                    text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"), {'match': match}
+                )
+
+                fts_ms = time_search(query, filters, args.repeat)
+
+                # Same call on the LIKE fallback
+                available = SearchService.available
+                SearchService.available = staticmethod(lambda: False)
+                try:
+                    like_ms = time_search(query, filters, args.like_repeat)
+                finally:
+                    SearchService.available = available
+
+                results.append({
+                    'query': name,
+                    'text': query,
+                    'filters': filters,
+                    'matches': matches,
+                    'fts_ms': fts_ms,
+                    'like_ms': like_ms,
+                    'speedup': round(like_ms / fts_ms, 1)
+                })
+
+            db.session.remove()
+            db.engine.dispose()
+
+    print(json.dumps({
+        'rows': args.rows,
+        'load_rows_per_s': round(args.rows / load_s, 1),
+        'rebuild_s': round(rebuild_s, 2),
+        'rebuild_rows_per_s': round(indexed / rebuild_s, 1),
+        'index_mb': round(index_bytes / 1e6, 1) if index_bytes else None,
+        'batch': args.batch,
+        'indexed_insert_ms': round(1000 * indexed_insert_s, 1),
+        'plain_insert_ms': round(1000 * plain_insert_s, 1)
+    }), flush=True)
+    for result in results:
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
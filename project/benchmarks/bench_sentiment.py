@@ -0,0 +1,85 @@
+"""
+bench_sentiment.py
+
+Measures sentiment scoring rate (texts per second).
+
+Texts are corpus headlines and descriptions with a few sentiment-bearing
+words mixed in, so VADER exercises its lexicon, negation and booster
+rules rather than short-circuiting on unknown tokens. Three paths are
+timed:
+
+    - score: SentimentService._score per text (no cache)
+    - batch_cold: analyze_batch on an empty cache (in-process, and on a
+      process pool when more than one CPU is available)
+    - batch_warm: analyze_batch on the same texts again (all cache hits)
+
+Usage:
+    python -m benchmarks.bench_sentiment [--texts 20000]
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+from app.services.sentiment_service import SentimentService
+from benchmarks import corpus
+
+
+SENTIMENT_WORDS = (
+    "good", "great", "excellent", "win", "hope", "strong", "love", "gain",
+    "bad", "terrible", "crisis", "loss", "fear", "weak", "hate", "fail",
+    "not", "very", "extremely", "barely", "but", "!"
+)
+
+
+def make_texts(count, seed=3):
+    rng = random.Random(seed)
+    texts = []
+    for item in corpus.generate(count, duplicate_rate=0.0, seed=seed):
+        words = f"{item['title']} {item['description']}".split()
+        for _ in range(4):
+            words.insert(rng.randrange(len(words)), rng.choice(SENTIMENT_WORDS))
+        texts.append(" ".join(words))
+    return texts
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--texts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+    SentimentService.configure_cache(maxsize=2 * args.texts, path=None)
+
+    start = time.perf_counter()
+    SentimentService.warm_up()
+    load_s = time.perf_counter() - start
+
+    results = {
+        'texts': args.texts,
+        'analyzer_load_ms': round(1000 * load_s, 1),
+        'score_per_s': round(args.texts / timed(lambda: [SentimentService._score(t) for t in texts]), 1)
+    }
+
+    workers = [1] + ([os.cpu_count()] if (os.cpu_count() or 1) > 1 else [])
+    for count in workers:
+        SentimentService.configure_cache(maxsize=2 * args.texts, path=None)
+        elapsed = timed(lambda: SentimentService.analyze_batch(texts, workers=count))
+        results[f"batch_cold_workers_{count}_per_s"] = round(args.texts / elapsed, 1)
+
+    elapsed = timed(lambda: SentimentService.analyze_batch(texts, workers=1))
+    results['batch_warm_per_s'] = round(args.texts / elapsed, 1)
+
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+bench_startup.py
+
+Measures process startup cost: importing the app package and running
+create_app().
+
+Each sample runs in a fresh interpreter so import caches are cold. The
+"eager" mode sets SENTIMENT_PRELOAD=1, which reproduces the previous
+behaviour of loading NLTK and the VADER lexicon at startup; "lazy" defers
+that work until text is first scored.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+CHILD = """
+import json, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app({
+    'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+    'SENTIMENT_CACHE_PATH': '',
+    'RESPONSE_CACHE_PATH': ''
+})
+booted = time.perf_counter()
+print(json.dumps({'import_s': imported - start, 'boot_s': booted - imported}))
+"""
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def sample(preload):
+    env = dict(os.environ, SENTIMENT_PRELOAD="1" if preload else "0")
+
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=PROJECT_ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    total = time.perf_counter() - start
+
+    result = json.loads(output.strip().splitlines()[-1])
+    result['process_s'] = total
+    return result
+
+
+def summarize(mode, samples):
+    return {
+        'mode': mode,
+        'runs': len(samples),
+        **{
+            f"{field}_median_ms": round(1000 * statistics.median(s[field] for s in samples), 1)
+            for field in ('import_s', 'boot_s', 'process_s')
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for mode, preload in (("eager", True), ("lazy", False)):
+        samples = [sample(preload) for _ in range(args.runs)]
+        print(json.dumps(summarize(mode, samples)))
+
+
+if __name__ == "__main__":
+    main()
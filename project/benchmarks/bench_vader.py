@@ -0,0 +1,161 @@
+"""
+bench_vader.py
+
+Checks that VaderEngine matches NLTK's VADER exactly and measures how
+much faster it scores.
+
+Differential check: every text in the corpus is scored by both
+implementations and the compound scores must be equal (==, not
+approximately). The corpus combines:
+
+    - hand-written cases for each VADER rule (negation, boosters and
+      dampeners, ALL CAPS, "but", "least", "never so", idioms, "kind of",
+      punctuation stripping and emphasis, repeated words, emoticons)
+    - the bench_sentiment texts (corpus headlines with sentiment words)
+    - random texts mixing lexicon entries, rule words, casing changes
+      and leading/trailing punctuation
+
+Throughput is measured single-threaded on the bench_sentiment texts,
+calling each engine's compound scorer directly (no cache, no rounding).
+The process exits with status 1 if any score differs, so CI can run
+the check alone with --check-only (no throughput measurement).
+
+Usage:
+    python -m benchmarks.bench_vader [--texts 20000] [--fuzz 50000] [--check-only]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from nltk.sentiment import SentimentIntensityAnalyzer
+
+from app.services.vader_engine import VaderEngine
+from benchmarks.bench_sentiment import make_texts
+
+
+CASES = (
+    "",
+    "a",
+    "The plan is good.",
+    "The plan is not good.",
+    "The plan isn't very good",
+    "The plan is VERY GOOD but the rollout was bad",
+    "The rollout was bad, but the plan is good!!!",
+    "Markets are kind of good",
+    "Markets are sort of terrible today",
+    "It was the least bad option",
+    "At the very least it is good",
+    "at least it worked",
+    "I have never been so happy",
+    "never this good never so bad",
+    "That launch was the bomb",
+    "yeah right, great job",
+    "This deal is the kiss of death",
+    "Living hand to mouth again",
+    "They could not cut the mustard",
+    "GREAT GREAT great win win WIN",
+    "good good good but but bad bad",
+    "Is this good??? Or bad?!?!",
+    "What?! No way!!!!!!",
+    ":) :( <3 :-D :/ ;)",
+    "'Good' \"bad\" (great) [terrible] good... bad,, -great- !love",
+    "Don't worry, be happy",
+    "Nobody without hope; nothing despite progress",
+    "uh-uh that is hardly a win",
+    "extremely, incredibly, barely good",
+    "SLIGHTLY bad but EXTREMELY good",
+    "The plan is not at all good",
+    "kind of",
+    "Surprisingly the ‘best’ outcome — a win",
+)
+
+FUZZ_FILLER = ("news", "report", "Government", "markets", "AI", "x", "don't", "isn't", "can't")
+FUZZ_PUNCTUATION = (".", "!", "?", ",", ";", ":", "-", "'", '"', "!!", "!!!", "??", "???",
+                    "?!?", "!?!", "(", ")", "...", "'s", "#", "@", "’")
+
+
+def fuzz_texts(analyzer, count, seed=11):
+    rng = random.Random(seed)
+    lexicon = sorted(analyzer.lexicon)
+    constants = analyzer.constants
+    rule_words = sorted(constants.NEGATE) + sorted(constants.BOOSTER_DICT) + sorted(
+        constants.SPECIAL_CASE_IDIOMS
+    ) + ["but", "BUT", "least", "at", "very", "never", "so", "this", "kind", "of", "Never"]
+
+    def word():
+        roll = rng.random()
+        if roll < 0.35:
+            token = rng.choice(lexicon)
+        elif roll < 0.7:
+            token = rng.choice(rule_words)
+        else:
+            token = rng.choice(FUZZ_FILLER)
+        if rng.random() < 0.15:
+            token = token.upper()
+        if rng.random() < 0.2:
+            token += rng.choice(FUZZ_PUNCTUATION)
+        if rng.random() < 0.1:
+            token = rng.choice(FUZZ_PUNCTUATION) + token
+        return token
+
+    return [" ".join(word() for _ in range(rng.randint(0, 25))) for _ in range(count)]
+
+
+def throughput(compound, texts):
+    start = time.perf_counter()
+    for text in texts:
+        compound(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--texts", type=int, default=20_000)
+    parser.add_argument("--fuzz", type=int, default=50_000)
+    parser.add_argument("--check-only", action="store_true", help="Run the differential check only.")
+    args = parser.parse_args()
+
+    analyzer = SentimentIntensityAnalyzer()
+    engine = VaderEngine.from_analyzer(analyzer)
+
+    def reference(text):
+        return analyzer.polarity_scores(text)['compound']
+
+    texts = make_texts(args.texts)
+
+    mismatches = []
+    corpus = list(CASES) + texts + fuzz_texts(analyzer, args.fuzz)
+    for text in corpus:
+        expected, actual = reference(text), engine.compound(text)
+        if expected != actual:
+            mismatches.append({'text': text, 'nltk': expected, 'fast': actual})
+
+    print(json.dumps({
+        'check': "differential",
+        'texts': len(corpus),
+        'mismatches': len(mismatches),
+        'examples': mismatches[:5]
+    }), flush=True)
+
+    if args.check_only:
+        sys.exit(1 if mismatches else 0)
+
+    nltk_rate = throughput(reference, texts)
+    fast_rate = throughput(engine.compound, texts)
+
+    print(json.dumps({
+        'texts': len(texts),
+        'nltk_texts_per_s': round(nltk_rate, 1),
+        'fast_texts_per_s': round(fast_rate, 1),
+        'speedup': round(fast_rate / nltk_rate, 2)
+    }), flush=True)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
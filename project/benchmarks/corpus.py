@@ -0,0 +1,158 @@
+"""
+corpus.py
+
+Synthetic article corpus for benchmarks.
+
+Articles are drawn from a fixed random vocabulary. A configurable share
+of them are syndicated copies of an earlier story: same description with
+a word or two changed and a lightly edited headline, mimicking wire
+stories republished by several outlets.
+
+The same articles can be shaped as raw provider responses (for the local
+provider stand-ins) or as pre-scored Article rows (for bulk-loading large
+tables without running the sentiment model).
+"""
+
+import random
+from datetime import datetime
+
+from app.models.article import Article
+
+
+WORDS = 5_000
+TITLE_WORDS = 8
+DESCRIPTION_WORDS = 25
+
+
+def _vocabulary(rng):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return [
+        "".join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+        for _ in range(WORDS)
+    ]
+
+
+def _perturb(words, rng, edits):
+    words = list(words)
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(words)
+    return words
+
+
+def generate(count, duplicate_rate=0.2, sources=25, topics=("ai", "elections", "climate"), seed=7):
+    """
+    Yield synthetic articles in the normalized NewsService shape.
+
+    Args:
+        count (int): Number of articles.
+        duplicate_rate (float): Share of articles that copy an earlier story.
+        sources (int): Number of distinct source names.
+        topics (tuple[str]): Topics assigned round-robin by story.
+        seed (int): RNG seed; equal seeds give identical corpora.
+
+    Yields:
+        dict: title, description, source, topic, published_at, plus
+        story (ground-truth index of the original article).
+    """
+
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    originals = []
+
+    for n in range(count):
+        if originals and rng.random() < duplicate_rate:
+            story, title, description = rng.choice(originals)
+            title = _perturb(title, rng, 1)
+            description = _perturb(description, rng, 1)
+        else:
+            story = n
+            title = rng.sample(vocabulary, TITLE_WORDS)
+            description = rng.sample(vocabulary, DESCRIPTION_WORDS)
+            # Keep a bounded pool of recent originals to copy from
+            if len(originals) < 10_000:
+                originals.append((story, title, description))
+            else:
+                originals[rng.randrange(len(originals))] = (story, title, description)
+
+        yield {
+            'title': " ".join(title).capitalize() + f" {n}",
+            'description': " ".join(description) + ".",
+            'source': f"Source {rng.randrange(sources)}",
+            'topic': topics[story % len(topics)],
+            'published_at': f"2026-{1 + story % 12:02d}-{1 + story % 28:02d}T{n % 24:02d}:00:00Z",
+            'story': story
+        }
+
+
+def provider_article(item, provider):
+    """
+    Shape a corpus article like a raw NewsAPI or GNews response entry.
+
+    Args:
+        item (dict): Article from generate().
+        provider (str): "newsapi" or "gnews".
+
+    Returns:
+        dict: Article object as the provider's search endpoint returns it.
+    """
+
+    slug = item['title'].lower().replace(" ", "-")
+    article = {
+        'title': item['title'],
+        'description': item['description'],
+        'url': f"https://{provider}.example/{slug}",
+        'publishedAt': item['published_at']
+    }
+
+    if provider == "newsapi":
+        article.update({
+            'source': {'id': None, 'name': item['source']},
+            'author': None,
+            'urlToImage': None,
+            'content': item['description']
+        })
+    else:
+        article.update({
+            'source': {'name': item['source'], 'url': "https://source.example"},
+            'image': None,
+            'content': item['description']
+        })
+
+    return article
+
+
+def article_rows(count, duplicate_rate=0.2, sources=25, topics=("ai", "elections", "climate"), seed=7):
+    """
+    Yield pre-scored Article column values for bulk inserts.
+
+    Sentiment scores are drawn from a per-source distribution and rounded
+    to two decimals like SentimentService output, so large tables can be
+    built without running VADER.
+
+    Args:
+        count, duplicate_rate, sources, topics, seed: As for generate().
+
+    Yields:
+        dict: Article column values (no id, story_id or minhash).
+    """
+
+    rng = random.Random(seed + 1)
+    source_mean = [rng.uniform(-0.4, 0.4) for _ in range(sources)]
+
+    for item in generate(count, duplicate_rate, sources, topics, seed):
+        source = int(item['source'].rsplit(" ", 1)[1])
+        score = round(max(-1.0, min(1.0, rng.gauss(source_mean[source], 0.35))), 2)
+        label = "Positive" if score > 0.1 else "Negative" if score < -0.1 else "Neutral"
+        published = datetime.fromisoformat(item['published_at'].replace("Z", ""))
+
+        yield {
+            'title': item['title'],
+            'title_hash': Article.hash_title(item['title']),
+            'description': item['description'],
+            'source': item['source'],
+            'topic': item['topic'],
+            'sentiment_score': score,
+            'sentiment_label': label,
+            'published_at': published,
+            'created_at': published
+        }
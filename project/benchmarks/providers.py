@@ -0,0 +1,185 @@
+"""
+providers.py
+
+Local stand-ins for the NewsAPI and GNews search endpoints.
+
+Each stub is a threaded HTTP server that answers search requests with
+the provider's response shape, filled from the synthetic corpus. Pages
+are deterministic per (query, page), so repeated runs fetch the same
+articles, and simulated latency, jitter and error rate let benchmarks
+exercise timeouts, retries and concurrency without network access or
+API quotas.
+
+Point the application at the stubs with NEWSAPI_URL / GNEWS_URL. To run
+them standalone for manual testing:
+
+    python -m benchmarks.providers [--latency 0.2] [--total 1000]
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks import corpus
+
+
+# Request parameter carrying the page size, per provider
+PAGE_SIZE_PARAM = {'newsapi': "pageSize", 'gnews': "max"}
+
+# Route each stub serves, mirroring the real endpoint paths
+PATHS = {'newsapi': "/v2/everything", 'gnews': "/api/v4/search"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server.stub
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        time.sleep(stub.delay())
+
+        with stub.lock:
+            stub.requests += 1
+
+        if url.path != PATHS[stub.provider]:
+            return self._send(404, {'status': "error", 'message': "not found"})
+        if stub.should_fail():
+            return self._send(503, {'status': "error", 'message': "simulated outage"})
+
+        page = max(int(query.get("page", 1)), 1)
+        size = max(int(query.get(PAGE_SIZE_PARAM[stub.provider], 10)), 1)
+
+        articles = stub.page(query.get("q", ""), page, size)
+
+        if stub.provider == "newsapi":
+            body = {'status': "ok", 'totalResults': stub.total, 'articles': articles}
+        else:
+            body = {'totalArticles': stub.total, 'articles': articles}
+
+        self._send(200, body)
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class ProviderStub:
+    """
+    ProviderStub
+
+    A local NewsAPI- or GNews-compatible search server.
+
+    Args:
+        provider (str): "newsapi" or "gnews".
+        latency (float): Mean response delay in seconds.
+        jitter (float): Uniform +/- variation applied to the delay.
+        error_rate (float): Share of requests answered with HTTP 503.
+        total (int): Results available per query; pages past it are empty.
+        seed (int): Seed for corpus content, latency and errors.
+
+    Usage:
+        with ProviderStub("newsapi", latency=0.1) as stub:
+            app.config['NEWSAPI_URL'] = stub.url
+    """
+
+    def __init__(self, provider, latency=0.0, jitter=0.0, error_rate=0.0, total=1000, seed=7):
+        self.provider = provider
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.total = total
+        self.seed = seed
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._server = None
+
+    def delay(self):
+        with self.lock:
+            return max(self.latency + self._rng.uniform(-self.jitter, self.jitter), 0.0)
+
+    def should_fail(self):
+        with self.lock:
+            return self._rng.random() < self.error_rate
+
+    def page(self, query, page, size):
+        """
+        Build one page of results for a query.
+
+        Content depends only on (provider, query, page, size), so results
+        are stable across runs and distinct between providers and pages.
+        """
+
+        start = (page - 1) * size
+        count = max(min(size, self.total - start), 0)
+        seed = zlib.crc32(f"{self.seed}:{self.provider}:{query}:{page}:{size}".encode())
+
+        return [
+            corpus.provider_article(item, self.provider)
+            for item in corpus.generate(count, duplicate_rate=0.0, topics=(query or "news",), seed=seed)
+        ]
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{PATHS[self.provider]}"
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--total", type=int, default=1000)
+    args = parser.parse_args()
+
+    stubs = [
+        ProviderStub(provider, args.latency, args.jitter, args.error_rate, args.total).start()
+        for provider in ("newsapi", "gnews")
+    ]
+    for stub in stubs:
+        print(f"{stub.provider.upper()}_URL={stub.url}", flush=True)
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for stub in stubs:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+run.py
+
+Runs the benchmark suite and writes one machine-readable JSON report.
+
+Each benchmark runs in its own interpreter (so import caches, module
+state and memory do not leak between them) and prints one JSON object
+per result line; the runner collects those lines under the benchmark's
+name together with run metadata (git revision, Python version, platform,
+CPU count). Reports from two versions can be compared with --compare,
+which flags metrics that got worse by more than --threshold. The runner
+exits with status 1 when any benchmark fails, including correctness
+checks such as the VaderEngine differential check.
+
+Usage:
+    python -m benchmarks.run [--quick] [--only http sentiment] [--output report.json]
+    python -m benchmarks.run --compare baseline.json current.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Benchmark module -> (full arguments, --quick arguments)
+SUITE = {
+    'startup': ("bench_startup", [], ["--runs", "3"]),
+    'sentiment': ("bench_sentiment", [], ["--texts", "2000"]),
+    'vader': ("bench_vader", [], ["--texts", "2000", "--fuzz", "5000"]),
+    'ingest': ("bench_ingest", [], ["--sizes", "1000", "10000", "--batches", "5"]),
+    'pipeline': ("bench_pipeline", [], ["--topics", "5", "--deep-total", "500"]),
+    'http': ("bench_http", [], ["--sizes", "10000", "--requests", "10"]),
+    'db_concurrency': ("bench_db_concurrency", [], ["--rows", "5000", "--duration", "5"]),
+    'bias': ("bench_bias", [], ["--rows", "100000", "--repeat", "1"]),
+    'dedup': ("bench_dedup", [], ["--articles", "20000"]),
+    'export': ("bench_export", [], ["--rows", "50000"]),
+    'retention': ("bench_retention", [], ["--rows", "30000", "--repeat", "1"]),
+    'live': ("bench_live", [], ["--rows", "20000", "--clients", "50", "--ingests", "3"]),
+    'search': ("bench_search", [], ["--rows", "50000", "--batch", "5000"]),
+    'response_cache': ("bench_response_cache", [], ["--repeat", "5"])
+}
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(module, arguments):
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-m", f"benchmarks.{module}", *arguments],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    results = []
+    for line in completed.stdout.splitlines():
+        line = line.strip()
+        if line.startswith("{"):
+            results.append(json.loads(line))
+
+    entry = {'arguments': arguments, 'elapsed_s': round(elapsed, 1), 'results': results}
+    if completed.returncode != 0:
+        entry['error'] = completed.stderr.strip().splitlines()[-1:] or ["exit status " + str(completed.returncode)]
+
+    return entry
+
+
+def lower_is_better(metric):
+    if metric.endswith("_per_s") or metric in ("speedup", "cluster_accuracy", "duplicate_recall"):
+        return False
+    if metric.endswith(("_ms", "_s", "_us_mean")):
+        return True
+    return None
+
+
+def compare(baseline, current, threshold):
+    """
+    List metrics that regressed between two reports.
+
+    Result lines are matched by position within each benchmark; only
+    metrics with a known direction (latency, throughput) are compared.
+    """
+
+    regressions = []
+
+    for name, entry in current['benchmarks'].items():
+        before = baseline['benchmarks'].get(name)
+        if before is None:
+            continue
+
+        for index, (old, new) in enumerate(zip(before['results'], entry['results'])):
+            for metric, value in new.items():
+                direction = lower_is_better(metric)
+                previous = old.get(metric)
+                if direction is None or not isinstance(value, (int, float)) or not previous:
+                    continue
+
+                ratio = value / previous if direction else previous / value if value else float("inf")
+                if ratio > 1 + threshold:
+                    regressions.append({
+                        'benchmark': name,
+                        'line': index,
+                        'metric': metric,
+                        'baseline': previous,
+                        'current': value,
+                        'worse_by': f"{100 * (ratio - 1):.0f}%"
+                    })
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes for a fast smoke run.")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITE), help="Benchmarks to run.")
+    parser.add_argument("--output", help="Write the report here instead of stdout.")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="Compare two reports instead of running benchmarks.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative change counted as a regression (default 0.2).")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as baseline, open(args.compare[1]) as current:
+            regressions = compare(json.load(baseline), json.load(current), args.threshold)
+        print(json.dumps({'regressions': regressions}, indent=2))
+        sys.exit(1 if regressions else 0)
+
+    report = {
+        'revision': git_revision(),
+        'started_at': datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'quick': args.quick,
+        'benchmarks': {}
+    }
+
+    for name in args.only or SUITE:
+        module, full, quick = SUITE[name]
+        print(f"running {name}...", file=sys.stderr, flush=True)
+        report['benchmarks'][name] = run_benchmark(module, quick if args.quick else full)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+
+    # A failed benchmark (e.g. a bench_vader mismatch) fails the run
+    if any('error' in entry for entry in report['benchmarks'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()